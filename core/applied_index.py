@@ -0,0 +1,53 @@
+import logging
+
+logger = logging.getLogger("HH_Automation_bot")
+
+# Причины пропуска карточки до скролла и клика
+SKIP_REASONS = {
+    "index": "уже в базе",
+    "responded": "hh: уже откликались",
+    "no_button": "нет кнопки отклика",
+    "no_id": "нет id",
+}
+
+
+class AppliedIndex:
+    """
+    id вакансий, на которые профиль уже откликался (из таблицы applications).
+    Загружается один раз на запуск, карточки отсеиваются до любых действий на странице.
+    """
+
+    def __init__(self, db, profile):
+        self.db = db
+        self.profile = profile
+        self.ids = db.get_applied_ids(profile)
+        self.skipped = {}
+        self.seen = 0
+
+    def __contains__(self, vacancy_id):
+        return vacancy_id in self.ids
+
+    def add(self, vacancy_id):
+        if vacancy_id: self.ids.add(vacancy_id)
+
+    def skip_reason(self, card, require_id=False):
+        """Причина пропуска карточки или None, если ее надо обрабатывать."""
+        self.seen += 1
+        reason = None
+        if card.get("id") and card["id"] in self.ids:
+            reason = "index"
+        elif card.get("responded"):
+            reason = "responded"
+        elif not card.get("has_apply"):
+            reason = "no_button"
+        elif require_id and not card.get("id"):
+            reason = "no_id"
+        if reason: self.skipped[reason] = self.skipped.get(reason, 0) + 1
+        return reason
+
+    def summary(self):
+        if not self.seen: return None
+        total = sum(self.skipped.values())
+        parts = [f"{SKIP_REASONS.get(k, k)}: {v}" for k, v in self.skipped.items()]
+        return (f"Карточек: {self.seen}, пропущено без скролла: {total}"
+                + (f" ({', '.join(parts)})" if parts else "") + f". В индексе профиля: {len(self.ids)}")
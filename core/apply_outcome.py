@@ -0,0 +1,115 @@
+import asyncio
+import time
+import logging
+
+logger = logging.getLogger("HH_Automation_bot")
+
+# Возможные исходы клика по «Откликнуться»
+MODAL = "modal"                 # Открылось окно отклика
+NAVIGATION = "navigation"       # Ушли на страницу теста/анкеты
+CHAT = "chat"                   # Всплыл чат и перекрыл страницу
+ALREADY = "already_responded"   # Отклик уже есть
+ERROR = "error_toast"           # hh показал ошибку (лимит, капча и т.п.)
+NONE = "none"                   # Ничего не произошло за бюджет ожидания
+
+# Кто раньше в списке - тот и выигрывает при одновременном срабатывании
+OUTCOME_ORDER = (MODAL, ALREADY, ERROR, NAVIGATION, CHAT)
+
+
+def _strip_fragment(url):
+    return (url or "").split("#", 1)[0]
+
+
+class OutcomeDetector:
+    """
+    Ждет все исходы клика сразу и возвращает первый сработавший,
+    вместо цепочки «3 сек на модалку -> закрыть чат -> проверить URL».
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.stats = {}  # исход -> [кол-во, суммарная задержка сек]
+
+    def _selectors(self):
+        loc = self.engine.locators
+        outcome = loc.get("apply_outcome", {})
+        return {
+            MODAL: loc["response_modal"]["dialog"],
+            CHAT: loc["activity"]["chat_close_btn"],
+            ALREADY: outcome.get("already_responded", loc["search_page"]["already_applied"]),
+            ERROR: outcome.get("error_toast", "[data-qa='bloko-notification']"),
+        }
+
+    async def _watch(self, outcome, make_awaitable):
+        try:
+            await make_awaitable()
+            return outcome
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if "Target closed" in str(e) or "browser has been closed" in str(e): raise e
+            return None
+
+    def _watchers(self, page, start_url, timeout_ms, scope):
+        selectors = self._selectors()
+        watchers = {
+            MODAL: lambda: page.wait_for_selector(selectors[MODAL], state="visible", timeout=timeout_ms),
+            CHAT: lambda: page.wait_for_selector(selectors[CHAT], state="visible", timeout=timeout_ms),
+            ERROR: lambda: page.wait_for_selector(selectors[ERROR], state="visible", timeout=timeout_ms),
+            NAVIGATION: lambda: page.wait_for_url(lambda url: _strip_fragment(url) != start_url,
+                                                  wait_until="commit", timeout=timeout_ms),
+        }
+        # «Уже откликались» ищем в карточке, если она есть, иначе на странице
+        if scope is not None:
+            watchers[ALREADY] = lambda: scope.locator(selectors[ALREADY]).first.wait_for(state="visible",
+                                                                                       timeout=timeout_ms)
+        else:
+            watchers[ALREADY] = lambda: page.wait_for_selector(selectors[ALREADY], state="visible",
+                                                               timeout=timeout_ms)
+        return watchers
+
+    async def click_and_detect(self, button, scope=None, force=False):
+        """Кликает по кнопке и возвращает (исход, задержка сек)."""
+        engine = self.engine
+        engine.check_running()
+        page = engine.page
+        start_url = _strip_fragment(page.url)
+        timeout_ms = engine.waits.budget_ms("apply_outcome")
+        # Движение мыши - до запуска наблюдателей, чтобы не съедать их бюджет
+        position = await engine.approach(button)
+        watchers = self._watchers(page, start_url, timeout_ms, scope)
+
+        # Наблюдатели стартуют до клика, чтобы не пропустить быстрый исход
+        tasks = {asyncio.create_task(self._watch(name, fn)): name for name, fn in watchers.items()}
+        started = time.monotonic()
+        outcome = NONE
+        with engine.tracer.span("apply_click") as sp:
+            try:
+                await asyncio.sleep(0)
+                await button.click(force=force, position=position)
+                pending = set(tasks)
+                while pending:
+                    done, pending = await asyncio.wait(pending, timeout=timeout_ms / 1000,
+                                                       return_when=asyncio.FIRST_COMPLETED)
+                    if not done: break
+                    hits = [t.result() for t in done if t.result()]
+                    if hits:
+                        outcome = min(hits, key=OUTCOME_ORDER.index)
+                        break
+            finally:
+                for task in tasks:
+                    if not task.done(): task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            sp.outcome = outcome
+
+        latency = time.monotonic() - started
+        if outcome != NONE: engine.waits.book.record("apply_outcome", latency)
+        entry = self.stats.setdefault(outcome, [0, 0.0])
+        entry[0] += 1
+        entry[1] += latency
+        return outcome, latency
+
+    def summary(self):
+        if not self.stats: return None
+        parts = [f"{name}: {cnt} шт, {total / cnt:.2f} сек" for name, (cnt, total) in self.stats.items()]
+        return "Исходы клика «Откликнуться»: " + ", ".join(parts)
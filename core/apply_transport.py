@@ -0,0 +1,187 @@
+import json
+import time
+import logging
+from abc import ABC, abstractmethod
+from html.parser import HTMLParser
+
+from core.config import HH_BASE_URL
+
+logger = logging.getLogger("HH_Automation_bot")
+
+
+def render_letter(template, card, profile_name):
+    """Подстановка {company}, {vacancy}, {name} в сопроводительное письмо."""
+    return template.replace("{company}", card['company']).replace("{vacancy}", card['title']).replace(
+        "{name}", profile_name)
+
+
+class ApplyTransport(ABC):
+    """
+    Способ отправить отклик. apply() возвращает True, если отклик ушел.
+    open_button - корутина, которая подводит к кнопке «Откликнуться» и возвращает ее локатор.
+    """
+    name = "base"
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.stats = {}  # транспорт -> [кол-во, суммарная задержка сек]
+
+    @abstractmethod
+    async def apply(self, card, data, open_button, back_to_serp=True):
+        ...
+
+    def _record(self, card, started):
+        latency = time.monotonic() - started
+        inserted = self.engine.db.add_application(card["title"], card["company"], card["url"],
+                                                  self.engine.profile_name, transport=self.name,
+                                                  latency_ms=latency * 1000, vacancy_id=card.get("id"))
+        if self.engine.applied is not None: self.engine.applied.add(card.get("id"))
+        # Повтор уже записанной вакансии (уникальный индекс) - ни квоты, ни статистики
+        if not inserted: return
+        if self.engine.quota is not None: self.engine.quota.spend()
+        entry = self.stats.setdefault(self.name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += latency
+
+    def summary(self):
+        if not self.stats: return None
+        parts = [f"{name}: {cnt} шт, {total / cnt:.2f} сек" for name, (cnt, total) in self.stats.items()]
+        return "Отклики по транспортам: " + ", ".join(parts)
+
+
+class ModalApplyTransport(ApplyTransport):
+    """Обычный путь: модалка, выбор резюме, письмо, кнопка отправки."""
+    name = "modal"
+
+    async def apply(self, card, data, open_button, back_to_serp=True):
+        apply_btn = await open_button()
+        if apply_btn is None: return False
+        started = time.monotonic()
+        if await self.engine._apply_via_button(apply_btn, card, data, back_to_serp=back_to_serp):
+            self._record(card, started)
+            return True
+        return False
+
+
+class ResumeLinkParser(HTMLParser):
+    """Ссылки вида /resume/<hash> со страницы «Мои резюме» и их заголовки."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.resumes = []  # (hash, заголовок)
+        self._hash = None
+        self._text = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag != "a": return
+        href = dict(attrs).get("href") or ""
+        if href.startswith("/resume/") or "/resume/" in href:
+            resume_hash = href.split("/resume/", 1)[1].split("?", 1)[0].strip("/")
+            if resume_hash:
+                self._hash = resume_hash
+                self._text = []
+
+    def handle_endtag(self, tag):
+        if tag == "a" and self._hash:
+            title = " ".join("".join(self._text).split())
+            if title: self.resumes.append((self._hash, title))
+            self._hash = None
+
+    def handle_data(self, data):
+        if self._hash: self._text.append(data)
+
+
+class HttpApplyTransport(ApplyTransport):
+    """
+    Быстрый путь: отклик прямым запросом из авторизованного контекста, без модалки.
+    Если вакансия требует тест/анкету или запрос не прошел - отдает вакансию запасному транспорту.
+    """
+    name = "http"
+    ENDPOINT = "/applicant/vacancy_response/popup"
+    # Ошибки, после которых прямые отклики в этом запуске бессмысленны
+    FATAL_ERRORS = ("negotiations-limit-exceeded", "unauthorized", "no-resume")
+    SKIP_ERRORS = ("already-applied",)
+
+    def __init__(self, engine, fallback):
+        super().__init__(engine)
+        self.fallback = fallback
+        self.fallback.stats = self.stats  # Общая статистика по обоим путям
+        self.disabled = False
+        self._resumes = None
+
+    async def apply(self, card, data, open_button, back_to_serp=True):
+        if not self.disabled and card.get("id"):
+            started = time.monotonic()
+            result = await self._submit(card, data)
+            if result == "ok":
+                self._record(card, started)
+                return True
+            if result in self.SKIP_ERRORS:
+                self.engine.log("Уже откликались (HTTP). Пропуск.")
+                return False
+            if result in self.FATAL_ERRORS:
+                self.disabled = True
+                self.engine.log(f"Прямые отклики отключены до конца запуска: {result}", "warning")
+            else:
+                self.engine.log(f"Прямой отклик недоступен ({result}), открываю модалку.")
+        return await self.fallback.apply(card, data, open_button, back_to_serp)
+
+    async def _load_resumes(self):
+        if self._resumes is None:
+            response = await self.engine.context.request.get(f"{HH_BASE_URL}/applicant/resumes")
+            parser = ResumeLinkParser()
+            if response.ok:
+                parser.feed(await response.text())
+            self._resumes = parser.resumes
+        return self._resumes
+
+    async def _resume_hash(self, data):
+        resumes = await self._load_resumes()
+        if not resumes: return None
+        target = data.get("resume_name", "").strip().lower()
+        if not target: return resumes[0][0]
+        for resume_hash, title in resumes:
+            if target in title.lower(): return resume_hash
+        return None
+
+    async def _xsrf(self):
+        for cookie in await self.engine.context.cookies(HH_BASE_URL):
+            if cookie["name"] == "_xsrf": return cookie["value"]
+        return ""
+
+    async def _submit(self, card, data):
+        try:
+            resume_hash = await self._resume_hash(data)
+            if not resume_hash: return "no-resume"
+            xsrf = await self._xsrf()
+
+            form = {
+                "vacancy_id": card["id"],
+                "resume_hash": resume_hash,
+                "letter": render_letter(data.get("cover_letter", ""), card, self.engine.profile_name),
+                "lux": "true",
+                "ignore_postponed": "true",
+                "_xsrf": xsrf,
+            }
+            response = await self.engine.context.request.post(
+                f"{HH_BASE_URL}{self.ENDPOINT}", form=form,
+                headers={"X-Xsrftoken": xsrf, "X-Requested-With": "XMLHttpRequest",
+                         "Referer": card.get("url") or HH_BASE_URL})
+            try:
+                payload = json.loads(await response.text())
+            except ValueError:
+                payload = {}
+            if response.status in (401, 403): return "unauthorized"
+            error = payload.get("error") if isinstance(payload, dict) else None
+            if response.ok and not error: return "ok"
+            return error or f"http-{response.status}"
+        except Exception as e:
+            if "Target closed" in str(e) or "browser has been closed" in str(e): raise e
+            return f"exception: {e}"
+
+
+def create_transport(engine):
+    modal = ModalApplyTransport(engine)
+    if engine.settings_mgr.get("apply_transport") == "http":
+        return HttpApplyTransport(engine, modal)
+    return modal
@@ -1,32 +1,57 @@
-from playwright.sync_api import sync_playwright
-import time
 import random
 import logging
 import json
 import os
-from urllib.parse import urlencode
 
 from database.db_manager import DBManager
 from core.settings_manager import SettingsManager
 from core.humanizer import HumanLike
 from core.config import HEADLESS_MODE
 from core.utils import get_user_data_path, get_resource_path
+from core.runtime import get_runtime
+from core.cancellation import CancelToken
+from core.network_filter import ResourceBlocker
+from core.serp_extractor import extract_cards
+from core.serp_harvester import SerpHarvester
+from core.serp_cache import SerpCache
+from core.serp_prefetch import SerpPrefetcher
+from core.waits import Waiter, LatencyBook
+from core.apply_outcome import OutcomeDetector, MODAL, NAVIGATION, CHAT, ALREADY, ERROR
+from core.search_query import build_search_params, build_search_url
+from core.config import HH_BASE_URL
+from core.apply_transport import create_transport, render_letter
+from core.applied_index import AppliedIndex
+from core.quota import QuotaLedger
+from core.resume_picker import ResumePicker
+from core.tracing import Tracer, create_sink
 
 logger = logging.getLogger("HH_Automation_bot")
 
 
 class BrowserEngine:
     def __init__(self, profile_name=None):
-        self.playwright = None
-        self.browser = None
+        self.pool = None
+        self.lease = None
+        self.blocker = None
         self.context = None
         self.page = None
         self.human = None
-        self.should_run = True
+        self.transport = None
+        self.applied = None
+        self.quota = None
+        self.progress = None  # progress(done, total) - для кнопки в GUI и канала процесса
+        # Общий токен остановки: его же используют HumanLike, ожидания и воркер
+        self.token = CancelToken()
 
         self.settings_mgr = SettingsManager()
         self.profile_name = profile_name if profile_name else self.settings_mgr.get("current_profile")
         self.db = DBManager()
+        # Ожидания по событиям с адаптивными таймаутами (core/waits.py)
+        self.waits = Waiter(self, LatencyBook(self.db))
+        self.outcomes = OutcomeDetector(self)
+        self.resume_picker = ResumePicker(self)
+        # Спаны шагов для отчета «где тратится время» (tools/trace_report.py)
+        self.tracer = Tracer(self.profile_name, create_sink(self.settings_mgr.get("trace_sink"), self.db))
 
         try:
             # Локаторы вшиты в EXE, берем через get_resource_path
@@ -44,60 +69,55 @@ class BrowserEngine:
         elif level == "error":
             logger.error(msg)
 
+    def report_progress(self, done, total):
+        if self.progress is None: return
+        try:
+            self.progress(done, total)
+        except:
+            pass
+
+    @property
+    def should_run(self):
+        return not self.token.cancelled
+
     def stop_execution(self):
-        self.should_run = False
-        # Не закрываем контекст здесь, чтобы избежать greenlet error.
-        # Поток остановится при проверке check_running.
+        # Можно звать из GUI-потока: токен сам отменит задачу профиля в цикле движка
+        self.token.cancel()
 
     def check_running(self):
-        if not self.should_run:
-            raise InterruptedError("Stopped by button")
-
-    def smart_sleep(self, seconds):
-        """
-        Умный сон с проверкой флага остановки.
-        Поддерживает микро-задержки меньше 0.1 сек.
-        """
-        end_time = time.time() + seconds
-        while True:
-            self.check_running()
-            remaining = end_time - time.time()
+        self.token.check()
 
-            if remaining <= 0:
-                break
+    async def smart_sleep(self, seconds):
+        """Сон, который прерывается остановкой сразу, без опроса флага."""
+        await self.token.sleep(seconds)
+
+    def _human_mouse(self):
+        return self.human and self.settings_mgr.get("use_human_moves") and self.settings_mgr.get("human_mouse")
+
+    async def click(self, locator, force=False):
+        """Клик с движением курсора по кривой, если включены человеческие движения мыши."""
+        if self._human_mouse():
+            await self.human.human_click(locator, force=force)
+        else:
+            await locator.click(force=force)
 
-            # Спим либо 0.1 сек (для проверки стопа), либо остаток времени, если он меньше
-            time.sleep(min(0.1, remaining))
+    async def approach(self, locator):
+        """Подвести курсор к элементу заранее. Возвращает position для click() или None."""
+        if not self._human_mouse(): return None
+        try:
+            return await self.human.approach(locator)
+        except Exception as e:
+            if self.token.cancelled or "Target closed" in str(e) or "browser has been closed" in str(e): raise e
+            return None
 
-    def start_browser(self):
+    async def start_browser(self):
         self.log("Запуск браузера...")
-        self.playwright = sync_playwright().start()
+        # Браузер общий (core/browser_pool.py): профилю выдается изолированный контекст
+        self.pool = get_runtime().get_pool()
 
         # Получаем настройку
         is_headless = self.settings_mgr.get("headless_mode")
 
-        args = [
-            "--disable-blink-features=AutomationControlled",
-            "--no-sandbox",
-            "--disable-infobars",
-            # "--start-maximized", <--- ЭТО ТЕПЕРЬ ЗАВИСИТ ОТ РЕЖИМА
-            "--disable-dev-shm-usage",
-            "--no-first-run",
-            "--no-zygote",
-            "--hide-scrollbars",
-            "--mute-audio",
-        ]
-
-
-
-        self.browser = self.playwright.chromium.launch(
-            headless=is_headless,
-            args=args,
-            channel="chrome",
-            ignore_default_args=["--enable-automation"]
-        )
-        profile_name = self.settings_mgr.get("current_profile")
-
         # Профили лежат в AppData/profiles
         profiles_dir = get_user_data_path("profiles")
         if not os.path.exists(profiles_dir): os.makedirs(profiles_dir)
@@ -129,137 +149,218 @@ class BrowserEngine:
         else:
             self.log(f"Файл куки не найден: {state_path}", "warning")
 
-        self.context = self.browser.new_context(**context_options)
-        self.page = self.context.new_page()
+        self.lease = await self.pool.acquire(is_headless, context_options)
+        self.context = self.lease.context
+        self._record_launch(self.lease)
+
+        # Картинки, шрифты и аналитика автоматизации не нужны
+        self.blocker = ResourceBlocker(self.settings_mgr)
+        await self.blocker.install(self.context)
+        self.page = await self.context.new_page()
 
         if self.settings_mgr.get("use_stealth") is not False:
-            self._enable_stealth(self.page)
+            await self._enable_stealth(self.page)
 
         self.human = HumanLike(self.page, self)
 
-    def _enable_stealth(self, page):
-        page.add_init_script(
+    def _record_launch(self, lease):
+        kind = "warm" if lease.warm else "cold"
+        self.db.add_launch_metric(self.profile_name, kind, lease.seconds)
+        stats = self.db.get_launch_stats()
+        summary = ", ".join(f"{k}: {avg:.2f} сек ({cnt})" for k, (avg, cnt) in sorted(stats.items()))
+        self.log(f"Контекст готов за {lease.seconds:.2f} сек ({kind}). Среднее: {summary}")
+
+    async def _enable_stealth(self, page):
+        await page.add_init_script(
             "if (Object.getPrototypeOf(navigator).hasOwnProperty('webdriver')) { delete Object.getPrototypeOf(navigator).webdriver; }")
-        page.add_init_script("window.chrome = { runtime: {} };")
-        page.add_init_script("Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3] });")
+        await page.add_init_script("window.chrome = { runtime: {} };")
+        await page.add_init_script("Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3] });")
 
-    def run_search(self, data):
+    async def run_search(self, data):
         if not self.page: return
-        base_url = "https://hh.ru/search/vacancy"
-        query_params = []
-
-        query_params.append(("text", data.get('text', '')))
-        excl = data.get('excluded_text', '')
-        if excl: query_params.append(("excluded_text", excl))
-        if data.get('salary'):
-            query_params.append(("salary", data.get('salary')))
-            query_params.append(("only_with_salary", "true"))
-
-        area_map = {"Москва": "1", "Санкт-Петербург": "2", "Все регионы": "113"}
-        query_params.append(("area", area_map.get(data.get('area'), "113")))
-        query_params.append(("items_on_page", "100"))
-
-        for key in ['work_format', 'employment_form', 'experience', 'education', 'label']:
-            for val in data.get(key, []): query_params.append((key, val))
-
-        full_url = f"{base_url}?{urlencode(query_params)}"
+        query_params = build_search_params(data)
+        full_url = build_search_url(query_params)
         self.log(f"Поиск: {full_url}")
+        self.transport = create_transport(self)
+        # Вакансии, на которые профиль уже откликался в прошлых запусках
+        self.applied = AppliedIndex(self.db, self.profile_name)
+        # Суточная квота аккаунта: запуск укорачивается до остатка, темп задает токен-бакет
+        self.quota = QuotaLedger.from_settings(self.db, self.profile_name, self.settings_mgr)
+        remaining = self.quota.remaining_today()
+        self.log(f"Квота на сегодня: осталось {remaining} из {self.quota.daily_limit}")
+        if remaining <= 0:
+            self.log("Суточная квота откликов исчерпана, поиск не запускаю.", "warning")
+            return
 
         try:
-            self.page.goto(full_url)
-            self.page.wait_for_load_state("domcontentloaded")
-            self.smart_sleep(3)
-            self.process_vacancies_loop(data)
+            if self.settings_mgr.get("serp_mode") == "harvest":
+                # Выдача собирается HTTP-запросами, браузер только откликается
+                await self.process_harvested_loop(data, query_params)
+                return
+            with self.tracer.span("serp_load"):
+                await self.page.goto(full_url, wait_until="domcontentloaded")
+                await self.wait_serp_ready()
+            await self.process_vacancies_loop(data)
         except Exception as e:
             # Пробрасываем закрытие наверх
             if isinstance(e, InterruptedError): raise e
             if "Target closed" in str(e) or "browser has been closed" in str(e): raise e
             self.log(f"Ошибка поиска: {e}", "error")
-
-    def _try_close_chat(self):
+        finally:
+            for report in (self.applied.summary(), self.transport.summary(), self.outcomes.summary(),
+                           self.resume_picker.summary(), self.quota.summary()):
+                if report: self.log(report)
+
+    async def wait_serp_ready(self):
+        """Выдача готова, когда появились карточки (или стало ясно, что их нет)."""
+        sp = self.locators["search_page"]
+        await self.waits.selector("serp_ready", f"{sp['vacancy_card']}, {sp['pager_next']}")
+        await self.waits.read_page()
+
+    async def _try_close_chat(self):
         try:
             close_btn = self.page.locator(self.locators["activity"]["chat_close_btn"])
-            if close_btn.is_visible():
+            if await close_btn.is_visible():
                 self.log("Закрываю всплывший чат...")
-                close_btn.click(force=True)
-                self.smart_sleep(1)
+                await close_btn.click(force=True)
+                await self.waits.locator("chat_closed", close_btn, state="hidden")
                 return True
         except:
             pass
         return False
 
-    def process_vacancies_loop(self, data):
-        limit = self.settings_mgr.get("limit_applications") or 50
+    async def _apply_via_button(self, apply_btn, card, data, back_to_serp=True):
+        """Клик по «Откликнуться» и обработка результата. True - отклик отправлен."""
+        title, company = card["title"], card["company"]
+
+        # «Уже откликались» ищем внутри своей карточки, иначе сработает на соседних
+        scope = None
+        if back_to_serp and card.get("index") is not None:
+            scope = self.page.locator(self.locators["search_page"]["vacancy_card"]).nth(card["index"])
+
+        await self._try_close_chat()
+        await self.waits.pace("before_click")
+        outcome, latency = await self.outcomes.click_and_detect(apply_btn, scope)
+        if outcome == CHAT and await self._try_close_chat():
+            # Чат перекрыл кнопку - закрываем и пробуем еще раз
+            outcome, latency = await self.outcomes.click_and_detect(apply_btn, scope, force=True)
+
+        if outcome == MODAL:
+            info = {"title": title, "company": company}
+            with self.tracer.span("modal") as sp:
+                sent = await self.handle_response_modal(data, info)
+                sp.outcome = "sent" if sent else "failed"
+            if sent:
+                await self.waits.pace("after_submit")
+                await self._try_close_chat()
+                return True
+            return False
+
+        if outcome == ALREADY and scope is not None:
+            # Откликнутые карточки отсеяны до клика (AppliedIndex), значит отметка появилась от нашего клика:
+            # hh отправил отклик в один клик. Записывает его транспорт (_record) по возврату True
+            self.log("Отклик отправлен в один клик.")
+            await self.waits.pace("after_submit")
+            return True
+        if outcome == ALREADY:
+            self.log("Уже откликались. Пропуск.")
+        elif outcome == ERROR:
+            self.log("hh.ru показал ошибку после клика. Пропуск.", "warning")
+        else:
+            self.log("Тест/Редирект. Пропуск." if outcome == NAVIGATION else "Нет реакции на клик. Пропуск.",
+                     "warning")
+        if back_to_serp and "/search/vacancy" not in self.page.url:
+            with self.tracer.span("go_back"):
+                await self.page.go_back(wait_until="domcontentloaded")
+                await self.wait_serp_ready()
+        return False
+
+    async def _traced_apply(self, card, data, open_button, back_to_serp=True):
+        """Отклик через транспорт внутри спана apply (исход: sent / skipped)."""
+        self.tracer.vacancy_id = card.get("id")
+        try:
+            with self.tracer.span("apply") as sp:
+                sent = await self.transport.apply(card, data, open_button, back_to_serp)
+                sp.outcome = "sent" if sent else "skipped"
+            return sent
+        finally:
+            self.tracer.vacancy_id = None
+
+    def _run_limit(self):
+        """Лимит за запуск, урезанный до остатка суточной квоты."""
+        requested = self.settings_mgr.get("limit_applications") or 50
+        limit = self.quota.plan_run(requested)
+        if limit < requested: self.log(f"Запуск сокращен до {limit} откликов по суточной квоте.", "warning")
+        return limit
+
+    async def process_vacancies_loop(self, data):
+        prefetcher = SerpPrefetcher(self, self.settings_mgr.get("prefetch_depth") or 0)
+        try:
+            await self._vacancies_loop(data, prefetcher)
+        finally:
+            await prefetcher.close()
+
+    async def _switch_page(self, new_page):
+        """Подменяет рабочую вкладку на предзагруженную."""
+        old_page = self.page
+        self.page = new_page
+        if self.human: self.human.page = new_page
+        try:
+            await new_page.bring_to_front()
+            await old_page.close()
+        except Exception as e:
+            if "Target closed" in str(e) or "browser has been closed" in str(e): raise e
+
+    async def _vacancies_loop(self, data, prefetcher):
+        limit = self._run_limit()
         count_processed = 0
         use_human = self.settings_mgr.get("use_human_moves")
+        cards = None
 
         while count_processed < limit:
             self.check_running()
             try:
-                # Получаем список вакансий
-                all_vacancies = self.page.locator(self.locators["search_page"]["vacancy_card"]).all()
+                # Все карточки страницы одним запросом в браузер (или уже готовые из предзагрузки)
+                if cards is None:
+                    with self.tracer.span("extract_cards"):
+                        cards = await extract_cards(self.page, self.locators)
+                # Следующие страницы грузятся в фоне, пока работаем с этой
+                await prefetcher.fill(self.page)
             except Exception as e:
                 # ЕСЛИ ОШИБКА ЗДЕСЬ -> БРАУЗЕР ЗАКРЫТ
                 if "Target closed" in str(e) or "browser has been closed" in str(e):
                     raise e
                 break
 
-            self.log(f"Найдено: {len(all_vacancies)}")
-            if not all_vacancies: break
+            self.log(f"Найдено: {len(cards)}")
+            if not cards: break
+            card_locator = self.page.locator(self.locators["search_page"]["vacancy_card"])
 
-            for vacancy in all_vacancies:
+            for card in cards:
                 self.check_running()
                 if count_processed >= limit: break
+                # Без кнопки отклика или уже откликались (по hh или по своей базе) - даже не скроллим
+                if self.applied.skip_reason(card): continue
 
-                try:
-                    if use_human and self.human:
-                        self.human.smooth_scroll_to(vacancy)
-                    else:
-                        vacancy.scroll_into_view_if_needed()
-
-                    title_el = vacancy.locator("a[data-qa='serp-item__title']").first
-                    company_el = vacancy.locator("a[data-qa='vacancy-serp__vacancy-employer']").first
-                    title = title_el.text_content() if title_el.is_visible() else "Vacancy"
-                    company = company_el.text_content().replace('\u00a0', ' ') if company_el.is_visible() else "Company"
-                    url = title_el.get_attribute("href") if title_el.is_visible() else ""
-
-                    apply_btn = vacancy.locator(self.locators["search_page"]["apply_button"]).first
-                    if not apply_btn.is_visible(): continue
-
-                    self.log(f"[{count_processed + 1}/{limit}] {title} ({company})")
-
-                    self._try_close_chat()
-                    self.smart_sleep(random.uniform(1.0, 1.5))
-                    apply_btn.click()
+                async def open_button():
+                    # Скроллим к карточке только если транспорту нужна кнопка
+                    vacancy = card_locator.nth(card["index"])
+                    with self.tracer.span("scroll"):
+                        if use_human and self.human:
+                            await self.human.smooth_scroll_to(vacancy)
+                        else:
+                            await vacancy.scroll_into_view_if_needed()
+                    return vacancy.locator(self.locators["search_page"]["apply_button"]).first
 
-                    is_modal = False
-                    try:
-                        self.page.wait_for_selector("div[role='dialog']", timeout=3000)
-                        is_modal = True
-                    except:
-                        if self._try_close_chat():
-                            try:
-                                apply_btn.click(force=True)
-                                self.page.wait_for_selector("div[role='dialog']", timeout=3000)
-                                is_modal = True
-                            except:
-                                is_modal = False
-
-                    if is_modal:
-                        info = {"title": title, "company": company}
-                        if self.handle_response_modal(data, info):
-                            self.db.add_application(title, company, url, self.profile_name)
-                            count_processed += 1
-                            self.smart_sleep(1)
-                            self._try_close_chat()
-                    else:
-                        self.log("Тест/Редирект. Пропуск.", "warning")
-                        if "hh.ru/search" not in self.page.url:
-                            self.page.go_back()
-                            self.page.wait_for_load_state("domcontentloaded")
-                            self.smart_sleep(2)
+                try:
+                    if not await self.quota.wait_turn(self): return
+                    self.log(f"[{count_processed + 1}/{limit}] {card['title']} ({card['company']})")
+                    if await self._traced_apply(card, data, open_button):
+                        count_processed += 1
+                        self.report_progress(count_processed, limit)
 
-                    self.smart_sleep(random.uniform(2.0, 4.0))
+                    # Основной темп задает квота (wait_turn), здесь - короткая пауза после действия
+                    await self.waits.pace("after_action")
 
                 except Exception as e:
                     if isinstance(e, InterruptedError): raise e
@@ -268,22 +369,33 @@ class BrowserEngine:
 
                     self.log(f"Ошибка: {e}", "error")
                     try:
-                        self.page.keyboard.press("Escape")
+                        await self.page.keyboard.press("Escape")
                     except:
                         pass
 
-            if count_processed < limit:
+            cards = None
+            if count_processed < limit and prefetcher.depth:
+                with self.tracer.span("paginate", outcome="prefetched"):
+                    next_page = await prefetcher.take()
+                if next_page is None:
+                    self.log("Конец списка.")
+                    break
+                self.log("След. страница >> (предзагружена)")
+                await self._switch_page(next_page.page)
+                cards = next_page.cards
+            elif count_processed < limit:
                 try:
                     next_btn = self.page.locator(self.locators["search_page"]["pager_next"]).first
-                    if next_btn.is_visible():
+                    if await next_btn.is_visible():
                         self.log("След. страница >>")
                         if use_human and self.human:
-                            self.human.smooth_scroll_to(next_btn)
+                            await self.human.smooth_scroll_to(next_btn)
                             self.check_running()
-                        self.smart_sleep(1)
-                        next_btn.click()
-                        self.page.wait_for_load_state("domcontentloaded")
-                        self.smart_sleep(3)
+                        await self.waits.pace("before_click")
+                        with self.tracer.span("paginate"):
+                            await next_btn.click()
+                            await self.page.wait_for_load_state("domcontentloaded")
+                            await self.wait_serp_ready()
                     else:
                         self.log("Конец списка.")
                         break
@@ -293,69 +405,108 @@ class BrowserEngine:
                     if "Target closed" in str(e) or "browser has been closed" in str(e): raise e
                     break
 
-    def handle_response_modal(self, data, info):
+    async def process_harvested_loop(self, data, query_params):
+        limit = self._run_limit()
+        count_processed = 0
+        harvester = SerpHarvester(self.context.request, self.locators, self.log)
+        apply_sel = self.locators["vacancy_page"]["apply_button"]
+        # Кэш выдачи между запусками: повторный прогон того же пресета не листает выдачу заново
+        ttl = float(self.settings_mgr.get("serp_cache_ttl_hours") or 0)
+        cache = SerpCache(self.db, ttl, self.log) if ttl > 0 else None
+        cards = cache.harvest(harvester, query_params) if cache else harvester.harvest(query_params)
+
+        try:
+            async for card in cards:
+                self.check_running()
+                if count_processed >= limit: break
+                if self.applied.skip_reason(card, require_id=True): continue
+
+                async def open_button():
+                    with self.tracer.span("open_vacancy"):
+                        await self.page.goto(f"{HH_BASE_URL}/vacancy/{card['id']}", wait_until="domcontentloaded")
+                        apply_btn = self.page.locator(apply_sel).first
+                        ready = await self.waits.locator("page_ready", apply_btn)
+                    if not ready:
+                        self.log("Нет кнопки отклика на странице вакансии. Пропуск.", "warning")
+                        return None
+                    return apply_btn
+
+                try:
+                    if not await self.quota.wait_turn(self): return
+                    self.log(f"[{count_processed + 1}/{limit}] {card['title']} ({card['company']})")
+                    if await self._traced_apply(card, data, open_button, back_to_serp=False):
+                        count_processed += 1
+                        self.report_progress(count_processed, limit)
+
+                    # Основной темп задает квота (wait_turn), здесь - короткая пауза после действия
+                    await self.waits.pace("after_action")
+
+                except Exception as e:
+                    if isinstance(e, InterruptedError): raise e
+                    # ВАЖНО: Пробрасываем ошибку закрытия
+                    if "Target closed" in str(e) or "browser has been closed" in str(e): raise e
+
+                    self.log(f"Ошибка: {e}", "error")
+                    try:
+                        await self.page.keyboard.press("Escape")
+                    except:
+                        pass
+        finally:
+            await cards.aclose()
+            if cache:
+                cache.store()
+                report = cache.summary()
+                if report: self.log(report)
+            report = harvester.summary()
+            if report: self.log(report)
+
+    async def handle_response_modal(self, data, info):
         try:
             modal = self.page.locator("div[role='dialog']")
+            # Диалог уже виден (OutcomeDetector), но форма внутри дорисовывается - ждем кнопку отправки
+            await self.waits.locator("modal_open", modal.locator(
+                "[data-qa='vacancy-response-submit-popup'], button[type='submit']").first)
             target = data.get("resume_name", "").strip().lower()
             if target:
-                curr_header = modal.locator("[data-qa='resume-title']").first
-                if curr_header.is_visible():
-                    curr_text = curr_header.text_content().strip().lower()
-                    if target not in curr_text:
-                        self.log(f"Смена резюме: {curr_text} -> {target}")
-                        curr_header.click(force=True)
-                        self.smart_sleep(1.5)
-                        options = self.page.locator("[data-magritte-select-option]").all()
-                        found = False
-                        for opt in options:
-                            try:
-                                txt = opt.text_content().strip().lower()
-                            except:
-                                continue
-                            if target in txt:
-                                opt.scroll_into_view_if_needed()
-                                opt.click(force=True)
-                                found = True
-                                self.smart_sleep(1)
-                                break
-                        if not found: curr_header.click(force=True)
+                with self.tracer.span("resume_pick"):
+                    await self.resume_picker.pick(modal, target)
 
             text = data.get("cover_letter", "")
             if text:
-                final_text = text.replace("{company}", info['company']).replace("{vacancy}", info['title']).replace(
-                    "{name}", self.profile_name)
+                final_text = render_letter(text, info, self.profile_name)
                 area = modal.locator("textarea").first
                 btn = modal.locator("[data-qa='add-cover-letter']").first
-                if not area.is_visible() and btn.is_visible(): btn.click(); self.smart_sleep(0.5)
-                if area.is_visible():
-                    if self.human and self.settings_mgr.get("use_human_moves"):
-                        self.human.human_type(area, final_text)
-                    else:
-                        area.fill(final_text)
+                if not await area.is_visible() and await btn.is_visible():
+                    await btn.click()
+                    await self.waits.locator("letter_input", area)
+                if await area.is_visible():
+                    with self.tracer.span("type_letter"):
+                        if self.human and self.settings_mgr.get("use_human_moves"):
+                            await self.human.human_type(area, final_text)
+                        else:
+                            await area.fill(final_text)
 
             submit = modal.locator("[data-qa='vacancy-response-submit-popup']").first
-            if not submit.is_visible(): submit = modal.locator("button[type='submit']").first
-            if submit.is_visible():
-                submit.click()
-                try:
-                    modal.wait_for(state="hidden", timeout=5000); return True
-                except:
-                    return False
+            if not await submit.is_visible(): submit = modal.locator("button[type='submit']").first
+            if await submit.is_visible():
+                await self.click(submit)
+                return await self.waits.locator("modal_close", modal, state="hidden")
         except:
             return False
         return False
 
-    def run_resume_update(self):
+    async def run_resume_update(self):
         self.log("=== ПОДНЯТИЕ РЕЗЮМЕ ===")
         try:
-            self.page.goto("https://hh.ru/applicant/resumes?hhtmFrom=main&hhtmFromLabel=header")
-            self.page.wait_for_load_state("domcontentloaded")
-            self.smart_sleep(3)
+            await self.page.goto(f"{HH_BASE_URL}/applicant/resumes?hhtmFrom=main&hhtmFromLabel=header",
+                                 wait_until="domcontentloaded")
+            await self.waits.selector("page_ready", self.locators["activity"]["resume_update_btn"])
+            await self.waits.read_page()
 
             while True:
                 self.check_running()
                 try:
-                    all_buttons = self.page.locator(self.locators["activity"]["resume_update_btn"]).all()
+                    all_buttons = await self.page.locator(self.locators["activity"]["resume_update_btn"]).all()
                 except Exception as e:
                     # ВАЖНО: Проверка закрытия
                     if "Target closed" in str(e) or "browser has been closed" in str(e): raise e
@@ -363,8 +514,8 @@ class BrowserEngine:
 
                 button_to_click = None
                 for btn in all_buttons:
-                    if not btn.is_visible(): continue
-                    txt = btn.text_content().lower()
+                    if not await btn.is_visible(): continue
+                    txt = (await btn.text_content()).lower()
                     if "поднять" in txt and "автоматически" not in txt:
                         button_to_click = btn
                         break
@@ -374,37 +525,44 @@ class BrowserEngine:
                     break
 
                 self.log("Поднимаю резюме...")
-                button_to_click.scroll_into_view_if_needed()
-                button_to_click.click()
-                self.smart_sleep(2)
+                await button_to_click.scroll_into_view_if_needed()
+                await button_to_click.click()
                 close_btn = self.page.locator(self.locators["activity"]["resume_modal_close"])
-                if close_btn.is_visible(): close_btn.click(); self.smart_sleep(1)
-                self.smart_sleep(2)
+                if await self.waits.locator("resume_modal", close_btn):
+                    await self.waits.pace("after_action")
+                    await close_btn.click()
+                    await self.waits.locator("resume_modal", close_btn, state="hidden")
+                # Кнопка «Поднять» исчезает - значит, клик обработан.
+                # Ждем по числу кнопок: локатор из all() после удаления указывает уже на соседнюю
+                await self.waits.until("page_ready", lambda t: self.page.wait_for_function(
+                    "([sel, n]) => document.querySelectorAll(sel).length < n",
+                    arg=[self.locators["activity"]["resume_update_btn"], len(all_buttons)], timeout=t))
+                await self.waits.pace("after_action")
 
         except Exception as e:
             if isinstance(e, InterruptedError): raise e
             if "Target closed" in str(e) or "browser has been closed" in str(e): raise e
             self.log(f"Ошибка резюме: {e}", "error")
 
-    def run_chat_activity(self, settings):
+    async def run_chat_activity(self, settings):
         try:
-            if "hh.ru" not in self.page.url: self.page.goto("https://hh.ru")
+            if HH_BASE_URL not in self.page.url: await self.page.goto(HH_BASE_URL)
 
             try:
-                self.page.locator(self.locators["activity"]["chat_open_btn"]).click(force=True)
+                await self.page.locator(self.locators["activity"]["chat_open_btn"]).click(force=True)
             except:
                 self.log("Кнопка чатов не найдена", "error"); return
 
             iframe_sel = self.locators["activity"]["chat_iframe"]
             try:
-                self.page.wait_for_selector(iframe_sel, timeout=10000)
+                if not await self.waits.selector("chat_ready", iframe_sel): raise TimeoutError()
             except:
                 self.log("Iframe не открылся", "error"); return
             frame = self.page.frame_locator(iframe_sel)
 
             list_sel = self.locators["activity"]["chat_list_item"]
             try:
-                frame.locator(list_sel).first.wait_for(timeout=10000)
+                if not await self.waits.locator("chat_ready", frame.locator(list_sel).first): raise TimeoutError()
             except:
                 self.log("Чат пуст", "warning"); return
 
@@ -414,21 +572,22 @@ class BrowserEngine:
 
             while processed < limit:
                 self.check_running()
-                rows = frame.locator(list_sel).all()
+                rows = await frame.locator(list_sel).all()
                 if processed >= len(rows): break
                 row = rows[processed]
                 try:
-                    row.click();
-                    self.smart_sleep(3)
+                    await row.click();
+                    await self.waits.locator("chat_ready", frame.locator(self.locators["activity"]["chat_input"]))
+                    await self.waits.pace("after_action")
                     try:
-                        employer_name = frame.locator(".title--jaEO2q2if2IOwiyO").first.text_content()
+                        employer_name = await frame.locator(".title--jaEO2q2if2IOwiyO").first.text_content()
                     except:
                         employer_name = "HR"
 
                     input_area = frame.locator(self.locators["activity"]["chat_input"])
-                    if not input_area.is_visible():
+                    if not await input_area.is_visible():
                         back = frame.locator(self.locators["activity"]["chat_back_btn"])
-                        if back.is_visible(): back.click()
+                        if await back.is_visible(): await back.click()
                         processed += 1;
                         continue
 
@@ -440,15 +599,17 @@ class BrowserEngine:
                         for msg in to_send:
                             self.check_running()
                             if use_human and self.human:
-                                self.human.human_type(input_area, msg)
+                                await self.human.human_type(input_area, msg)
                             else:
-                                input_area.fill(msg)
-                            self.smart_sleep(0.5)
+                                await input_area.fill(msg)
+                            await self.waits.pace("before_send")
                             send = frame.locator(self.locators["activity"]["chat_send_btn"])
-                            if send.is_visible(): send.click(force=True); self.smart_sleep(2)
+                            if await send.is_visible():
+                                await send.click(force=True)
+                                await self.waits.pace("between_vacancies", scale=0.5)
 
                     back = frame.locator(self.locators["activity"]["chat_back_btn"])
-                    if back.is_visible(): back.click()
+                    if await back.is_visible(): await back.click()
                     processed += 1
                 except Exception as e:
                     if isinstance(e, InterruptedError): raise e
@@ -458,10 +619,22 @@ class BrowserEngine:
             if isinstance(e, InterruptedError): raise e
             if "Target closed" in str(e) or "browser has been closed" in str(e): raise e
 
-    def stop_browser(self):
+    async def stop_browser(self):
         try:
-            if self.context: self.context.close()
-            if self.browser: self.browser.close()
-            if self.playwright: self.playwright.stop()
+            self.waits.book.flush()
+            self.tracer.flush()
         except:
-            pass
\ No newline at end of file
+            pass
+        if self.blocker:
+            report = self.blocker.summary()
+            if report: self.log(report)
+
+        # Закрываем только свой контекст, браузер возвращается в пул
+        try:
+            if self.pool and self.lease:
+                await self.pool.release(self.lease)
+            elif self.context:
+                await self.context.close()
+        except:
+            pass
+        self.lease = None
\ No newline at end of file
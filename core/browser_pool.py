@@ -0,0 +1,207 @@
+import asyncio
+import time
+import logging
+
+from core.settings_manager import SettingsManager
+
+logger = logging.getLogger("HH_Automation_bot")
+
+LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--disable-infobars",
+    # "--start-maximized", <--- ЭТО ТЕПЕРЬ ЗАВИСИТ ОТ РЕЖИМА
+    "--disable-dev-shm-usage",
+    "--no-first-run",
+    "--no-zygote",
+    "--hide-scrollbars",
+    "--mute-audio",
+]
+
+
+class PooledBrowser:
+    """Один запущенный Chromium и счетчики его аренд."""
+
+    def __init__(self, browser, headless):
+        self.browser = browser
+        self.headless = headless
+        self.active = 0          # Сколько контекстов сейчас открыто
+        self.leases_total = 0    # Сколько раз выдавали контекст за всю жизнь
+        self.retired = False     # Больше не выдаем, закроем после возврата всех контекстов
+        self.launched_at = time.monotonic()
+
+    def is_healthy(self):
+        try:
+            return self.browser.is_connected()
+        except:
+            return False
+
+
+class ContextLease:
+    """Изолированный BrowserContext, выданный профилю из пула."""
+
+    def __init__(self, pooled, context, warm, seconds):
+        self.pooled = pooled
+        self.context = context
+        self.warm = warm          # True - браузер уже был запущен, только выдали контекст
+        self.seconds = seconds    # Время от запроса до готового контекста
+        self.released = False
+
+
+class BrowserPool:
+    """
+    Пул из одного-нескольких Chromium. Каждый профиль арендует свой BrowserContext
+    (куки и storage изолированы), а процесс браузера общий.
+    Лимиты и переиспользование настраиваются в SettingsManager и перечитываются
+    при каждой аренде и прогреве - изменения во вкладке настроек применяются без перезапуска.
+    """
+
+    def __init__(self, runtime):
+        self.runtime = runtime
+        self.settings_mgr = SettingsManager()
+        self.browsers = []
+        self._cond = None
+
+    def _condition(self):
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        return self._cond
+
+    def _reload_settings(self):
+        self.settings_mgr = SettingsManager()
+
+    def _limits(self):
+        s = self.settings_mgr
+        return (max(1, int(s.get("pool_max_browsers") or 1)),
+                max(1, int(s.get("pool_contexts_per_browser") or 1)),
+                max(1, int(s.get("pool_recycle_after") or 1)))
+
+    async def _launch(self, headless):
+        playwright = await self.runtime.get_playwright()
+        started = time.monotonic()
+        browser = await playwright.chromium.launch(
+            headless=headless,
+            args=LAUNCH_ARGS,
+            channel=self.settings_mgr.get("browser_channel") or None,
+            ignore_default_args=["--enable-automation"]
+        )
+        logger.info(f"Пул: запущен Chromium ({'headless' if headless else 'headful'}) "
+                    f"за {time.monotonic() - started:.2f} сек")
+        return PooledBrowser(browser, headless)
+
+    async def _close(self, pooled):
+        if pooled in self.browsers:
+            self.browsers.remove(pooled)
+        try:
+            await pooled.browser.close()
+        except:
+            pass
+
+    async def _drop_unhealthy(self):
+        for pooled in list(self.browsers):
+            if not pooled.is_healthy():
+                logger.warning("Пул: браузер не отвечает, убираю из пула.")
+                await self._close(pooled)
+
+    def _pick(self, headless, per_browser):
+        candidates = [b for b in self.browsers
+                      if b.headless == headless and not b.retired
+                      and b.active < per_browser and b.is_healthy()]
+        if not candidates: return None
+        return min(candidates, key=lambda b: b.active)
+
+    def _evict_idle(self, headless):
+        """Освобождает место под браузер нужного режима, если есть простаивающий другой."""
+        for b in self.browsers:
+            if b.headless != headless and b.active == 0:
+                return b
+        return None
+
+    async def acquire(self, headless, context_options):
+        self._reload_settings()
+        max_browsers, per_browser, recycle_after = self._limits()
+        cond = self._condition()
+        started = time.monotonic()
+        warm = True
+
+        async with cond:
+            while True:
+                await self._drop_unhealthy()
+                pooled = self._pick(headless, per_browser)
+                if pooled: break
+
+                if len(self.browsers) >= max_browsers:
+                    idle = self._evict_idle(headless)
+                    if idle: await self._close(idle)
+
+                if len(self.browsers) < max_browsers:
+                    pooled = await self._launch(headless)
+                    self.browsers.append(pooled)
+                    warm = False
+                    break
+
+                # Все браузеры заняты: ждем возврата контекста
+                await cond.wait()
+
+            pooled.active += 1
+            pooled.leases_total += 1
+            if pooled.leases_total >= recycle_after:
+                # Отработал свое: новых аренд не даем, закроем после последнего возврата
+                pooled.retired = True
+
+        try:
+            context = await pooled.browser.new_context(**context_options)
+        except BaseException:
+            await self._return(pooled)
+            raise
+        return ContextLease(pooled, context, warm, time.monotonic() - started)
+
+    async def prewarm(self, headless, count=1):
+        """Заранее поднимает драйвер и браузеры нужного режима, чтобы старт был мгновенным."""
+        self._reload_settings()
+        max_browsers, _, _ = self._limits()
+        cond = self._condition()
+        await self.runtime.get_playwright()
+        async with cond:
+            await self._drop_unhealthy()
+            ready = [b for b in self.browsers if b.headless == headless and not b.retired]
+            while len(ready) < count and len(self.browsers) < max_browsers:
+                pooled = await self._launch(headless)
+                self.browsers.append(pooled)
+                ready.append(pooled)
+            cond.notify_all()
+        return len(ready)
+
+    def _schedule_rewarm(self, headless):
+        # Держим прогретый браузер взамен закрытого
+        if self.settings_mgr.get("prewarm_browsers"):
+            asyncio.get_running_loop().create_task(self._safe_prewarm(headless))
+
+    async def _safe_prewarm(self, headless):
+        try:
+            await self.prewarm(headless)
+        except Exception as e:
+            logger.warning(f"Пул: не удалось прогреть браузер: {e}")
+
+    async def release(self, lease):
+        if lease is None or lease.released: return
+        lease.released = True
+        try:
+            await lease.context.close()
+        except:
+            pass
+        await self._return(lease.pooled)
+
+    async def _return(self, pooled):
+        cond = self._condition()
+        async with cond:
+            pooled.active = max(0, pooled.active - 1)
+            if pooled.active == 0 and (pooled.retired or not pooled.is_healthy()):
+                logger.info(f"Пул: перезапуск браузера после {pooled.leases_total} аренд.")
+                await self._close(pooled)
+                self._schedule_rewarm(pooled.headless)
+            cond.notify_all()
+
+    async def close_all(self):
+        for pooled in list(self.browsers):
+            await self._close(pooled)
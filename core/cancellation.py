@@ -0,0 +1,71 @@
+import asyncio
+import threading
+import logging
+
+logger = logging.getLogger("HH_Automation_bot")
+
+STOP_REASON = "Stopped by button"
+STOP_GRACE = 5.0  # Сек на аккуратное завершение, потом задача отменяется повторно
+
+
+class CancelToken:
+    """
+    Общий флаг остановки профиля: его видят движок, HumanLike, ожидания и воркер.
+    cancel() можно звать из любого потока - он будит спящих и отменяет задачу профиля,
+    так что висящие goto / wait_for_selector / type прерываются сразу, а не по таймауту.
+    """
+
+    def __init__(self):
+        self.reason = None
+        self._cancelled = threading.Event()
+        self._loop = None
+        self._task = None
+        self._event = None
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def bind(self):
+        """Привязка к текущей задаче цикла. Вызывается в начале run_job."""
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
+        self._event = asyncio.Event()
+        if self.cancelled: self._event.set()
+
+    def cancel(self, reason=STOP_REASON):
+        if self.cancelled: return
+        self.reason = reason
+        self._cancelled.set()
+        loop = self._loop
+        if loop and not loop.is_closed():
+            loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self):
+        if self._event: self._event.set()
+        if self._task and not self._task.done():
+            self._task.cancel()
+            self._loop.call_later(STOP_GRACE, self._force)
+
+    def _force(self):
+        # Задача поймала отмену в bare except и продолжила - добиваем
+        if self._task and not self._task.done():
+            logger.warning(f"Профиль не остановился за {STOP_GRACE:.0f} сек, повторная отмена.")
+            self._task.cancel()
+
+    def check(self):
+        if self.cancelled:
+            raise InterruptedError(self.reason or STOP_REASON)
+
+    async def sleep(self, seconds):
+        """Сон, который просыпается сразу по cancel(), без опроса флага."""
+        self.check()
+        if seconds <= 0: return
+        if self._event is None:
+            await asyncio.sleep(seconds)
+        else:
+            try:
+                await asyncio.wait_for(self._event.wait(), seconds)
+            except asyncio.TimeoutError:
+                pass
+        self.check()
@@ -3,6 +3,9 @@ import os
 # Путь к корню проекта
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Адрес сайта. Переопределяется для локального стенда (tools/fake_hh)
+HH_BASE_URL = os.environ.get("HH_BOT_BASE_URL", "https://hh.ru").rstrip("/")
+
 # Настройки запуска браузера
 HEADLESS_MODE = False  # False = мы видим браузер, True = скрытый режим
 
@@ -2,112 +2,143 @@ import time
 import random
 import math
 import logging
+
+from core.keystrokes import KeystrokePlan
+from core.mouse_motion import MouseMotion
+from core.scroll_plan import (PLANNERS, plan_smooth, target_distance, in_view, at_edge, MEASURE_JS,
+                              BATCH_STEPS, MAX_REPLANS, SHIFT_TOLERANCE)
+
 logger = logging.getLogger("HH_Automation_bot")
 
 class HumanLike:
     def __init__(self, page, engine):
         self.page = page
         self.engine = engine  # Ссылка на движок для проверки флага и настроек
+        self.type_calls = 0  # Сообщений в браузер на ввод текста (для бенчмарков)
+        self.scroll_calls = 0  # Пачек колеса прокрутки, отправленных в браузер
+        self.mouse = MouseMotion(engine)
 
-    def _sleep(self, seconds):
+    async def _sleep(self, seconds):
         """Пауза через умный сон движка"""
-        self.engine.smart_sleep(seconds)
-
-    def smooth_scroll_to(self, locator):
-        if not locator.is_visible(): return
-
+        await self.engine.smart_sleep(seconds)
+
+    def _stopped(self):
+        # После остановки запасные пути (fill, scroll_into_view) уже не нужны
+        return self.engine.token.cancelled
+
+    async def smooth_scroll_to(self, locator):
+        """
+        Скролл к элементу по заранее рассчитанной траектории: колесо мыши через CDP пачками
+        (MouseMotion.wheel), после пачки - замер. Перемеряем план, если верстка сдвинулась
+        или план кончился раньше цели. True - элемент в окне.
+        """
         try:
-            box = locator.bounding_box()
-            if not box: return
-
-            viewport_h = self.page.viewport_size['height'] if self.page.viewport_size else 800
+            mode = self.engine.settings_mgr.get("scroll_mode") or "smooth"
+            if mode == "instant":
+                await locator.scroll_into_view_if_needed()
+                return True
 
-            # Загружаем настройки
+            # Загружаем настройки один раз на весь скролл
             s_min = float(self.engine.settings_mgr.get("scroll_step_min"))
             s_max = float(self.engine.settings_mgr.get("scroll_step_max"))
 
             # Защита от дурака (чтобы min не был больше max)
             if s_min > s_max: s_min = s_max
-
-            steps = 0
-            while True:
-                self.engine.check_running()
-
-                box = locator.bounding_box()
-                if not box: break
-                y = box['y']
-
-                if 100 < y < viewport_h - 100: break
-
-                # Рандомная сила скролла
-                scroll_amount = random.randint(int(s_min), int(s_max))
-                delta = scroll_amount if y > viewport_h else -scroll_amount
-
-                self.page.mouse.wheel(0, delta)
-                self._sleep(random.uniform(0.05, 0.15))
-
-                steps += 1
-                if steps > 50: break
+            planner = PLANNERS.get(mode, plan_smooth)
+
+            m = await locator.evaluate(MEASURE_JS)
+            if not m: return False
+
+            for _ in range(MAX_REPLANS + 1):
+                if in_view(m["top"], m["vh"]): return True
+                steps = planner(target_distance(m["top"], m["vh"]), s_min, s_max)
+                if not steps: break
+                for i in range(0, len(steps), BATCH_STEPS):
+                    self.engine.check_running()
+                    batch = steps[i:i + BATCH_STEPS]
+                    prev = m
+                    await self.mouse.wheel(self.page, batch)
+                    self.scroll_calls += 1
+                    m = await locator.evaluate(MEASURE_JS)
+                    if not m: return False
+                    # Уперлись в край страницы - дальше крутить некуда
+                    if at_edge(m, sum(dy for dy, _ in batch)): return in_view(m["top"], m["vh"])
+                    # Элемент сместился не на столько, на сколько прокрутили: подгрузилась верстка
+                    if abs(m["top"] - (prev["top"] - (m["y"] - prev["y"]))) > SHIFT_TOLERANCE: break
+            # План обрезан MAX_STEPS или кончились перепланирования - ответ по реальному положению
+            return in_view(m["top"], m["vh"])
         except Exception as e:
+            if self._stopped(): raise e
             # Игнорируем ошибки остановки, остальные логируем как DEBUG (чтобы не спамить)
             if "Stopped" not in str(e) and "Target closed" not in str(e):
                 logger.debug(f"Human scroll error: {e}")
             try:
-                locator.scroll_into_view_if_needed()
+                await locator.scroll_into_view_if_needed()
+                return True
             except:
-                pass
-
-    def human_type(self, locator, text):
-        """Ввод текста с настроенной скоростью"""
+                return False
+
+    async def human_type(self, locator, text):
+        """
+        Ввод текста с настроенной скоростью.
+        План нажатий считается заранее и печатается через CDP (Input.dispatchKeyEvent/insertText):
+        события доверенные, как от живой клавиатуры. Без CDP - клавиатурой Playwright по тому же плану.
+        """
         try:
-            locator.click()
+            await locator.click()
 
             # Получаем настройки скорости (в секундах)
             t_min = float(self.engine.settings_mgr.get("typing_speed_min"))
             t_max = float(self.engine.settings_mgr.get("typing_speed_max"))
-
-            for char in text:
+            chunk = int(self.engine.settings_mgr.get("typing_chunk") or 1)
+
+            plan = KeystrokePlan.compile(text, t_min, t_max, chunk)
+            session = await self.mouse.get_session(self.page)
+            if session is not None:
+                self.type_calls += await plan.replay(session, self.engine)
+                return
+            for batch in plan.batches():
                 self.engine.check_running()
-
-                # Playwright delay (в мс) - базовый
-                # Мы добавим свой sleep для большей хаотичности
-
-                locator.type(char, delay=int(t_min * 1000))  # Базовая задержка из настроек
-
-                # Дополнительная случайная задержка сверху
-                extra_sleep = random.uniform(0, t_max - t_min)
-                if extra_sleep > 0:
-                    self._sleep(extra_sleep)
-
-                # Редкая длинная пауза ("задумался")
-                if random.random() < 0.05:
-                    self._sleep(random.uniform(0.3, 0.7))
+                for step, delay in batch:
+                    await self.page.keyboard.type(step)
+                    self.type_calls += 1
+                    await self._sleep(delay / 1000)
 
         except Exception as e:
+            if self._stopped(): raise e
             if "Stopped" not in str(e) and "Target closed" not in str(e):
                 logger.debug(f"Human type error: {e}")
-            locator.fill(text)  # Если не вышло по буквам, вставляем сразу
-
-    def human_click(self, locator):
+            await locator.fill(text)  # Если не вышло по буквам, вставляем сразу
+
+    async def approach(self, locator):
+        """
+        Курсор идет к элементу по кривой (core/mouse_motion.py).
+        Возвращает точку клика относительно элемента или None, если элемент не измерить.
+        """
+        box = await locator.bounding_box()
+        if not box: return None
+        x = box["x"] + box["width"] / 2 + random.uniform(-1, 1) * min(5, box["width"] / 4)
+        y = box["y"] + box["height"] / 2 + random.uniform(-1, 1) * min(5, box["height"] / 4)
+        await self.mouse.move_to(self.page, x, y)
+        await self._sleep(random.uniform(0.1, 0.3))
+        return {"x": x - box["x"], "y": y - box["y"]}
+
+    async def human_click(self, locator, force=False):
         try:
-            box = locator.bounding_box()
-            if box:
-                x = box["x"] + box["width"] / 2 + random.uniform(-5, 5)
-                y = box["y"] + box["height"] / 2 + random.uniform(-5, 5)
-                self.page.mouse.move(x, y, steps=5)
-
-            self._sleep(random.uniform(0.1, 0.3))
-            locator.click()
+            position = await self.approach(locator)
+            # Обычный клик в ту же точку: курсор уже там, проверки Playwright сохраняются
+            await locator.click(force=force, position=position)
         except Exception as e:
-            if "Stopped" in str(e) or "Target closed" in str(e): raise e
-            locator.click()
+            if self._stopped() or "Stopped" in str(e) or "Target closed" in str(e): raise e
+            await locator.click(force=force)
 
-    def random_scroll(self):
+    async def random_scroll(self):
         try:
             for _ in range(random.randint(2, 5)):
                 self.engine.check_running()
-                self.page.mouse.wheel(0, random.randint(100, 400))
-                self._sleep(random.uniform(0.5, 1.5))
+                await self.page.mouse.wheel(0, random.randint(100, 400))
+                await self._sleep(random.uniform(0.5, 1.5))
         except Exception as e:
+            if self._stopped(): raise e
             if "Stopped" not in str(e) and "Target closed" not in str(e):
-                logger.debug(f"Human click error: {e}")
\ No newline at end of file
+                logger.debug(f"Human click error: {e}")
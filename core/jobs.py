@@ -0,0 +1,78 @@
+import asyncio
+import logging
+
+from core.runtime import get_runtime
+from core.cancellation import STOP_GRACE
+
+logger = logging.getLogger("HH_Automation_bot")
+
+
+def classify_exit(error):
+    """Переводит исключение движка в статус для finished_signal."""
+    err = str(error)
+    # Ловим все вариации ошибки закрытия
+    if isinstance(error, asyncio.CancelledError) or "Stopped by button" in err:
+        return "stopped"
+    if "ManualClose" in err or "Target closed" in err or "browser has been closed" in err:
+        return "closed_by_user"
+    return f"error: {err}"
+
+
+async def search_job(engine, data):
+    with engine.tracer.span("start_browser"):
+        await engine.start_browser()
+    await engine.run_search(data)
+
+
+async def activity_job(engine, settings):
+    with engine.tracer.span("start_browser"):
+        await engine.start_browser()
+
+    if settings["use_chat"]:
+        with engine.tracer.span("chat_activity"):
+            await engine.run_chat_activity(settings)
+
+    if settings["use_resume"]:
+        with engine.tracer.span("resume_update"):
+            await engine.run_resume_update()
+
+
+JOBS = {
+    "search": search_job,
+    "activity": activity_job,
+}
+
+
+async def run_job(engine, kind, payload):
+    """
+    Полный цикл одного профиля: ожидание слота, работа, закрытие браузера.
+    Возвращает статус: finished / stopped / closed_by_user / error: ...
+    """
+    status = "finished"
+    slots = get_runtime().slot()
+    engine.token.bind()
+    try:
+        if slots.locked():
+            engine.log("Ожидание свободного слота...")
+        async with slots:
+            engine.check_running()
+            with engine.tracer.span("run"):
+                await JOBS[kind](engine, payload)
+    except BaseException as e:
+        # После stop() любые ошибки (отмена, закрытая вкладка) - это штатная остановка
+        status = "stopped" if engine.token.cancelled else classify_exit(e)
+        if isinstance(e, asyncio.CancelledError):
+            # Отмену обработали сами - снимаем ее, чтобы не сорвать закрытие браузера ниже
+            task = asyncio.current_task()
+            if hasattr(task, "uncancel"): task.uncancel()
+        if status == "closed_by_user":
+            logger.warning(f"[{engine.profile_name}] Обнаружено ручное закрытие.")
+        elif status.startswith("error"):
+            logger.error(f"[{engine.profile_name}] CRITICAL: {e}")
+    finally:
+        try:
+            # Закрытие ограничено по времени, чтобы остановка не зависала
+            await asyncio.wait_for(asyncio.shield(engine.stop_browser()), STOP_GRACE)
+        except BaseException:
+            pass
+    return status
@@ -0,0 +1,88 @@
+import asyncio
+import random
+import time
+
+# Пауза «задумался»: вероятность на символ и длительность (сек) - как в прежнем посимвольном вводе
+THINK_CHANCE = 0.05
+THINK_PAUSE = (0.3, 0.7)
+BATCH_KEYS = 60  # Шагов плана между проверками остановки
+
+# Enter через CDP: keyDown с text "\r" дает и keypress, и перевод строки в textarea
+ENTER = {"key": "Enter", "code": "Enter", "windowsVirtualKeyCode": 13, "nativeVirtualKeyCode": 13}
+
+
+def key_commands(text):
+    """
+    CDP-команды одного шага плана. Кусок из нескольких символов - один Input.insertText
+    (по умолчанию, typing_chunk), одиночный символ - keyDown/keyUp: браузер сам порождает
+    keydown/keypress/input/keyup с isTrusted=true, но это два сообщения на символ.
+    """
+    if len(text) > 1: return [("Input.insertText", {"text": text})]
+    if text == "\n":
+        down = dict(ENTER, type="keyDown", text="\r", unmodifiedText="\r")
+        return [("Input.dispatchKeyEvent", down), ("Input.dispatchKeyEvent", dict(ENTER, type="keyUp"))]
+    return [("Input.dispatchKeyEvent", {"type": "keyDown", "key": text, "text": text, "unmodifiedText": text}),
+            ("Input.dispatchKeyEvent", {"type": "keyUp", "key": text})]
+
+
+class KeystrokePlan:
+    """
+    Весь текст заранее раскладывается в шаги (фрагмент, пауза после, мс).
+    Распределение то же, что у посимвольного ввода: t_min + U(0, t_max - t_min),
+    плюс с вероятностью 5% пауза 0.3-0.7 сек.
+    """
+
+    def __init__(self, steps):
+        self.steps = steps
+
+    @classmethod
+    def compile(cls, text, t_min, t_max, chunk=1, rng=random):
+        t_min = max(0.0, float(t_min))
+        spread = max(0.0, float(t_max) - t_min)
+        chunk = max(1, int(chunk))
+
+        steps = []
+        buf, buf_delay = "", 0.0
+        for char in text:
+            delay = t_min + rng.uniform(0, spread)
+            think = rng.random() < THINK_CHANCE
+            if think: delay += rng.uniform(*THINK_PAUSE)
+            buf += char
+            buf_delay += delay
+            # Длинные ровные участки можно вставлять кусками по chunk символов,
+            # но паузу «задумался» всегда оставляем отдельным шагом
+            if len(buf) >= chunk or think or char in "\n":
+                steps.append((buf, int(buf_delay * 1000)))
+                buf, buf_delay = "", 0.0
+        if buf: steps.append((buf, int(buf_delay * 1000)))
+        return cls(steps)
+
+    @property
+    def total_seconds(self):
+        return sum(delay for _, delay in self.steps) / 1000
+
+    def batches(self, size=BATCH_KEYS):
+        for i in range(0, len(self.steps), size):
+            yield self.steps[i:i + size]
+
+    @property
+    def send_count(self):
+        """Сколько сообщений CDP уйдет на план: по одному на кусок, по два (keyDown/keyUp) на символ."""
+        return sum(len(key_commands(text)) for text, _ in self.steps)
+
+    async def replay(self, session, engine):
+        """
+        Печать плана через CDP-сессию: команды шага уходят вместе, затем пауза шага
+        за вычетом времени отправки. Возвращает число отправленных сообщений CDP.
+        """
+        sends = 0
+        for batch in self.batches():
+            engine.check_running()
+            for text, delay in batch:
+                started = time.perf_counter()
+                commands = key_commands(text)
+                await asyncio.gather(*[session.send(method, params) for method, params in commands])
+                sends += len(commands)
+                rest = delay / 1000 - (time.perf_counter() - started)
+                if rest > 0: await engine.smart_sleep(rest)
+        return sends
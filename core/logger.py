@@ -2,34 +2,20 @@
 import logging
 import sys
 import os
-from PyQt6.QtCore import QObject, pyqtSignal
 from core.utils import get_user_data_path
 
-class QLogHandler(logging.Handler, QObject):
+
+def setup_logger(gui=True, stream=None):
     """
-    Кастомный обработчик логов.
-    Перехватывает сообщения logging и отправляет их в GUI через сигнал.
-    Наследуется от QObject, чтобы иметь возможность испускать сигналы.
+    Консоль + файл в AppData/logs, для окна - еще обработчик с Qt-сигналом.
+    gui=False - без импорта PyQt (консольный запуск hh_bot), тогда вместо обработчика None.
     """
-    log_signal = pyqtSignal(str)
-
-    def __init__(self):
-        super().__init__()
-        QObject.__init__(self)
-
-    def emit(self, record):
-        msg = self.format(record)
-        # Отправляем текст в интерфейс
-        self.log_signal.emit(msg)
-
-
-def setup_logger():
     logger = logging.getLogger("HH_Automation_bot")
     logger.setLevel(logging.DEBUG)
 
     formatter = logging.Formatter('%(asctime)s | %(levelname)s | %(message)s', datefmt='%H:%M:%S')
 
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = logging.StreamHandler(stream or sys.stdout)
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
 
@@ -43,8 +29,11 @@ def setup_logger():
     file_handler.setFormatter(formatter)
     logger.addHandler(file_handler)
 
-    gui_handler = QLogHandler()
-    gui_handler.setFormatter(formatter)
-    logger.addHandler(gui_handler)
+    gui_handler = None
+    if gui:
+        from gui.log_handler import QLogHandler
+        gui_handler = QLogHandler()
+        gui_handler.setFormatter(formatter)
+        logger.addHandler(gui_handler)
 
-    return logger, gui_handler
\ No newline at end of file
+    return logger, gui_handler
@@ -0,0 +1,160 @@
+import asyncio
+import math
+import random
+import logging
+
+logger = logging.getLogger("HH_Automation_bot")
+
+# Корзины по расстоянию (px): точек в траектории и длительность движения (мс)
+BUCKETS = (
+    (150, 10, 180),
+    (400, 16, 300),
+    (800, 22, 420),
+    (1600, 28, 550),
+    (math.inf, 34, 700),
+)
+VARIANTS = 8       # Сколько разных кривых держим на корзину
+BATCH_EVENTS = 8   # Событий мыши за один заход в CDP
+
+_templates = {}
+
+
+def _bucket(distance):
+    for i, (limit, _, _) in enumerate(BUCKETS):
+        if distance <= limit: return i
+    return len(BUCKETS) - 1
+
+
+def _ease(t):
+    # Профиль скорости с минимальным рывком: разгон, пик посередине, торможение
+    return t * t * t * (10 - 15 * t + 6 * t * t)
+
+
+def _make_template(points, duration_ms, rng):
+    """
+    Кривая Безье из (0,0) в (1,0) в координатах «вдоль / поперек» пути.
+    Возвращает [(u, v, dt_ms)], u и v в долях расстояния.
+    """
+    c1 = (rng.uniform(0.15, 0.45), rng.uniform(-0.25, 0.25))
+    c2 = (rng.uniform(0.55, 0.85), rng.uniform(-0.25, 0.25))
+    ts = [_ease(i / points) for i in range(1, points + 1)]
+    dt = duration_ms * rng.uniform(0.8, 1.2) / points
+    out = []
+    for t in ts:
+        b, c, d = 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t * t, t ** 3
+        u = b * c1[0] + c * c2[0] + d
+        v = b * c1[1] + c * c2[1]
+        out.append((u, v, dt))
+    return out
+
+
+def template_for(distance, rng=random):
+    """Готовая кривая из кэша корзины (кэш заполняется при первом обращении)."""
+    idx = _bucket(distance)
+    variants = _templates.get(idx)
+    if variants is None:
+        _, points, duration = BUCKETS[idx]
+        variants = _templates[idx] = [_make_template(points, duration, rng) for _ in range(VARIANTS)]
+    return rng.choice(variants)
+
+
+def build_path(start, end, rng=random):
+    """Точки (x, y, dt_ms) от start к end по кривой из кэша, повернутой и масштабированной под отрезок."""
+    sx, sy = start
+    dx, dy = end[0] - sx, end[1] - sy
+    distance = math.hypot(dx, dy)
+    if distance < 1: return []
+    path = [(sx + u * dx - v * dy + rng.uniform(-0.5, 0.5),
+             sy + u * dy + v * dx + rng.uniform(-0.5, 0.5), dt)
+            for u, v, dt in template_for(distance, rng)]
+    # Последняя точка - ровно в цель
+    path[-1] = (end[0], end[1], path[-1][2])
+    return path
+
+
+def _random_point(size):
+    return random.uniform(size * 0.2, size * 0.8)
+
+
+class MouseMotion:
+    """
+    Движение курсора по кривой и колесо прокрутки через CDP (Input.dispatchMouseEvent).
+    События шлются пачками без ожидания ответа на каждое.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.position = None
+        self._session = None
+        self._session_page = None
+        self.cdp_failed = False
+        self.events = 0
+        self.batches = 0
+
+    async def get_session(self, page):
+        """CDP-сессия страницы (общая с вводом текста) или None, если CDP недоступен."""
+        if self.cdp_failed: return None
+        if self._session is None or self._session_page is not page:
+            try:
+                self._session = await page.context.new_cdp_session(page)
+                self._session_page = page
+                self.position = None
+            except Exception as e:
+                if "Target closed" in str(e) or "browser has been closed" in str(e): raise e
+                logger.debug(f"CDP session error: {e}")
+                self.cdp_failed = True
+                return None
+        return self._session
+
+    async def move_to(self, page, x, y):
+        session = await self.get_session(page)
+        if session is None:
+            await page.mouse.move(x, y, steps=5)
+            self.position = (x, y)
+            return
+
+        if self.position is None:
+            # Где курсор сейчас - неизвестно: стартуем из случайной точки окна
+            vp = page.viewport_size or {"width": 1280, "height": 800}
+            self.position = (_random_point(vp["width"]), _random_point(vp["height"]))
+
+        path = build_path(self.position, (x, y))
+        for i in range(0, len(path), BATCH_EVENTS):
+            self.engine.check_running()
+            batch = path[i:i + BATCH_EVENTS]
+            await asyncio.gather(*[session.send("Input.dispatchMouseEvent",
+                                                {"type": "mouseMoved", "x": px, "y": py})
+                                   for px, py, _ in batch])
+            self.events += len(batch)
+            self.batches += 1
+            await self.engine.smart_sleep(sum(dt for _, _, dt in batch) / 1000)
+        self.position = (x, y)
+
+    async def wheel(self, page, steps):
+        """
+        Прокрутка колесом по плану [(dy, пауза мс)]: mouseWheel через CDP в точке курсора.
+        Событие уходит сразу, ответы собираются в конце пачки - паузы между шагами не растут на round-trip.
+        """
+        session = await self.get_session(page)
+        if session is None:
+            for dy, delay in steps:
+                await page.mouse.wheel(0, dy)
+                await self.engine.smart_sleep(delay / 1000)
+            return
+
+        if self.position is None:
+            vp = page.viewport_size or {"width": 1280, "height": 800}
+            self.position = (_random_point(vp["width"]), _random_point(vp["height"]))
+        x, y = self.position
+        sent = []
+        try:
+            for dy, delay in steps:
+                sent.append(asyncio.ensure_future(session.send("Input.dispatchMouseEvent", {
+                    "type": "mouseWheel", "x": x, "y": y, "deltaX": 0, "deltaY": dy})))
+                await self.engine.smart_sleep(delay / 1000)
+        finally:
+            results = await asyncio.gather(*sent, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception): raise result
+        self.events += len(steps)
+        self.batches += 1
@@ -0,0 +1,101 @@
+import logging
+
+logger = logging.getLogger("HH_Automation_bot")
+
+# Наборы правил: какие типы ресурсов резать (resource_type из Playwright)
+RULE_SETS = {
+    "off": [],
+    "light": ["image", "media", "font"],
+    "aggressive": ["image", "media", "font", "texttrack", "eventsource", "manifest", "other"],
+}
+
+# Аналитика, реклама и счетчики. Совпадение по подстроке в URL
+DEFAULT_BLOCKED_URLS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "mc.yandex.ru",
+    "an.yandex.ru",
+    "yandex.ru/ads",
+    "adfox.ru",
+    "top-fwz1.mail.ru",
+    "counter.yadro.ru",
+    "vk.com/rtrg",
+    "facebook.net",
+    "criteo",
+    "/analytics/",
+]
+
+# Средний вес заблокированного ресурса (байт). Реальный размер у отмененного запроса не узнать,
+# поэтому сэкономленный трафик - только оценка по этим числам
+AVG_SIZES = {
+    "image": 35_000,
+    "media": 300_000,
+    "font": 40_000,
+    "script": 60_000,
+    "stylesheet": 25_000,
+    "xhr": 2_000,
+    "fetch": 2_000,
+    "other": 5_000,
+}
+
+
+class ResourceBlocker:
+    """
+    Фильтр запросов на уровне BrowserContext (context.route).
+    Режет ресурсы по типу и по шаблону URL, считает отсеченное за запуск (трафик - оценкой).
+    """
+
+    def __init__(self, settings_mgr):
+        mode = settings_mgr.get("block_resources") or "off"
+        self.mode = mode
+        self.blocked_types = set(RULE_SETS.get(mode, []))
+        patterns = settings_mgr.get("blocked_url_patterns")
+        if patterns is None: patterns = DEFAULT_BLOCKED_URLS
+        self.blocked_urls = [] if mode == "off" else list(patterns)
+
+        self.total = 0
+        self.blocked = 0
+        self.estimated_bytes = 0
+        self.by_type = {}
+
+    @property
+    def enabled(self):
+        return bool(self.blocked_types or self.blocked_urls)
+
+    async def install(self, context):
+        if not self.enabled: return
+        await context.route("**/*", self._handle)
+
+    def should_block(self, url, resource_type):
+        if resource_type == "document":
+            return False
+        if resource_type in self.blocked_types:
+            return True
+        return any(p in url for p in self.blocked_urls)
+
+    async def _handle(self, route):
+        request = route.request
+        rt = request.resource_type
+        self.total += 1
+        if self.should_block(request.url, rt):
+            self.blocked += 1
+            self.estimated_bytes += AVG_SIZES.get(rt, AVG_SIZES["other"])
+            self.by_type[rt] = self.by_type.get(rt, 0) + 1
+            try:
+                await route.abort("blockedbyclient")
+            except:
+                pass
+            return
+        try:
+            await route.continue_()
+        except:
+            pass
+
+    def summary(self):
+        if not self.enabled or not self.total:
+            return None
+        types = ", ".join(f"{k}: {v}" for k, v in sorted(self.by_type.items(), key=lambda x: -x[1]))
+        share = self.blocked * 100 / self.total
+        return (f"Фильтр сети ({self.mode}): отсечено {self.blocked} из {self.total} запросов "
+                f"({share:.0f}%), оценочно ~{self.estimated_bytes / 1024 / 1024:.1f} МБ трафика. [{types}]")
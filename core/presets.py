@@ -0,0 +1,31 @@
+import json
+import os
+
+from core.utils import get_user_data_path, get_base_path
+
+PRESETS_FILE = get_user_data_path("presets.json")
+# В папке данных, а не относительно текущего каталога (cron / systemd запускают из других папок)
+MESSAGES_FILE = get_user_data_path("messages_preset.json")
+# Где сообщения лежали раньше (data/ рядом с приложением) - читаем, пока не сохранены по новому пути
+LEGACY_MESSAGES_FILE = os.path.join(get_base_path(), "data", "messages_preset.json")
+
+
+def load_presets():
+    """Пресеты поиска {имя: данные формы}, как их сохраняет вкладка «Отклики»."""
+    if not os.path.exists(PRESETS_FILE): return {}
+    try:
+        with open(PRESETS_FILE, "r", encoding="utf-8") as f: return json.load(f)
+    except: return {}
+
+
+def save_presets(presets):
+    with open(PRESETS_FILE, "w", encoding="utf-8") as f: json.dump(presets, f, indent=4)
+
+
+def load_messages():
+    """Сообщения для чатов с вкладки «Активность»."""
+    path = MESSAGES_FILE if os.path.exists(MESSAGES_FILE) else LEGACY_MESSAGES_FILE
+    if not os.path.exists(path): return []
+    try:
+        with open(path, "r", encoding="utf-8") as f: return json.load(f)
+    except: return []
@@ -0,0 +1,158 @@
+import logging
+import multiprocessing
+import queue
+import threading
+
+from core.cancellation import STOP_GRACE
+
+logger = logging.getLogger("HH_Automation_bot")
+
+KILL_AFTER = STOP_GRACE * 4  # Столько ждем штатной остановки процесса после stop(), потом terminate
+
+
+class ChannelLogHandler(logging.Handler):
+    """Логи дочернего процесса - в канал к родителю (там они идут в консоль, файл и окно)."""
+
+    def __init__(self, channel):
+        super().__init__()
+        self.channel = channel
+
+    def emit(self, record):
+        try:
+            self.channel.put(("log", record.levelno, record.getMessage()))
+        except:
+            pass
+
+
+def child_main(kind, profile, payload, channel, stop_event):
+    """
+    Точка входа дочернего процесса: свой цикл движка, свой Playwright, один профиль.
+    В канал уходят ("log", level, text), ("progress", done, total) и в конце ("status", status).
+    """
+    log = logging.getLogger("HH_Automation_bot")
+    log.handlers = [ChannelLogHandler(channel)]
+    log.setLevel(logging.DEBUG)
+
+    from core.browser_manager import BrowserEngine
+    from core.jobs import run_job
+    from core.runtime import get_runtime
+
+    engine = BrowserEngine(profile)
+    engine.progress = lambda done, total: channel.put(("progress", done, total))
+
+    def watch_stop():
+        stop_event.wait()
+        engine.stop_execution()
+
+    threading.Thread(target=watch_stop, name="StopWatch", daemon=True).start()
+    runtime = get_runtime()
+    try:
+        status = runtime.submit(run_job(engine, kind, payload)).result()
+    except BaseException as e:
+        status = f"error: {e}"
+    finally:
+        try:
+            runtime.submit(runtime.shutdown()).result(timeout=30)
+        except:
+            pass
+    channel.put(("status", status))
+
+
+class ProcessJob:
+    """
+    Запуск профиля в отдельном процессе (spawn). Зависание Playwright или тяжелый цикл
+    одного профиля не тормозят GUI и соседей, а падение процесса не роняет приложение.
+
+    Колбэки вызываются из служебного потока:
+    on_log(level, text), on_progress(done, total), on_finished(status).
+    Упавший без статуса процесс перезапускается до restarts раз: уже отправленные отклики
+    повторно не уйдут (база откликов профиля и суточная квота общие).
+    """
+
+    def __init__(self, kind, profile, payload, on_log, on_progress, on_finished, restarts=2):
+        self.kind = kind
+        self.profile = profile
+        self.payload = payload
+        self.on_log = on_log
+        self.on_progress = on_progress
+        self.on_finished = on_finished
+        self.restarts = max(0, int(restarts))
+        self.attempt = 0
+        self.stopped = False
+        self._ctx = multiprocessing.get_context("spawn")
+        self.process = None
+        self.channel = None
+        self.stop_event = None
+
+    def start(self):
+        self._spawn()
+        threading.Thread(target=self._pump, name=f"Pipe-{self.profile}", daemon=True).start()
+
+    def _spawn(self):
+        self.attempt += 1
+        self.channel = self._ctx.Queue()
+        self.stop_event = self._ctx.Event()
+        if self.stopped: self.stop_event.set()
+        self.process = self._ctx.Process(target=child_main, name=f"hh-{self.profile}", daemon=True,
+                                         args=(self.kind, self.profile, self.payload, self.channel, self.stop_event))
+        self.process.start()
+
+    def stop(self):
+        self.stopped = True
+        if self.stop_event: self.stop_event.set()
+        timer = threading.Timer(KILL_AFTER, self._kill)
+        timer.daemon = True
+        timer.start()
+
+    def _kill(self):
+        if self.process and self.process.is_alive():
+            logger.warning(f"[{self.profile}] Процесс не остановился за {KILL_AFTER:.0f} сек, завершаю принудительно.")
+            self.process.terminate()
+
+    def _handle(self, message):
+        kind = message[0]
+        if kind == "log":
+            self.on_log(message[1], message[2])
+        elif kind == "progress":
+            self.on_progress(message[1], message[2])
+        elif kind == "status":
+            return message[1]
+        return None
+
+    def _drain(self):
+        status = None
+        while True:
+            try:
+                status = self._handle(self.channel.get_nowait()) or status
+            except queue.Empty:
+                return status
+            except:
+                return status
+
+    def _pump(self):
+        status = None
+        while status is None:
+            try:
+                status = self._handle(self.channel.get(timeout=0.5))
+                continue
+            except queue.Empty:
+                pass
+            except:
+                # Канал порван (процесс убит посреди записи)
+                pass
+            if self.process.is_alive(): continue
+
+            status = self._drain()
+            if status is not None: break
+            code = self.process.exitcode
+            if self.stopped:
+                status = "stopped"
+            elif self.attempt <= self.restarts:
+                logger.warning(f"[{self.profile}] Процесс упал (код {code}), перезапуск "
+                               f"{self.attempt}/{self.restarts}...")
+                self._spawn()
+            else:
+                status = f"error: процесс завершился с кодом {code}"
+
+        self.process.join(timeout=STOP_GRACE)
+        self.on_finished(status)
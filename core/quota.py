@@ -0,0 +1,95 @@
+import time
+import random
+import logging
+from datetime import date
+
+logger = logging.getLogger("HH_Automation_bot")
+
+LONG_WAIT = 60  # Ожидания квоты дольше этого пишем в лог
+
+
+class QuotaLedger:
+    """
+    Суточная квота откликов аккаунта (hh.ru: 200 в сутки) и токен-бакет поверх нее.
+
+    Учет ведется в SQLite по профилю и дню, поэтому переживает перезапуски
+    и общий для всех режимов отклика. Бакет наполняется со скоростью
+    «суточная квота / активные часы», так что бюджет растягивается на день,
+    а запас (burst) позволяет начать запуск без ожидания.
+    """
+
+    def __init__(self, db, profile, daily_limit=200, burst=20, active_hours=14):
+        self.db = db
+        self.profile = profile
+        self.daily_limit = max(0, int(daily_limit))
+        self.capacity = max(1.0, float(burst))
+        self.rate = self.daily_limit / (max(1.0, float(active_hours)) * 3600)  # токенов в секунду
+        self.waited = 0.0
+        self.spent = 0
+
+        state = db.get_quota_bucket(profile)
+        if state:
+            self.tokens, self.updated = state
+        else:
+            self.tokens, self.updated = self.capacity, time.time()
+
+    @classmethod
+    def from_settings(cls, db, profile, settings_mgr):
+        return cls(db, profile,
+                   daily_limit=settings_mgr.get("daily_application_limit") or 200,
+                   burst=settings_mgr.get("quota_burst") or 20,
+                   active_hours=settings_mgr.get("quota_active_hours") or 14)
+
+    def _today(self):
+        return date.today().isoformat()
+
+    def used_today(self):
+        return self.db.get_quota_used(self.profile, self._today())
+
+    def remaining_today(self):
+        return max(0, self.daily_limit - self.used_today())
+
+    def _refill(self, now=None):
+        now = time.time() if now is None else now
+        self.tokens = min(self.capacity, self.tokens + max(0.0, now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self):
+        """Сколько секунд ждать до следующего токена (None - на сегодня квота исчерпана)."""
+        if self.remaining_today() <= 0: return None
+        self._refill()
+        if self.tokens >= 1 or self.rate <= 0: return 0.0
+        return (1 - self.tokens) / self.rate
+
+    async def wait_turn(self, engine):
+        """
+        Ждет токен перед очередным откликом. False - суточная квота исчерпана.
+        Ожидание - ровно до следующего токена с небольшим разбросом, чтобы отклики не шли по метроному.
+        """
+        wait = self.delay()
+        if wait is None:
+            engine.log(f"Суточная квота исчерпана ({self.daily_limit}). Остановка.", "warning")
+            return False
+        if wait <= 0: return True
+        wait *= random.uniform(1.0, 1.2)
+        if wait >= LONG_WAIT: engine.log(f"Квота: следующий отклик через {wait / 60:.1f} мин.")
+        with engine.tracer.span("quota_wait"):
+            await engine.smart_sleep(wait)
+        self.waited += wait
+        return True
+
+    def spend(self):
+        """Списывает отклик: токен бакета и единицу суточного учета."""
+        self._refill()
+        self.tokens = max(0.0, self.tokens - 1)
+        self.spent += 1
+        self.db.add_quota_use(self.profile, self._today(), self.tokens, self.updated)
+
+    def plan_run(self, requested):
+        """Сколько откликов можно сделать в этом запуске с учетом остатка на сегодня."""
+        return min(int(requested), self.remaining_today())
+
+    def summary(self):
+        used = self.used_today()
+        return (f"Квота: сегодня {used}/{self.daily_limit}, в этом запуске {self.spent}, "
+                f"ожидание квоты {self.waited:.0f} сек, в бакете {self.tokens:.1f}/{self.capacity:.0f}")
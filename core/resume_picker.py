@@ -0,0 +1,92 @@
+import logging
+
+logger = logging.getLogger("HH_Automation_bot")
+
+# Тексты всех пунктов списка резюме одним вызовом
+OPTION_TEXTS_JS = "els => els.map(e => (e.textContent || '').trim().toLowerCase())"
+
+# Выбор по позиции из кэша: если пункт не кликается за это время - кэш устарел (мс)
+CACHED_CHOOSE_TIMEOUT = 2000
+
+# Профиль -> {"target", "index"}: где в списке нужное резюме. Живет до конца сессии
+_cache = {}
+
+
+class ResumePicker:
+    """
+    Выбор резюме в окне отклика. Список резюме разбирается один раз на профиль,
+    дальше нужный пункт выбирается сразу по позиции. Если после выбора в заголовке
+    оказалось не то резюме - список поменялся, кэш сбрасывается и список разбирается заново.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.stats = {"active": 0, "cached": 0, "resolved": 0, "missing": 0}
+
+    def _selectors(self):
+        modal = self.engine.locators["response_modal"]
+        return modal["resume_trigger"], modal.get("resume_option", "[data-magritte-select-option]")
+
+    async def _header_text(self, header):
+        return ((await header.text_content()) or "").strip().lower()
+
+    async def _open(self, header, option_sel):
+        await header.click(force=True)
+        return await self.engine.waits.selector("resume_options", option_sel)
+
+    async def _choose(self, option, timeout=None):
+        await option.scroll_into_view_if_needed(timeout=timeout)
+        await option.click(force=True, timeout=timeout)
+        await self.engine.waits.locator("resume_options", option, state="hidden")
+
+    async def pick(self, modal, target):
+        """True - нужное резюме выбрано (или уже было выбрано)."""
+        trigger_sel, option_sel = self._selectors()
+        header = modal.locator(trigger_sel).first
+        if not await header.is_visible(): return False
+
+        curr_text = await self._header_text(header)
+        if target in curr_text:
+            self.stats["active"] += 1
+            return True
+
+        self.engine.log(f"Смена резюме: {curr_text} -> {target}")
+        if not await self._open(header, option_sel): return False
+        options = self.engine.page.locator(option_sel)
+        profile = self.engine.profile_name
+
+        # 1. Позиция уже известна - выбираем сразу и проверяем по заголовку
+        entry = _cache.get(profile)
+        if entry and entry["target"] == target:
+            try:
+                # Список мог сократиться - позиции за его концом уже нет
+                if entry["index"] < await options.count():
+                    await self._choose(options.nth(entry["index"]), CACHED_CHOOSE_TIMEOUT)
+                    if target in await self._header_text(header):
+                        self.stats["cached"] += 1
+                        return True
+            except Exception as e:
+                if self.engine.token.cancelled or "Target closed" in str(e): raise e
+                logger.debug(f"Cached resume pick error: {e}")
+            _cache.pop(profile, None)
+            self.engine.log("Список резюме изменился, перечитываю.", "warning")
+            if not await options.first.is_visible() and not await self._open(header, option_sel): return False
+
+        # 2. Разбор списка одним вызовом
+        texts = await options.evaluate_all(OPTION_TEXTS_JS)
+        for index, text in enumerate(texts):
+            if target in text:
+                _cache[profile] = {"target": target, "index": index}
+                await self._choose(options.nth(index))
+                self.stats["resolved"] += 1
+                return True
+
+        self.stats["missing"] += 1
+        await header.click(force=True)
+        return False
+
+    def summary(self):
+        if not any(self.stats.values()): return None
+        s = self.stats
+        return (f"Резюме: уже выбрано {s['active']}, из кэша {s['cached']}, "
+                f"поиском по списку {s['resolved']}, не найдено {s['missing']}")
@@ -0,0 +1,123 @@
+import asyncio
+import threading
+import logging
+
+from core.settings_manager import SettingsManager
+
+logger = logging.getLogger("HH_Automation_bot")
+
+_runtime = None
+_runtime_lock = threading.Lock()
+
+
+def get_runtime():
+    """Общий рантайм движка (один на процесс)."""
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = EngineRuntime()
+        return _runtime
+
+
+class ProfileSlots:
+    """
+    Лимит одновременно работающих профилей, который можно менять на ходу.
+    В отличие от замены семафора, уже занятые слоты продолжают учитываться при новом лимите.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.active = 0
+        self._cond = None
+
+    def _condition(self):
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        return self._cond
+
+    def resize(self, limit):
+        grew = limit > self.limit
+        self.limit = limit
+        # Лимит вырос - будим ожидающих (вызывается внутри цикла движка)
+        if grew: asyncio.get_running_loop().create_task(self._wake())
+
+    async def _wake(self):
+        cond = self._condition()
+        async with cond:
+            cond.notify_all()
+
+    def locked(self):
+        return self.active >= self.limit
+
+    async def __aenter__(self):
+        cond = self._condition()
+        async with cond:
+            await cond.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+        return self
+
+    async def __aexit__(self, *exc):
+        cond = self._condition()
+        async with cond:
+            self.active -= 1
+            cond.notify_all()
+
+
+class EngineRuntime:
+    """
+    Один asyncio-цикл в фоновом потоке, на котором крутятся все профили.
+    Держит единственный драйвер Playwright и ограничивает число одновременных запусков.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.playwright = None
+        self.pool = None
+        self._pw_lock = None
+        self._slots = None
+        self._thread = threading.Thread(target=self._run_loop, name="EngineLoop", daemon=True)
+        self._thread.start()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro):
+        """Запускает корутину на цикле движка. Возвращает concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    async def get_playwright(self):
+        # Драйвер Playwright один на все профили
+        if self._pw_lock is None:
+            self._pw_lock = asyncio.Lock()
+        async with self._pw_lock:
+            if self.playwright is None:
+                from playwright.async_api import async_playwright
+                self.playwright = await async_playwright().start()
+        return self.playwright
+
+    def get_pool(self):
+        """Пул браузеров, из которого профили арендуют контексты."""
+        if self.pool is None:
+            from core.browser_pool import BrowserPool
+            self.pool = BrowserPool(self)
+        return self.pool
+
+    def slot(self):
+        """Ограничитель числа одновременно работающих профилей (лимит перечитывается при каждом запуске)."""
+        limit = max(1, int(SettingsManager().get("max_parallel_profiles") or 1))
+        if self._slots is None:
+            self._slots = ProfileSlots(limit)
+        elif self._slots.limit != limit:
+            self._slots.resize(limit)
+        return self._slots
+
+    async def shutdown(self):
+        if self.pool:
+            await self.pool.close_all()
+        if self.playwright:
+            try:
+                await self.playwright.stop()
+            except:
+                pass
+            self.playwright = None
@@ -0,0 +1,163 @@
+import heapq
+import itertools
+import logging
+import os
+import time
+
+logger = logging.getLogger("HH_Automation_bot")
+
+PRIORITY_HIGH = 10  # Запуск кнопкой - вперед очереди
+PRIORITY_NORMAL = 0
+CPU_PER_PROFILE = 1.0  # Ядер на профиль (рендерер Chromium + своя доля цикла движка)
+
+
+def available_memory_mb():
+    """Свободная память в МБ или None, если узнать нечем."""
+    try:
+        import psutil
+        return psutil.virtual_memory().available / 1024 / 1024
+    except ImportError:
+        pass
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except:
+        pass
+    return None
+
+
+class Job:
+    __slots__ = ("id", "kind", "profile", "payload", "priority", "label", "notify", "queued_at", "started_at",
+                 "worker")
+
+    def __init__(self, job_id, kind, profile, payload, priority, label, notify):
+        self.id = job_id
+        self.kind = kind  # "search" / "activity"
+        self.profile = profile
+        self.payload = payload
+        self.priority = priority
+        self.label = label or kind
+        self.notify = notify  # Показывать окно по завершении (для запусков кнопкой)
+        self.queued_at = time.time()
+        self.started_at = None
+        self.worker = None
+
+    def __repr__(self):
+        return f"[{self.profile}] {self.label}"
+
+
+class JobScheduler:
+    """
+    Очередь запусков (профиль + пресет / активность).
+    - приоритеты: больший приоритет раньше, при равных - в порядке постановки;
+    - на профиль не больше одной задачи одновременно (одна сессия hh.ru);
+    - общий лимит: max_parallel_profiles (1 без мульти-аккаунта), урезанный по ядрам и свободной памяти;
+    - освободился слот - следующая подходящая задача стартует сама.
+
+    launch(job) создает и запускает воркер (у него должен быть stop()).
+    Владелец вызывает finished(job) по завершении воркера. Все вызовы - из одного потока (GUI).
+    """
+
+    def __init__(self, launch, settings_mgr):
+        self.launch = launch
+        self.settings_mgr = settings_mgr
+        self._ids = itertools.count(1)
+        self._heap = []  # (-priority, id, job)
+        self.running = {}  # profile -> Job
+        self.done = 0
+        self.peak = 0
+
+    # === ЛИМИТЫ ===
+    def capacity(self):
+        """Сколько задач можно держать запущенными прямо сейчас."""
+        limit = self.settings_mgr.get("max_parallel_profiles") or 1
+        if not self.settings_mgr.get("enable_multi_account"): limit = 1
+        if self.settings_mgr.get("scheduler_auto_capacity") is False: return max(1, int(limit))
+
+        cpu_limit = int((os.cpu_count() or 1) / CPU_PER_PROFILE)
+        limit = min(limit, cpu_limit)
+        free_mb = available_memory_mb()
+        if free_mb is not None:
+            per_profile = float(self.settings_mgr.get("scheduler_ram_per_profile_mb") or 500)
+            # Уже запущенные профили свою память заняли - смотрим, сколько еще влезет
+            limit = min(limit, len(self.running) + int(free_mb // per_profile))
+        return max(1, int(limit))
+
+    # === ОЧЕРЕДЬ ===
+    def submit(self, kind, profile, payload, priority=PRIORITY_NORMAL, label=None, notify=False):
+        job = Job(next(self._ids), kind, profile, payload, priority, label, notify)
+        heapq.heappush(self._heap, (-priority, job.id, job))
+        self.pump()
+        if job.worker is None:
+            logger.info(f"В очереди ({self.position(job)}/{len(self._heap)}): {job}")
+        return job
+
+    def position(self, job):
+        order = sorted(self._heap)
+        for pos, (_, _, queued) in enumerate(order, 1):
+            if queued is job: return pos
+        return 0
+
+    def queued(self):
+        return [job for _, _, job in sorted(self._heap)]
+
+    def cancel(self, job):
+        """Убирает задачу из очереди (запущенную останавливает)."""
+        if job.worker is not None:
+            job.worker.stop()
+            return
+        self._heap = [entry for entry in self._heap if entry[2] is not job]
+        heapq.heapify(self._heap)
+
+    def clear(self):
+        self._heap = []
+
+    def running_job(self, profile, kind=None):
+        job = self.running.get(profile)
+        if job and (kind is None or job.kind == kind): return job
+        return None
+
+    def stop(self, profile, kind=None):
+        job = self.running_job(profile, kind)
+        if job: job.worker.stop()
+        return job
+
+    def pump(self):
+        """Запускает все задачи, для которых есть слот и свободный профиль."""
+        if not self._heap: return
+        capacity = self.capacity()
+        skipped = []
+        while self._heap and len(self.running) < capacity:
+            entry = heapq.heappop(self._heap)
+            job = entry[2]
+            if job.profile in self.running:
+                # Профиль занят - задача ждет, следующие по приоритету могут идти
+                skipped.append(entry)
+                continue
+            self._start(job)
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
+
+    def _start(self, job):
+        job.started_at = time.time()
+        self.running[job.profile] = job
+        self.peak = max(self.peak, len(self.running))
+        waited = job.started_at - job.queued_at
+        if waited >= 1: logger.info(f"Из очереди (ждала {waited / 60:.1f} мин): {job}")
+        try:
+            job.worker = self.launch(job)
+        except Exception as e:
+            logger.error(f"Не удалось запустить {job}: {e}")
+            self.running.pop(job.profile, None)
+
+    def finished(self, job):
+        if self.running.get(job.profile) is job: del self.running[job.profile]
+        self.done += 1
+        self.pump()
+        if not self.running and not self._heap and self.done > 1: logger.info(self.summary())
+
+    def summary(self):
+        return (f"Планировщик: выполнено {self.done}, в работе {len(self.running)}, в очереди {len(self._heap)}, "
+                f"одновременно до {self.peak} (лимит сейчас {self.capacity()})")
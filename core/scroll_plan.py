@@ -0,0 +1,72 @@
+import random
+
+EDGE_MARGIN = 100      # Элемент считается видимым, если он дальше этого от краев окна
+MAX_STEPS = 50         # Как и раньше: не больше 50 прокруток на одну цель
+BATCH_STEPS = 12       # Шагов колеса между замерами
+SHIFT_TOLERANCE = 40   # На сколько px элемент может «уехать», прежде чем перемерять
+MAX_REPLANS = 3
+
+# Один замер: где элемент относительно окна и где сама страница
+MEASURE_JS = """
+el => {
+  const r = el.getBoundingClientRect();
+  if (!r.width && !r.height) return null;
+  const root = document.scrollingElement || document.documentElement;
+  return {top: r.top, vh: window.innerHeight, y: window.scrollY, maxY: root.scrollHeight - window.innerHeight};
+}
+"""
+
+
+def in_view(top, viewport_h):
+    return EDGE_MARGIN < top < viewport_h - EDGE_MARGIN
+
+
+def at_edge(m, direction):
+    """Страница уперлась в край в сторону прокрутки - дальше колесо ничего не сдвинет."""
+    return m["y"] >= m["maxY"] - 2 if direction > 0 else m["y"] <= 0
+
+
+def plan_random(distance, s_min, s_max, rng=random):
+    """Прежнее поведение: рывки случайной силы из [s_min, s_max], пауза 50-150 мс."""
+    steps = []
+    left = abs(distance)
+    sign = 1 if distance > 0 else -1
+    while left > 0 and len(steps) < MAX_STEPS:
+        amount = min(left, rng.randint(int(s_min), int(s_max)))
+        steps.append((sign * amount, int(rng.uniform(0.05, 0.15) * 1000)))
+        left -= amount
+    return steps
+
+
+def plan_smooth(distance, s_min, s_max, rng=random):
+    """
+    Инерционная прокрутка как с тачпада/колеса: серия «взмахов»,
+    в каждом шаги затухают, между взмахами короткая пауза.
+    """
+    steps = []
+    left = abs(distance)
+    sign = 1 if distance > 0 else -1
+    while left > 0 and len(steps) < MAX_STEPS:
+        amount = rng.uniform(s_min, s_max)
+        decay = rng.uniform(0.55, 0.75)
+        while amount >= 8 and left > 0 and len(steps) < MAX_STEPS:
+            step = int(min(left, amount))
+            steps.append((sign * step, int(rng.uniform(16, 35))))
+            left -= step
+            amount *= decay
+        if steps:
+            # Пауза между взмахами вешается на последний шаг взмаха
+            dy, delay = steps[-1]
+            steps[-1] = (dy, delay + int(rng.uniform(80, 200)))
+    return steps
+
+
+PLANNERS = {
+    "smooth": plan_smooth,
+    "random": plan_random,
+}
+
+
+def target_distance(top, viewport_h, rng=random):
+    """Сколько крутить, чтобы элемент оказался в верхней половине окна."""
+    return int(top - viewport_h * rng.uniform(0.25, 0.45))
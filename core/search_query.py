@@ -0,0 +1,30 @@
+from urllib.parse import urlencode
+
+from core.config import HH_BASE_URL
+
+AREA_MAP = {"Москва": "1", "Санкт-Петербург": "2", "Все регионы": "113"}
+
+
+def build_search_params(data):
+    """Параметры поиска hh.ru из данных вкладки «Отклики» (список пар ключ-значение)."""
+    query_params = []
+
+    query_params.append(("text", data.get('text', '')))
+    excl = data.get('excluded_text', '')
+    if excl: query_params.append(("excluded_text", excl))
+    if data.get('salary'):
+        query_params.append(("salary", data.get('salary')))
+        query_params.append(("only_with_salary", "true"))
+
+    query_params.append(("area", AREA_MAP.get(data.get('area'), "113")))
+    query_params.append(("items_on_page", "100"))
+
+    for key in ['work_format', 'employment_form', 'experience', 'education', 'label']:
+        for val in data.get(key, []): query_params.append((key, val))
+    return query_params
+
+
+def build_search_url(query_params, page=None):
+    params = list(query_params)
+    if page: params.append(("page", str(page)))
+    return f"{HH_BASE_URL}/search/vacancy?{urlencode(params)}"
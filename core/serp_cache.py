@@ -0,0 +1,134 @@
+import logging
+from datetime import datetime, timedelta
+from urllib.parse import urlencode
+
+logger = logging.getLogger("HH_Automation_bot")
+
+# Не влияют на набор вакансий - в ключ кэша не входят
+IGNORED_PARAMS = {"page", "items_on_page", "order_by", "hhtmFrom", "hhtmFromLabel"}
+ORDER = ("order_by", "publication_time")
+
+
+def canonical_query(query_params):
+    """Ключ кэша: параметры поиска без страницы и размера страницы, отсортированные."""
+    items = sorted((k, str(v).strip()) for k, v in query_params if k not in IGNORED_PARAMS)
+    return urlencode(items)
+
+
+def _id_num(card):
+    try:
+        return int(card.get("id") or 0)
+    except ValueError:
+        return 0
+
+
+class SerpCache:
+    """
+    Кэш собранной выдачи между запусками (таблица serp_cache).
+    Выдача запрашивается по дате публикации, поэтому новые вакансии всегда сверху:
+    при повторном запуске докачиваются только первые страницы - до первой уже известной вакансии
+    или вакансии не новее водяного знака (максимальный id на момент прошлого сбора).
+    """
+
+    def __init__(self, db, ttl_hours, log=None):
+        self.db = db
+        self.ttl = timedelta(hours=float(ttl_hours))
+        self.log = log or logger.info
+        self.key = None
+        self.records = []
+        self.watermark = 0
+        self.pages = 0
+        self.complete = False
+        self.fetched_at = None
+        self.hits = 0
+        self.misses = 0
+        self.pages_fetched = 0
+
+    def _ordered(self, query_params):
+        params = [p for p in query_params if p[0] != "order_by"]
+        params.append(ORDER)
+        return params
+
+    def _load(self):
+        entry = self.db.get_serp_cache(self.key)
+        if not entry: return False
+        fetched_at, watermark, pages, complete, records = entry
+        if datetime.now() - fetched_at > self.ttl:
+            self.log("Кэш выдачи устарел, собираю заново.")
+            return False
+        self.records, self.watermark, self.pages, self.complete = records, watermark, pages, complete
+        # TTL считается от полного сбора, докачка новых вакансий его не продлевает
+        self.fetched_at = fetched_at
+        return True
+
+    async def harvest(self, harvester, query_params, max_pages=20):
+        """Тот же поток карточек, что и harvester.harvest, но с кэшем."""
+        self.key = canonical_query(query_params)
+        params = self._ordered(query_params)
+
+        if not self._load():
+            self.records, self.watermark, self.pages, self.complete = [], 0, 0, False
+            self.fetched_at = None
+            async for card in self._walk(harvester, params, 0, max_pages):
+                yield card
+            return
+
+        # 1. Новые вакансии с начала выдачи, пока не встретим известную
+        known = {c["id"] for c in self.records if c.get("id")}
+        fresh = []
+        for page in range(max_pages):
+            cards, has_next = await harvester.fetch_page(params, page)
+            self.pages_fetched += 1
+            new = [c for c in cards if c.get("id") and c["id"] not in known and _id_num(c) > self.watermark]
+            fresh.extend(new)
+            if len(new) < len(cards) or not has_next: break
+        self.misses += len(fresh)
+        self.log(f"Кэш выдачи: новых вакансий {len(fresh)}, из кэша {len(self.records)}")
+        cached = self.records
+        self.records = fresh + cached
+        self.watermark = max([self.watermark] + [_id_num(c) for c in fresh])
+        for card in fresh:
+            yield card
+
+        # 2. Кэшированные кандидаты - без запросов
+        for card in cached:
+            self.hits += 1
+            yield card
+
+        # 3. Прошлый сбор оборвался (лимит откликов) - дособираем хвост
+        if not self.complete and self.pages < max_pages:
+            async for card in self._walk(harvester, params, self.pages, max_pages - self.pages):
+                yield card
+
+    async def _walk(self, harvester, params, start_page, max_pages):
+        self.complete = False
+        known = {c["id"] for c in self.records if c.get("id")}
+        page = start_page
+        while page < start_page + max_pages:
+            cards, has_next = await harvester.fetch_page(params, page)
+            self.pages_fetched += 1
+            self.pages = page + 1
+            harvester.log(f"Сбор выдачи: стр. {page + 1}, карточек {len(cards)}")
+            # При дособоре хвоста страницы могли сдвинуться - повторы отбрасываем
+            new = [c for c in cards if not c.get("id") or c["id"] not in known]
+            known.update(c["id"] for c in new if c.get("id"))
+            self.records.extend(new)
+            self.watermark = max([self.watermark] + [_id_num(c) for c in new])
+            self.misses += len(new)
+            for card in new:
+                yield card
+            if not cards or not has_next:
+                self.complete = True
+                break
+            page += 1
+
+    def store(self):
+        """Сохраняет то, что удалось собрать (вызывается и при досрочном выходе)."""
+        if self.key is None or not self.records: return
+        self.db.save_serp_cache(self.key, self.watermark, self.pages, self.complete, self.records, self.fetched_at)
+
+    def summary(self):
+        total = self.hits + self.misses
+        if not total: return None
+        return (f"Кэш выдачи: попаданий {self.hits}/{total} ({self.hits / total * 100:.0f}%), "
+                f"запрошено страниц {self.pages_fetched}")
@@ -0,0 +1,55 @@
+import re
+
+VACANCY_ID_RE = re.compile(r"/vacancy/(\d+)")
+
+# Один проход по DOM: все карточки страницы за один page.evaluate
+EXTRACT_CARDS_JS = """
+(sel) => {
+    const visible = (el) => !!el && el.getClientRects().length > 0;
+    const text = (el) => el ? el.textContent.replace(/\\u00a0/g, ' ').trim() : '';
+    const idRe = /\\/vacancy\\/(\\d+)/;
+    return Array.from(document.querySelectorAll(sel.card)).map((card, index) => {
+        const title = card.querySelector(sel.title);
+        const company = card.querySelector(sel.company);
+        const salary = card.querySelector(sel.salary);
+        const apply = card.querySelector(sel.apply);
+        const href = title ? title.href || title.getAttribute('href') || '' : '';
+        const m = href.match(idRe);
+        return {
+            index: index,
+            id: m ? m[1] : null,
+            title: visible(title) ? text(title) : 'Vacancy',
+            company: visible(company) ? text(company) : 'Company',
+            url: href,
+            salary: salary ? text(salary) : '',
+            responded: !!card.querySelector(sel.responded),
+            has_apply: visible(apply),
+        };
+    });
+}
+"""
+
+
+def card_selectors(locators):
+    sp = locators.get("search_page", {})
+    return {
+        "card": sp.get("vacancy_card", "[data-qa='vacancy-serp__vacancy']"),
+        "title": sp.get("card_title", "a[data-qa='serp-item__title']"),
+        "company": sp.get("card_company", "a[data-qa='vacancy-serp__vacancy-employer']"),
+        "salary": sp.get("card_salary", "[data-qa='vacancy-serp__vacancy-compensation']"),
+        "apply": sp.get("apply_button", "[data-qa='vacancy-serp__vacancy_response']"),
+        "responded": sp.get("already_applied", ".vacancy-serp-item__response_already-responded"),
+    }
+
+
+async def extract_cards(page, locators):
+    """
+    Возвращает компактные записи по всем карточкам выдачи:
+    index, id, title, company, url, salary, responded, has_apply.
+    """
+    return await page.evaluate(EXTRACT_CARDS_JS, card_selectors(locators))
+
+
+def vacancy_id_from_url(url):
+    m = VACANCY_ID_RE.search(url or "")
+    return m.group(1) if m else None
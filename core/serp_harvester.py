@@ -0,0 +1,170 @@
+import re
+import time
+import logging
+from html.parser import HTMLParser
+
+from core.search_query import build_search_url
+from core.serp_extractor import vacancy_id_from_url
+from core.config import HH_BASE_URL
+
+logger = logging.getLogger("HH_Automation_bot")
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input",
+             "link", "meta", "source", "track", "wbr"}
+
+_QA_RE = re.compile(r"data-qa\s*[*^]?=\s*['\"]([^'\"]+)['\"]")
+_CLASS_RE = re.compile(r"^\.([\w-]+)$")
+
+
+def _matcher(selector):
+    """
+    Превращает CSS-локатор из locators.json в проверку атрибутов тега.
+    Поддерживаются формы [data-qa='x'], tag[data-qa='x'] и .class - этого хватает для выдачи.
+    """
+    m = _QA_RE.search(selector)
+    if m:
+        value = m.group(1)
+        return lambda attrs: value in (attrs.get("data-qa") or "").split()
+    m = _CLASS_RE.match(selector.strip())
+    if m:
+        value = m.group(1)
+        return lambda attrs: value in (attrs.get("class") or "").split()
+    return lambda attrs: False
+
+
+class SerpCardParser(HTMLParser):
+    """
+    Потоковый разбор HTML выдачи без построения DOM.
+    На выходе те же записи, что и у core/serp_extractor.py.
+    """
+
+    FIELDS = ("title", "company", "salary")
+
+    def __init__(self, locators):
+        super().__init__(convert_charrefs=True)
+        sp = locators.get("search_page", {})
+        self.is_card = _matcher(sp.get("vacancy_card", "[data-qa='vacancy-serp__vacancy']"))
+        self.is_apply = _matcher(sp.get("apply_button", "[data-qa='vacancy-serp__vacancy_response']"))
+        self.is_responded = _matcher(sp.get("already_applied", ".vacancy-serp-item__response_already-responded"))
+        self.is_next = _matcher(sp.get("pager_next", "[data-qa='pager-next']"))
+        self.field_matchers = {
+            "title": _matcher(sp.get("card_title", "a[data-qa='serp-item__title']")),
+            "company": _matcher(sp.get("card_company", "a[data-qa='vacancy-serp__vacancy-employer']")),
+            "salary": _matcher(sp.get("card_salary", "[data-qa='vacancy-serp__vacancy-compensation']")),
+        }
+
+        self.cards = []
+        self.next_url = None
+        self._card = None
+        self._depth = 0
+        self._field = None
+        self._field_depth = 0
+        self._text = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        void = tag in VOID_TAGS
+
+        if self._card is None:
+            if self.is_next(attrs) and attrs.get("href"):
+                self.next_url = attrs["href"]
+            if self.is_card(attrs) and not void:
+                self._card = {"index": len(self.cards), "id": None, "title": "Vacancy",
+                              "company": "Company", "url": "", "salary": "",
+                              "responded": False, "has_apply": False}
+                self._depth = 1
+            return
+
+        if not void: self._depth += 1
+        if self._field:
+            if not void: self._field_depth += 1
+            return
+
+        if self.is_apply(attrs): self._card["has_apply"] = True
+        if self.is_responded(attrs): self._card["responded"] = True
+        for name in self.FIELDS:
+            if self.field_matchers[name](attrs):
+                if name == "title" and attrs.get("href"):
+                    self._card["url"] = attrs["href"]
+                if not void:
+                    self._field = name
+                    self._field_depth = 1
+                    self._text = []
+                break
+
+    def handle_endtag(self, tag):
+        if self._card is None or tag in VOID_TAGS: return
+
+        if self._field:
+            self._field_depth -= 1
+            if self._field_depth == 0:
+                value = " ".join("".join(self._text).replace("\u00a0", " ").split())
+                if value: self._card[self._field] = value
+                self._field = None
+
+        self._depth -= 1
+        if self._depth == 0:
+            card = self._card
+            card["id"] = vacancy_id_from_url(card["url"])
+            self.cards.append(card)
+            self._card = None
+
+    def handle_data(self, data):
+        if self._field: self._text.append(data)
+
+
+def parse_serp(html, locators):
+    """Возвращает (записи карточек, ссылка на следующую страницу или None)."""
+    parser = SerpCardParser(locators)
+    parser.feed(html)
+    parser.close()
+    return parser.cards, parser.next_url
+
+
+class SerpHarvester:
+    """
+    Сбор вакансий без рендера: страницы выдачи качаются через HTTP
+    с куками профиля (context.request) и разбираются парсером.
+    Браузер остается только для самого отклика.
+    """
+
+    def __init__(self, request, locators, log=None):
+        self.request = request  # APIRequestContext (context.request) - общие куки с браузером
+        self.locators = locators
+        self.log = log or logger.info
+        self.pages_fetched = 0
+        self.bytes_fetched = 0
+        self.fetch_seconds = 0.0
+
+    async def fetch_page(self, query_params, page=0):
+        url = build_search_url(query_params, page)
+        started = time.monotonic()
+        response = await self.request.get(url, headers={"Accept": "text/html"})
+        if not response.ok:
+            raise RuntimeError(f"SERP HTTP {response.status}: {url}")
+        html = await response.text()
+        self.fetch_seconds += time.monotonic() - started
+        self.pages_fetched += 1
+        self.bytes_fetched += len(html)
+
+        cards, next_url = parse_serp(html, self.locators)
+        for card in cards:
+            card["page"] = page
+            if card["url"].startswith("/"): card["url"] = HH_BASE_URL + card["url"]
+        return cards, next_url is not None
+
+    async def harvest(self, query_params, max_pages=20, start_page=0):
+        """Асинхронный генератор записей вакансий по всем страницам выдачи."""
+        page = start_page
+        while page < start_page + max_pages:
+            cards, has_next = await self.fetch_page(query_params, page)
+            self.log(f"Сбор выдачи: стр. {page + 1}, карточек {len(cards)}")
+            for card in cards:
+                yield card
+            if not cards or not has_next: break
+            page += 1
+
+    def summary(self):
+        if not self.pages_fetched: return None
+        return (f"Сбор выдачи: {self.pages_fetched} стр., {self.bytes_fetched / 1024:.0f} КБ "
+                f"за {self.fetch_seconds:.2f} сек")
@@ -0,0 +1,105 @@
+import asyncio
+import logging
+from urllib.parse import urljoin
+
+from core.serp_extractor import extract_cards
+
+logger = logging.getLogger("HH_Automation_bot")
+
+
+class PrefetchedPage:
+    def __init__(self, page, cards, next_url):
+        self.page = page
+        self.cards = cards
+        self.next_url = next_url
+
+
+class SerpPrefetcher:
+    """
+    Пока движок работает со страницей N, следующие страницы выдачи грузятся
+    фоновыми вкладками того же контекста и сразу разбираются extract_cards.
+    Переход на следующую страницу сводится к подмене вкладки.
+    """
+
+    def __init__(self, engine, depth=1):
+        self.engine = engine
+        self.depth = max(0, int(depth))
+        self.queue = []
+        self.exhausted = False
+
+    async def _next_url(self, page):
+        try:
+            next_btn = page.locator(self.engine.locators["search_page"]["pager_next"]).first
+            if not await next_btn.count(): return None
+            href = await next_btn.get_attribute("href")
+        except Exception as e:
+            if "Target closed" in str(e) or "browser has been closed" in str(e): raise e
+            return None
+        return urljoin(page.url, href) if href else None
+
+    async def _load(self, url):
+        page = await self.engine.context.new_page()
+        try:
+            if self.engine.settings_mgr.get("use_stealth") is not False:
+                await self.engine._enable_stealth(page)
+            await page.goto(url, wait_until="domcontentloaded")
+            cards = await extract_cards(page, self.engine.locators)
+            return PrefetchedPage(page, cards, await self._next_url(page))
+        except BaseException:
+            try:
+                await page.close()
+            except:
+                pass
+            raise
+
+    async def _load_after(self, prev_task):
+        prev = await prev_task
+        if not prev or not prev.next_url: return None
+        return await self._load(prev.next_url)
+
+    async def fill(self, current_page):
+        """Дозаполняет очередь до depth страниц вперед."""
+        if self.depth == 0 or self.exhausted: return
+        while len(self.queue) < self.depth:
+            if self.queue:
+                task = asyncio.create_task(self._load_after(self.queue[-1]))
+            else:
+                url = await self._next_url(current_page)
+                if not url:
+                    self.exhausted = True
+                    return
+                task = asyncio.create_task(self._load(url))
+            self.queue.append(task)
+
+    async def take(self):
+        """Следующая страница (PrefetchedPage) или None, если выдача закончилась."""
+        while self.queue:
+            task = self.queue.pop(0)
+            try:
+                result = await task
+            except Exception as e:
+                if "Target closed" in str(e) or "browser has been closed" in str(e): raise e
+                logger.debug(f"Prefetch error: {e}")
+                result = None
+            if result is None:
+                self.exhausted = True
+                await self.close()
+                return None
+            return result
+        return None
+
+    async def close(self):
+        """Отменяет фоновые загрузки и закрывает вкладки, которые не пригодились."""
+        tasks, self.queue = self.queue, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                result = await task
+            except BaseException:
+                continue
+            if result:
+                try:
+                    await result.page.close()
+                except:
+                    pass
@@ -8,10 +8,42 @@ DEFAULT_SETTINGS = {
     "current_profile": "",
     "openai_api_key": "",
     "limit_applications": 50,
+    "daily_application_limit": 200,  # Суточная квота hh.ru на аккаунт (core/quota.py)
+    "quota_burst": 20,  # Откликов подряд без ожидания квоты
+    "quota_active_hours": 14,  # На сколько часов растягивать суточную квоту
     "limit_messages": 20,
     "enable_multi_account": False,
+    "max_parallel_profiles": 4,  # Сколько профилей одновременно крутится на одном цикле движка
+    "scheduler_auto_capacity": True,  # Урезать параллельность очереди по ядрам и свободной памяти
+    "scheduler_ram_per_profile_mb": 500,  # Сколько памяти закладывать на один профиль
+
+    # Пул браузеров: профили арендуют контексты в общих процессах Chromium
+    "pool_max_browsers": 2,
+    "pool_contexts_per_browser": 5,
+    "pool_recycle_after": 30,  # Перезапуск браузера после N аренд
+    "prewarm_browsers": True,  # Запускать браузер заранее при открытии окна
+    "browser_channel": "chrome",  # "chrome" - установленный Chrome, "" - Chromium из комплекта Playwright
+
+    # Фильтр сети: off / light (картинки, шрифты, медиа) / aggressive
+    "block_resources": "off",
+    "blocked_url_patterns": None,  # None = список аналитики по умолчанию (core/network_filter.py)
+
+    # Выдача: render - листаем страницы в браузере, harvest - собираем HTTP-запросами
+    "serp_mode": "render",
+    "prefetch_depth": 1,  # Сколько страниц выдачи грузить заранее фоновыми вкладками (0 - выкл)
+    "serp_cache_ttl_hours": 12,  # Срок жизни кэша собранной выдачи (harvest), 0 - без кэша
+    # Отклик: modal - через окно отклика, http - прямым запросом (с откатом на модалку)
+    "apply_transport": "modal",
+    # Паузы «как человек» поверх ожиданий по событиям (False - только ожидания, для бенчмарков)
+    "human_pacing": True,
+    # Трассировка шагов: off / sqlite (таблица trace_spans) / jsonl (user_data/traces.jsonl)
+    "trace_sink": "sqlite",
+    # Где крутятся профили: thread - общий цикл в процессе GUI, process - свой процесс на профиль
+    "worker_mode": "thread",
+    "worker_restarts": 2,  # Перезапусков упавшего процесса профиля (режим process)
     "use_stealth": True,
     "use_human_moves": True,
+    "human_mouse": True,  # Курсор к кнопке по кривой (через CDP) перед кликом
 
     # === НОВОЕ: Скрытый режим ===
     "headless_mode": False,
@@ -23,6 +55,7 @@ DEFAULT_SETTINGS = {
     # Печать
     "typing_speed_min": 0.05,
     "typing_speed_max": 0.20,
+    "typing_chunk": 10,  # Символов за шаг ввода: кусок - одно сообщение CDP, 1 - посимвольно (2 сообщения на символ)
     "page_stay_time": 3.0,
 
     # Скролл
@@ -58,4 +91,8 @@ class SettingsManager:
 
     def set(self, key, value):
         self.settings[key] = value
-        self.save_settings()
\ No newline at end of file
+        self.save_settings()
+
+    def override(self, **values):
+        """Временные значения только для этого экземпляра, без записи в файл (CLI)."""
+        self.settings = {**self.settings, **values}
\ No newline at end of file
@@ -0,0 +1,47 @@
+import json
+import os
+import time
+import logging
+
+logger = logging.getLogger("HH_Automation_bot")
+
+# Импортируется первым в main.py - отсюда считается время старта
+T0 = time.perf_counter()
+
+# Куда записать отчет (JSON) и выйти ли сразу после первой отрисовки - для tools/bench_startup.py
+REPORT_ENV = "HH_BOT_STARTUP_REPORT"
+EXIT_ENV = "HH_BOT_EXIT_AFTER_PAINT"
+
+_marks = []  # (этап, секунд от T0)
+
+
+def mark(stage):
+    _marks.append((stage, time.perf_counter() - T0))
+
+
+def report():
+    """Этапы старта: длительность каждого и итог до первой отрисовки."""
+    stages, prev = {}, 0.0
+    for stage, at in _marks:
+        stages[stage] = round(at - prev, 3)
+        prev = at
+    return {"stages": stages, "total": round(prev, 3)}
+
+
+def finish():
+    """Вызывается после первой отрисовки окна: лог и, если попросили, файл отчета."""
+    mark("first_paint")
+    data = report()
+    parts = ", ".join(f"{stage} {sec:.2f}" for stage, sec in data["stages"].items())
+    logger.info(f"Старт интерфейса: {data['total']:.2f} сек ({parts})")
+    path = os.environ.get(REPORT_ENV)
+    if path:
+        try:
+            with open(path, "w", encoding="utf-8") as f: json.dump(data, f)
+        except Exception as e:
+            logger.error(f"Startup report error: {e}")
+    return data
+
+
+def exit_after_paint():
+    return bool(os.environ.get(EXIT_ENV))
@@ -0,0 +1,138 @@
+import asyncio
+import json
+import time
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+
+from core.waits import percentile
+
+logger = logging.getLogger("HH_Automation_bot")
+
+FLUSH_EVERY = 200  # Спанов в буфере до записи в приемник
+
+
+class Span:
+    __slots__ = ("step", "vacancy_id", "outcome", "started", "duration_ms")
+
+    def __init__(self, step, vacancy_id, outcome):
+        self.step = step
+        self.vacancy_id = vacancy_id
+        self.outcome = outcome
+        self.started = time.time()
+        self.duration_ms = 0.0
+
+
+class JsonlSink:
+    """Спаны построчно в JSON-файл (удобно смотреть и грузить куда угодно)."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, rows):
+        with open(self.path, "a", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+class SqliteSink:
+    """Спаны в таблицу trace_spans основной базы."""
+
+    def __init__(self, db):
+        self.db = db
+
+    def write(self, rows):
+        self.db.add_spans(rows)
+
+
+def create_sink(kind, db):
+    if kind == "sqlite": return SqliteSink(db)
+    if kind == "jsonl":
+        from core.utils import get_user_data_path
+        return JsonlSink(get_user_data_path("traces.jsonl"))
+    return None
+
+
+class Tracer:
+    """
+    Именованные спаны шагов движка: профиль, вакансия, шаг, длительность, исход.
+    with engine.tracer.span("scroll") as sp: ...; sp.outcome = "..."
+    """
+
+    def __init__(self, profile, sink=None):
+        self.profile = profile
+        self.sink = sink
+        self.run_id = f"{datetime.now():%Y%m%d-%H%M%S}-{profile}"
+        self.vacancy_id = None  # Текущая вакансия - наследуется вложенными спанами
+        self._buffer = []
+
+    @property
+    def enabled(self):
+        return self.sink is not None
+
+    @contextmanager
+    def span(self, step, vacancy_id=None, outcome="ok"):
+        sp = Span(step, vacancy_id or self.vacancy_id, outcome)
+        started = time.monotonic()
+        try:
+            yield sp
+        except (InterruptedError, asyncio.CancelledError):
+            sp.outcome = "stopped"
+            raise
+        except BaseException:
+            sp.outcome = "error"
+            raise
+        finally:
+            sp.duration_ms = (time.monotonic() - started) * 1000
+            if self.sink is not None: self._emit(sp)
+
+    def _emit(self, sp):
+        self._buffer.append({"run_id": self.run_id, "profile": self.profile, "vacancy_id": sp.vacancy_id,
+                             "step": sp.step, "started": sp.started, "duration_ms": round(sp.duration_ms, 1),
+                             "outcome": sp.outcome})
+        if len(self._buffer) >= FLUSH_EVERY: self.flush()
+
+    def flush(self):
+        if not self._buffer or self.sink is None: return
+        rows, self._buffer = self._buffer, []
+        try:
+            self.sink.write(rows)
+        except Exception as e:
+            logger.error(f"Trace write error: {e}")
+
+
+def load_jsonl(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def build_report(spans):
+    """
+    Текстовый отчет по спанам: время по типам шагов с перцентилями
+    и откликов в час по каждому запуску.
+    """
+    if not spans: return "Спанов нет."
+    by_step = {}
+    for s in spans:
+        by_step.setdefault(s["step"], []).append(s["duration_ms"])
+    run_total = sum(s["duration_ms"] for s in spans if s["step"] == "run") or None
+
+    lines = [f"{'шаг':<26}{'кол-во':>8}{'всего, с':>11}{'доля':>7}{'p50, мс':>10}{'p95, мс':>10}{'max, мс':>10}"]
+    for step, values in sorted(by_step.items(), key=lambda kv: -sum(kv[1])):
+        total = sum(values)
+        share = f"{total / run_total * 100:.0f}%" if run_total and step != "run" else ""
+        lines.append(f"{step:<26}{len(values):>8}{total / 1000:>11.1f}{share:>7}"
+                     f"{percentile(values, 50):>10.0f}{percentile(values, 95):>10.0f}{max(values):>10.0f}")
+
+    lines.append("")
+    lines.append(f"{'запуск':<40}{'минут':>8}{'откликов':>10}{'в час':>8}")
+    runs = {}
+    for s in spans:
+        run = runs.setdefault(s["run_id"], {"start": s["started"], "end": s["started"], "sent": 0})
+        run["start"] = min(run["start"], s["started"])
+        run["end"] = max(run["end"], s["started"] + s["duration_ms"] / 1000)
+        if s["step"] == "apply" and s["outcome"] == "sent": run["sent"] += 1
+    for run_id, run in sorted(runs.items(), key=lambda kv: kv[1]["start"]):
+        hours = max(run["end"] - run["start"], 1e-6) / 3600
+        lines.append(f"{run_id:<40}{hours * 60:>8.1f}{run['sent']:>10}{run['sent'] / hours:>8.0f}")
+    return "\n".join(lines)
@@ -19,8 +19,8 @@ def get_user_data_path(filename=""):
     Путь к папке user_data (рядом с exe).
     Возвращает АБСОЛЮТНЫЙ путь.
     """
-    base = get_base_path()
-    data_dir = os.path.join(base, "user_data")
+    # Папку данных можно подменить (стенд и бенчмарки не трогают настройки и базу пользователя)
+    data_dir = os.environ.get("HH_BOT_DATA_DIR") or os.path.join(get_base_path(), "user_data")
 
     if not os.path.exists(data_dir):
         try:
@@ -0,0 +1,126 @@
+import time
+import random
+import logging
+
+logger = logging.getLogger("HH_Automation_bot")
+
+# Бюджеты ожиданий по шагам (мс): по умолчанию, минимум, максимум.
+# Пока истории мало - берется значение по умолчанию, потом p95 прошлых запусков с запасом.
+STEP_BUDGETS = {
+    "serp_ready": (10000, 1500, 20000),
+    "page_ready": (10000, 1000, 20000),
+    "modal_open": (3000, 700, 5000),
+    "apply_outcome": (5000, 1000, 10000),
+    "modal_close": (5000, 1000, 10000),
+    "resume_options": (3000, 300, 5000),
+    "letter_input": (2000, 300, 4000),
+    "chat_closed": (2000, 300, 3000),
+    "chat_ready": (5000, 500, 10000),
+    "resume_modal": (3000, 500, 5000),
+}
+DEFAULT_BUDGET = (5000, 500, 15000)
+
+MIN_SAMPLES = 10     # Сколько замеров нужно, чтобы доверять p95
+BUDGET_MARGIN = 1.5  # Запас поверх p95
+HISTORY_SIZE = 200   # Сколько последних замеров держим на шаг
+
+# Паузы «как человек» (сек). Добавляются поверх уже готового состояния страницы
+PACING = {
+    "before_click": (1.0, 1.5),
+    "after_submit": (0.5, 1.0),
+    "between_vacancies": (2.0, 4.0),
+    "after_action": (0.5, 1.0),
+    "before_send": (0.3, 0.7),
+}
+
+
+def percentile(values, q):
+    """Перцентиль q (0..100) по отсортированной копии, без numpy."""
+    if not values: return None
+    data = sorted(values)
+    k = (len(data) - 1) * q / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(data) - 1)
+    return data[lo] + (data[hi] - data[lo]) * (k - lo)
+
+
+class LatencyBook:
+    """История длительностей ожиданий по шагам. Хранится в SQLite между запусками."""
+
+    def __init__(self, db):
+        self.db = db
+        self.samples = {}
+        self._pending = []
+        for step, seconds in db.get_step_latencies(HISTORY_SIZE * len(STEP_BUDGETS)):
+            bucket = self.samples.setdefault(step, [])
+            if len(bucket) < HISTORY_SIZE: bucket.append(seconds)
+
+    def record(self, step, seconds):
+        bucket = self.samples.setdefault(step, [])
+        bucket.insert(0, seconds)
+        del bucket[HISTORY_SIZE:]
+        self._pending.append((step, seconds))
+
+    def budget_ms(self, step):
+        default, lo, hi = STEP_BUDGETS.get(step, DEFAULT_BUDGET)
+        bucket = self.samples.get(step) or []
+        if len(bucket) < MIN_SAMPLES: return default
+        p95 = percentile(bucket, 95) * 1000
+        return int(min(hi, max(lo, p95 * BUDGET_MARGIN + 200)))
+
+    def flush(self):
+        if not self._pending: return
+        rows, self._pending = self._pending, []
+        self.db.add_step_latencies(rows)
+
+
+class Waiter:
+    """
+    Ожидания по событию (селектор, состояние загрузки), а не фиксированным сном.
+    Таймаут каждого шага берется из LatencyBook, человеческие паузы - отдельно через pace().
+    """
+
+    def __init__(self, engine, book):
+        self.engine = engine
+        self.book = book
+
+    def budget_ms(self, step):
+        return self.book.budget_ms(step)
+
+    async def until(self, step, make_awaitable):
+        """make_awaitable(timeout_ms) -> awaitable. True - дождались, False - вышел бюджет."""
+        self.engine.check_running()
+        with self.engine.tracer.span(f"wait:{step}") as sp:
+            started = time.monotonic()
+            budget = self.budget_ms(step)
+            try:
+                await make_awaitable(budget)
+            except Exception as e:
+                if "Target closed" in str(e) or "browser has been closed" in str(e): raise e
+                sp.outcome = "timeout"
+                # Вышедший бюджет - тоже замер: иначе p95 считается только по успехам и бюджет
+                # только сжимается к минимуму. Несколько таймаутов поднимают его к максимуму
+                if "Timeout" in type(e).__name__: self.book.record(step, budget / 1000)
+                return False
+            self.book.record(step, time.monotonic() - started)
+            return True
+
+    async def selector(self, step, selector, state="visible"):
+        return await self.until(step, lambda t: self.engine.page.wait_for_selector(selector, state=state, timeout=t))
+
+    async def locator(self, step, locator, state="visible"):
+        return await self.until(step, lambda t: locator.wait_for(state=state, timeout=t))
+
+    async def pace(self, kind, scale=1.0):
+        """Намеренная пауза «как человек». Отключается настройкой human_pacing."""
+        if self.engine.settings_mgr.get("human_pacing") is False: return
+        lo, hi = PACING.get(kind, (0.5, 1.0))
+        with self.engine.tracer.span(f"pace:{kind}"):
+            await self.engine.smart_sleep(random.uniform(lo, hi) * scale)
+
+    async def read_page(self):
+        """Пауза «читаю страницу» по настройке page_stay_time."""
+        stay = float(self.engine.settings_mgr.get("page_stay_time") or 0)
+        if self.engine.settings_mgr.get("human_pacing") is False or stay <= 0: return
+        with self.engine.tracer.span("pace:read_page"):
+            await self.engine.smart_sleep(random.uniform(stay * 0.5, stay))
@@ -0,0 +1,36 @@
+import logging
+
+from core.runtime import get_runtime
+from core.settings_manager import SettingsManager
+
+logger = logging.getLogger("HH_Automation_bot")
+
+
+class WarmStartManager:
+    """
+    Прогрев при открытии окна: поднимает драйвер Playwright и браузер
+    в режиме headless_mode, пока пользователь заполняет фильтры.
+    Старт рассылки после этого сводится к выдаче контекста из пула.
+    """
+
+    def __init__(self):
+        self.settings_mgr = SettingsManager()
+        self.future = None
+
+    def warm_up(self):
+        if not self.settings_mgr.get("prewarm_browsers"): return
+        # В режиме process браузеры живут в процессах профилей - греть в GUI нечего
+        if self.settings_mgr.get("worker_mode") == "process": return
+        if self.future and not self.future.done(): return
+
+        headless = bool(self.settings_mgr.get("headless_mode"))
+        runtime = get_runtime()
+        self.future = runtime.submit(runtime.get_pool().prewarm(headless))
+        self.future.add_done_callback(self._on_done)
+
+    def _on_done(self, future):
+        try:
+            ready = future.result()
+            logger.info(f"Прогрев завершен: готово браузеров - {ready}.")
+        except Exception as e:
+            logger.warning(f"Прогрев браузера не удался: {e}")
@@ -1,8 +1,10 @@
 import sqlite3
+import json
 import logging
 from datetime import datetime
 import os
 from core.utils import get_user_data_path
+from core.serp_extractor import vacancy_id_from_url
 
 logger = logging.getLogger("HH_Automation_bot")
 
@@ -31,22 +33,293 @@ class DBManager:
                         timestamp DATETIME
                     )
                 """)
+                # Миграция: способ отклика и его задержка
+                cursor.execute("PRAGMA table_info(applications)")
+                columns = {row[1] for row in cursor.fetchall()}
+                if "transport" not in columns:
+                    cursor.execute("ALTER TABLE applications ADD COLUMN transport TEXT")
+                if "latency_ms" not in columns:
+                    cursor.execute("ALTER TABLE applications ADD COLUMN latency_ms REAL")
+                if "vacancy_id" not in columns:
+                    cursor.execute("ALTER TABLE applications ADD COLUMN vacancy_id TEXT")
+                    self._backfill_vacancy_ids(cursor)
+                # Один отклик на вакансию в профиле
+                cursor.execute("""
+                    CREATE UNIQUE INDEX IF NOT EXISTS idx_applications_profile_vacancy
+                    ON applications (profile, vacancy_id)
+                """)
+                # Постраничная статистика с фильтром по профилю (gui/tabs/stats_tab.py)
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_applications_profile_id ON applications (profile, id)")
+
+                # Время старта браузера: cold (запуск Chrome) / warm (выдача контекста из пула)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS launch_metrics (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        profile TEXT,
+                        kind TEXT,
+                        seconds REAL,
+                        timestamp DATETIME
+                    )
+                """)
+                # Собранная выдача по ключу запроса (core/serp_cache.py)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS serp_cache (
+                        query_key TEXT PRIMARY KEY,
+                        records TEXT,
+                        watermark INTEGER,
+                        pages INTEGER,
+                        complete INTEGER,
+                        fetched_at TEXT
+                    )
+                """)
+                # Спаны шагов движка (core/tracing.py)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS trace_spans (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        run_id TEXT,
+                        profile TEXT,
+                        vacancy_id TEXT,
+                        step TEXT,
+                        started REAL,
+                        duration_ms REAL,
+                        outcome TEXT
+                    )
+                """)
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_trace_spans_run ON trace_spans (run_id)")
+                # Суточный учет откликов и состояние токен-бакета профиля (core/quota.py)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS quota_ledger (
+                        profile TEXT,
+                        day TEXT,
+                        used INTEGER,
+                        PRIMARY KEY (profile, day)
+                    )
+                """)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS quota_bucket (
+                        profile TEXT PRIMARY KEY,
+                        tokens REAL,
+                        updated REAL
+                    )
+                """)
+                # Длительности ожиданий по шагам (для адаптивных таймаутов core/waits.py)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS step_latency (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        step TEXT,
+                        seconds REAL
+                    )
+                """)
                 conn.commit()
         except Exception as e:
             logger.error(f"DB Init Error: {e}")
 
-    def add_application(self, title, company, url, profile, status="success"):
+    def _backfill_vacancy_ids(self, cursor):
+        """id вакансии для старых записей берется из URL. Повторы оставляем без id, чтобы не нарушить уникальность."""
+        cursor.execute("SELECT id, url, profile FROM applications ORDER BY id")
+        seen = set()
+        updates = []
+        for row_id, url, profile in cursor.fetchall():
+            vacancy_id = vacancy_id_from_url(url)
+            if not vacancy_id or (profile, vacancy_id) in seen: continue
+            seen.add((profile, vacancy_id))
+            updates.append((vacancy_id, row_id))
+        cursor.executemany("UPDATE applications SET vacancy_id=? WHERE id=?", updates)
+
+    def add_application(self, title, company, url, profile, status="success", transport=None, latency_ms=None,
+                        vacancy_id=None):
+        """Возвращает False, если отклик на эту вакансию в профиле уже записан."""
+        if vacancy_id is None: vacancy_id = vacancy_id_from_url(url)
         try:
             with sqlite3.connect(self.db_name) as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
-                    INSERT INTO applications (vacancy_title, company_name, url, status, profile, timestamp)
+                    INSERT OR IGNORE INTO applications (vacancy_title, company_name, url, status, profile, timestamp,
+                                                        transport, latency_ms, vacancy_id)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (title, company, url, status, profile, datetime.now(), transport, latency_ms, vacancy_id))
+                conn.commit()
+                return cursor.rowcount > 0
+        except Exception as e:
+            logger.error(f"DB Add Error: {e}")
+            return False
+
+    def get_applied_ids(self, profile):
+        """Множество id вакансий, на которые профиль уже откликался."""
+        try:
+            with sqlite3.connect(self.db_name) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT vacancy_id FROM applications WHERE profile=? AND vacancy_id IS NOT NULL",
+                               (profile,))
+                return {row[0] for row in cursor.fetchall()}
+        except:
+            return set()
+
+    def add_launch_metric(self, profile, kind, seconds):
+        try:
+            with sqlite3.connect(self.db_name) as conn:
+                conn.execute("""
+                    INSERT INTO launch_metrics (profile, kind, seconds, timestamp)
+                    VALUES (?, ?, ?, ?)
+                """, (profile, kind, seconds, datetime.now()))
+                conn.commit()
+        except Exception as e:
+            logger.error(f"DB Add Error: {e}")
+
+    def get_launch_stats(self):
+        """Среднее время старта по видам: {"cold": (avg, count), "warm": (avg, count)}"""
+        try:
+            with sqlite3.connect(self.db_name) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT kind, AVG(seconds), COUNT(*) FROM launch_metrics GROUP BY kind")
+                return {kind: (avg, cnt) for kind, avg, cnt in cursor.fetchall()}
+        except:
+            return {}
+
+    def add_step_latencies(self, rows, keep_last=5000):
+        """rows: [(step, seconds)]. Старые замеры сверх keep_last удаляются."""
+        try:
+            with sqlite3.connect(self.db_name) as conn:
+                conn.executemany("INSERT INTO step_latency (step, seconds) VALUES (?, ?)", rows)
+                conn.execute("DELETE FROM step_latency WHERE id <= (SELECT MAX(id) FROM step_latency) - ?",
+                             (keep_last,))
+                conn.commit()
+        except Exception as e:
+            logger.error(f"DB Add Error: {e}")
+
+    def get_step_latencies(self, limit=2000):
+        """Последние замеры [(step, seconds)], новые первыми."""
+        try:
+            with sqlite3.connect(self.db_name) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT step, seconds FROM step_latency ORDER BY id DESC LIMIT ?", (limit,))
+                return cursor.fetchall()
+        except:
+            return []
+
+    def get_serp_cache(self, query_key):
+        """(fetched_at, watermark, pages, complete, records) или None."""
+        try:
+            with sqlite3.connect(self.db_name) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT fetched_at, watermark, pages, complete, records FROM serp_cache "
+                               "WHERE query_key=?", (query_key,))
+                row = cursor.fetchone()
+                if not row: return None
+                fetched_at, watermark, pages, complete, records = row
+                return datetime.fromisoformat(fetched_at), watermark or 0, pages or 0, bool(complete), json.loads(records)
+        except Exception as e:
+            logger.error(f"DB Read Error: {e}")
+            return None
+
+    def save_serp_cache(self, query_key, watermark, pages, complete, records, fetched_at=None):
+        try:
+            with sqlite3.connect(self.db_name) as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO serp_cache (query_key, records, watermark, pages, complete, fetched_at)
                     VALUES (?, ?, ?, ?, ?, ?)
-                """, (title, company, url, status, profile, datetime.now()))
+                """, (query_key, json.dumps(records, ensure_ascii=False), watermark, pages, int(complete),
+                      (fetched_at or datetime.now()).isoformat()))
                 conn.commit()
         except Exception as e:
             logger.error(f"DB Add Error: {e}")
 
+    def get_quota_used(self, profile, day):
+        """Откликов профиля за день. Для дня без записи в журнале - по таблице откликов."""
+        try:
+            with sqlite3.connect(self.db_name) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT used FROM quota_ledger WHERE profile=? AND day=?", (profile, day))
+                row = cursor.fetchone()
+                if row: return row[0]
+                cursor.execute("SELECT COUNT(*) FROM applications WHERE profile=? AND status='success' "
+                               "AND DATE(timestamp)=?", (profile, day))
+                return cursor.fetchone()[0]
+        except:
+            return 0
+
+    def add_quota_use(self, profile, day, tokens, updated):
+        """+1 к суточному учету и новое состояние бакета - одной транзакцией."""
+        try:
+            with sqlite3.connect(self.db_name) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT used FROM quota_ledger WHERE profile=? AND day=?", (profile, day))
+                row = cursor.fetchone()
+                if row:
+                    cursor.execute("UPDATE quota_ledger SET used=used+1 WHERE profile=? AND day=?", (profile, day))
+                else:
+                    # Первый отклик дня: отклик уже записан в applications, он и есть начальное значение
+                    cursor.execute("SELECT COUNT(*) FROM applications WHERE profile=? AND status='success' "
+                                   "AND DATE(timestamp)=?", (profile, day))
+                    cursor.execute("INSERT INTO quota_ledger (profile, day, used) VALUES (?, ?, ?)",
+                                   (profile, day, max(1, cursor.fetchone()[0])))
+                cursor.execute("INSERT OR REPLACE INTO quota_bucket (profile, tokens, updated) VALUES (?, ?, ?)",
+                               (profile, tokens, updated))
+                conn.commit()
+        except Exception as e:
+            logger.error(f"DB Add Error: {e}")
+
+    def get_quota_bucket(self, profile):
+        """(tokens, updated) или None."""
+        try:
+            with sqlite3.connect(self.db_name) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT tokens, updated FROM quota_bucket WHERE profile=?", (profile,))
+                return cursor.fetchone()
+        except:
+            return None
+
+    def add_spans(self, rows, keep_last=100000):
+        """Спаны трассировки. Старые сверх keep_last удаляются (~десятки запусков), чтобы база не росла."""
+        try:
+            with sqlite3.connect(self.db_name) as conn:
+                conn.executemany("""
+                    INSERT INTO trace_spans (run_id, profile, vacancy_id, step, started, duration_ms, outcome)
+                    VALUES (:run_id, :profile, :vacancy_id, :step, :started, :duration_ms, :outcome)
+                """, rows)
+                conn.execute("DELETE FROM trace_spans WHERE id <= (SELECT MAX(id) FROM trace_spans) - ?",
+                             (keep_last,))
+                conn.commit()
+        except Exception as e:
+            logger.error(f"DB Add Error: {e}")
+
+    def get_spans(self, profile_filter=None, last_runs=10):
+        """Спаны последних запусков (списком словарей, как в JSONL)."""
+        try:
+            with sqlite3.connect(self.db_name) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                query = "SELECT run_id FROM trace_spans"
+                params = []
+                if profile_filter:
+                    query += " WHERE profile=?"
+                    params = [profile_filter]
+                cursor.execute(query + " GROUP BY run_id ORDER BY MIN(started) DESC LIMIT ?", params + [last_runs])
+                runs = [row["run_id"] for row in cursor.fetchall()]
+                if not runs: return []
+                cursor.execute(f"""
+                    SELECT run_id, profile, vacancy_id, step, started, duration_ms, outcome FROM trace_spans
+                    WHERE run_id IN ({",".join("?" * len(runs))}) ORDER BY id
+                """, runs)
+                return [dict(row) for row in cursor.fetchall()]
+        except:
+            return []
+
+    def get_transport_stats(self, profile_filter=None):
+        """Средняя задержка отклика по транспортам: {transport: (avg_ms, count)}"""
+        try:
+            with sqlite3.connect(self.db_name) as conn:
+                cursor = conn.cursor()
+                query = "SELECT transport, AVG(latency_ms), COUNT(*) FROM applications WHERE transport IS NOT NULL"
+                params = []
+                if profile_filter:
+                    query += " AND profile=?"
+                    params = [profile_filter]
+                cursor.execute(query + " GROUP BY transport", params)
+                return {t: (avg, cnt) for t, avg, cnt in cursor.fetchall()}
+        except:
+            return {}
+
     def get_all_applications(self, profile_filter=None):
         try:
             with sqlite3.connect(self.db_name) as conn:
@@ -62,6 +335,42 @@ class DBManager:
         except Exception as e:
             return []
 
+    def get_applications_page(self, profile_filter=None, before_id=None, after_id=None, limit=200):
+        """
+        Страница откликов, новые первыми:
+        (id, vacancy_title, company_name, timestamp, profile, status, transport, latency_ms).
+        before_id - следующая страница вниз, after_id - только новые записи. Стоимость не зависит от размера таблицы.
+        """
+        try:
+            with sqlite3.connect(self.db_name) as conn:
+                cursor = conn.cursor()
+                query = ("SELECT id, vacancy_title, company_name, timestamp, profile, status, transport, latency_ms "
+                         "FROM applications WHERE 1=1")
+                params = []
+                if profile_filter:
+                    query += " AND profile=?"
+                    params.append(profile_filter)
+                if before_id is not None:
+                    query += " AND id<?"
+                    params.append(before_id)
+                if after_id is not None:
+                    query += " AND id>?"
+                    params.append(after_id)
+                cursor.execute(query + " ORDER BY id DESC LIMIT ?", params + [limit])
+                return cursor.fetchall()
+        except:
+            return []
+
+    def get_profiles(self):
+        """Профили, по которым есть отклики."""
+        try:
+            with sqlite3.connect(self.db_name) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT DISTINCT profile FROM applications WHERE profile IS NOT NULL")
+                return [row[0] for row in cursor.fetchall()]
+        except:
+            return []
+
     def get_stats(self, profile_filter=None):
         try:
             with sqlite3.connect(self.db_name) as conn:
@@ -0,0 +1,20 @@
+import logging
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+class QLogHandler(logging.Handler, QObject):
+    """
+    Кастомный обработчик логов.
+    Перехватывает сообщения logging и отправляет их в GUI через сигнал.
+    Наследуется от QObject, чтобы иметь возможность испускать сигналы.
+    """
+    log_signal = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        QObject.__init__(self)
+
+    def emit(self, record):
+        msg = self.format(record)
+        # Отправляем текст в интерфейс
+        self.log_signal.emit(msg)
@@ -1,20 +1,27 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QListWidget, QStackedWidget, QTextEdit, QMessageBox)
-from PyQt6.QtCore import pyqtSlot
+from PyQt6.QtCore import pyqtSlot, QTimer
 from PyQt6.QtGui import QGuiApplication
+import importlib
 import logging
 import os
 
 from gui.tabs.response_tab import ResponseTab
-from gui.tabs.activity_tab import ActivityTab
-from gui.tabs.stats_tab import StatsTab
-from gui.tabs.settings_tab import SettingsTab
-from gui.tabs.diagnostics_tab import DiagnosticsTab
-from gui.tabs.about_tab import AboutTab
 
 from core.logger import setup_logger
-from gui.threads import SearchWorker, ActivityWorker
-from gui.tabs.updates_tab import UpdatesTab
+from core.settings_manager import SettingsManager
+from core.scheduler import JobScheduler, PRIORITY_HIGH, PRIORITY_NORMAL
+from core.utils import get_resource_path
+
+# Вкладки кроме первой строятся при первом открытии: индекс -> (атрибут, модуль, класс)
+LAZY_TABS = {
+    1: ("activity_tab", "gui.tabs.activity_tab", "ActivityTab"),
+    2: ("stats_tab", "gui.tabs.stats_tab", "StatsTab"),
+    3: ("settings_tab", "gui.tabs.settings_tab", "SettingsTab"),
+    4: ("diagnostics_tab", "gui.tabs.diagnostics_tab", "DiagnosticsTab"),
+    5: ("updates_tab", "gui.tabs.updates_tab", "UpdatesTab"),
+    6: ("about_tab", "gui.tabs.about_tab", "AboutTab"),
+}
 
 
 class MainWindow(QMainWindow):
@@ -28,6 +35,10 @@ class MainWindow(QMainWindow):
         self.resize(width, height)
         self.move(int((screen.width() - width) / 2), int((screen.height() - height) / 2))
         self.setWindowOpacity(0.95)
+        # Стили до создания виджетов: иначе каждый виджет полируется дважды
+        self.load_styles()
+        # Один менеджер настроек на окно: вкладка настроек и очередь видят одни значения
+        self.settings_mgr = SettingsManager()
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -50,20 +61,10 @@ class MainWindow(QMainWindow):
 
         self.pages = QStackedWidget()
         self.response_tab = ResponseTab()
-        self.activity_tab = ActivityTab()
-        self.stats_tab = StatsTab()
-        self.settings_tab = SettingsTab()
-        self.diagnostics_tab = DiagnosticsTab()
-        self.updates_tab = UpdatesTab()
-        self.about_tab = AboutTab()
-
         self.pages.addWidget(self.response_tab)
-        self.pages.addWidget(self.activity_tab)
-        self.pages.addWidget(self.stats_tab)
-        self.pages.addWidget(self.settings_tab)
-        self.pages.addWidget(self.diagnostics_tab)
-        self.pages.addWidget(self.updates_tab)
-        self.pages.addWidget(self.about_tab)
+        for index, (attr, _, _) in LAZY_TABS.items():
+            setattr(self, attr, None)
+            self.pages.addWidget(QWidget())  # Заглушка до первого открытия
 
         right_layout.addWidget(self.pages)
 
@@ -80,65 +81,121 @@ class MainWindow(QMainWindow):
         self.gui_log_handler.log_signal.connect(self.append_log)
         self.search_workers = {}
         self.activity_workers = {}
+        self.progress = {}  # профиль -> (отправлено, лимит)
+        # Все запуски идут через очередь: лимиты, приоритеты, один запуск на профиль
+        self.scheduler = JobScheduler(self.launch_job, self.settings_mgr)
+        # Лимиты могли вырасти (настройки, освободилась память) - очередь проверяется и без завершений
+        self.queue_timer = QTimer(self)
+        self.queue_timer.timeout.connect(self.scheduler.pump)
+        self.queue_timer.start(15000)
 
         self.response_tab.start_btn.clicked.connect(self.on_response_start)
+        self.response_tab.queue_btn.clicked.connect(self.on_response_queue)
         self.response_tab.profile_combo.currentTextChanged.connect(self.update_response_btn)
-        self.activity_tab.start_btn.clicked.connect(self.on_activity_start)
-        self.activity_tab.profile_combo.currentTextChanged.connect(self.update_activity_btn)
 
-        self.load_styles()
         self.sidebar.setCurrentRow(0)
         self.logger.info("Интерфейс инициализирован.")
 
+        # Браузер стартует в фоне, пока пользователь настраивает поиск.
+        # Движок и Playwright импортируются уже после первой отрисовки окна
+        QTimer.singleShot(0, self.start_warm_up)
+
+    def start_warm_up(self):
+        from core.warm_start import WarmStartManager
+        self.warm_start = WarmStartManager()
+        self.warm_start.warm_up()
+
+    def build_tab(self, index):
+        """Создает вкладку при первом открытии и ставит ее на место заглушки."""
+        attr, module, cls = LAZY_TABS[index]
+        kwargs = {"settings_mgr": self.settings_mgr} if attr == "settings_tab" else {}
+        tab = getattr(importlib.import_module(module), cls)(**kwargs)
+        placeholder = self.pages.widget(index)
+        self.pages.insertWidget(index, tab)
+        self.pages.removeWidget(placeholder)
+        placeholder.deleteLater()
+        setattr(self, attr, tab)
+
+        if attr == "activity_tab":
+            tab.start_btn.clicked.connect(self.on_activity_start)
+            tab.queue_btn.clicked.connect(self.on_activity_queue)
+            tab.profile_combo.currentTextChanged.connect(self.update_activity_btn)
+            self.update_activity_btn()
+        return tab
+
     def change_page(self, index):
+        if index in LAZY_TABS and getattr(self, LAZY_TABS[index][0]) is None:
+            self.build_tab(index)
+            fresh = True
+        else:
+            fresh = False
         self.pages.setCurrentIndex(index)
+        # Только что созданные вкладки списки профилей уже прочитали
         if index == 0:
             self.response_tab.refresh_profiles()
-        elif index == 1:
+        elif index == 1 and not fresh:
             self.activity_tab.refresh_profiles()
-        elif index == 3:
+        elif index == 3 and not fresh:
             self.settings_tab.refresh_profiles()
 
     def load_styles(self):
-        if os.path.exists("gui/styles.qss"):
-            with open("gui/styles.qss", "r", encoding="utf-8") as f: self.setStyleSheet(f.read())
-
-    def can_start_new_process(self, new_profile):
-        total = len(self.search_workers) + len(self.activity_workers)
-        if total == 0: return True
-        if not self.settings_tab.settings_mgr.get("enable_multi_account"):
-            QMessageBox.warning(self, "Ограничение", "Мультипоточность выключена.")
-            return False
-        return True
+        """Стили читаются один раз; относительные пути к иконкам заменяются абсолютными (важно для EXE)."""
+        style_path = get_resource_path("gui/styles.qss")
+        if not os.path.exists(style_path): return
+        with open(style_path, "r", encoding="utf-8") as f:
+            qss_data = f.read()
+        # В Windows пути с обратным слэшем, CSS их не любит, меняем на прямой
+        res_dir = get_resource_path("resources").replace("\\", "/")
+        self.setStyleSheet(qss_data.replace("url(resources", f"url({res_dir}"))
 
-    # === ОТКЛИКИ ===
-    def on_response_start(self):
-        data = self.response_tab.collect_data()
-        profile = data.get("profile")
-        if not profile: return QMessageBox.warning(self, "Ошибка", "Выберите профиль!")
-        if profile in self.search_workers:
-            self.search_workers[profile].stop()
-            self.response_tab.start_btn.setEnabled(False)
-            return
-        if not data["text"]: return QMessageBox.warning(self, "Ошибка", "Введите запрос!")
-        if profile in self.activity_workers: return QMessageBox.warning(self, "Занято", "Профиль занят.")
-        if not self.can_start_new_process(profile): return
-
-        self.logger.info(f"Запуск откликов: {profile}")
-        worker = SearchWorker(data, profile)
-        worker.finished_signal.connect(self.handle_response_finished)
-        self.search_workers[profile] = worker
+    # === ОЧЕРЕДЬ ===
+    def launch_job(self, job):
+        """Вызывается планировщиком, когда задаче нашелся слот."""
+        if job.kind == "search":
+            self.logger.info(f"Запуск откликов: {job.profile}")
+            workers = self.search_workers
+        else:
+            self.logger.info(f"Запуск активности: {job.profile}")
+            workers = self.activity_workers
+        from gui.threads import create_worker
+        worker = create_worker(job.kind, job.payload, job.profile)
+        worker.finished_signal.connect(lambda status, profile, j=job: self.handle_job_finished(j, status))
+        worker.progress_signal.connect(self.handle_progress)
+        workers[job.profile] = worker
         worker.start()
         self.update_response_btn()
+        self.update_activity_btn()
+        return worker
+
+    def handle_job_finished(self, job, status):
+        workers = self.search_workers if job.kind == "search" else self.activity_workers
+        if workers.get(job.profile) is job.worker: del workers[job.profile]
+        self.progress.pop(job.profile, None)
+        # Кнопку блокировал стоп этого профиля - разблокируем, только если он и показан во вкладке
+        tab = self.response_tab if job.kind == "search" else self.activity_tab
+        if tab and tab.profile_combo.currentText() == job.profile: tab.start_btn.setEnabled(True)
+        # Сначала следующий запуск из очереди, потом окно с итогом
+        self.scheduler.finished(job)
+        self.update_response_btn()
+        self.update_activity_btn()
+        self.report_status(job, status)
 
-    def handle_response_finished(self, status, profile):
-        if profile in self.search_workers: del self.search_workers[profile]
-        self.response_tab.start_btn.setEnabled(True)
+    def handle_progress(self, profile, done, total):
+        self.progress[profile] = (done, total)
         self.update_response_btn()
 
+    def report_status(self, job, status):
+        profile = job.profile
+        done_text = "Рассылка завершена!" if job.kind == "search" else "Активность завершена!"
+        if not job.notify:
+            # Задачи из очереди (например, на ночь) - только в лог, без модальных окон
+            level = "error" if "error" in status else "info"
+            getattr(self.logger, level)(f"{job}: {status}")
+            return
+
         # === ДОБАВЛЕНО: ОБРАБОТКА СТОП ===
         if status == "finished":
-            QMessageBox.information(self, "Готово", f"[{profile}] Рассылка завершена!")
+            QMessageBox.information(self, "Готово", f"[{profile}] {done_text}")
         elif status == "closed_by_user":
             QMessageBox.warning(self, "Прервано", f"[{profile}] Браузер закрыт.")
         elif status == "stopped":
@@ -146,59 +203,90 @@ class MainWindow(QMainWindow):
         elif "error" in status:
             QMessageBox.critical(self, "Ошибка", f"[{profile}] {status}")
 
+    def queued_jobs(self, profile, kind):
+        return [job for job in self.scheduler.queued() if job.profile == profile and job.kind == kind]
+
+    def toggle_job(self, kind, tab, data, priority, notify):
+        """Стоп запущенного / снятие из очереди, иначе постановка в очередь."""
+        profile = data.get("profile")
+        running = self.scheduler.running_job(profile, kind)
+        if notify and running:
+            running.worker.stop()
+            tab.start_btn.setEnabled(False)
+            return
+        queued = self.queued_jobs(profile, kind)
+        if notify and queued:
+            for job in queued: self.scheduler.cancel(job)
+            self.logger.info(f"[{profile}] Убрано из очереди: {len(queued)}")
+        else:
+            label = tab.preset_combo.currentText() if kind == "search" and tab.preset_combo.currentIndex() > 0 \
+                else None
+            self.scheduler.submit(kind, profile, data, priority=priority, label=label, notify=notify)
+        self.update_response_btn()
+        self.update_activity_btn()
+
+    # === ОТКЛИКИ ===
+    def on_response_start(self):
+        data = self.response_tab.collect_data()
+        profile = data.get("profile")
+        if not profile: return QMessageBox.warning(self, "Ошибка", "Выберите профиль!")
+        busy = self.scheduler.running_job(profile, "search") or self.queued_jobs(profile, "search")
+        if not busy and not data["text"]: return QMessageBox.warning(self, "Ошибка", "Введите запрос!")
+        self.toggle_job("search", self.response_tab, data, PRIORITY_HIGH, notify=True)
+
+    def on_response_queue(self):
+        data = self.response_tab.collect_data()
+        if not data.get("profile"): return QMessageBox.warning(self, "Ошибка", "Выберите профиль!")
+        if not data["text"]: return QMessageBox.warning(self, "Ошибка", "Введите запрос!")
+        self.toggle_job("search", self.response_tab, data, PRIORITY_NORMAL, notify=False)
+
     def update_response_btn(self):
         curr = self.response_tab.profile_combo.currentText()
+        queued = len(self.queued_jobs(curr, "search"))
         if curr in self.search_workers:
-            self.response_tab.start_btn.setText(f"СТОП ({curr})")
+            done = self.progress.get(curr)
+            suffix = f" {done[0]}/{done[1]}" if done else ""
+            self.response_tab.start_btn.setText(f"СТОП ({curr}){suffix}")
             self.response_tab.start_btn.setStyleSheet("background: #f38ba8; color: #111;")
+        elif queued:
+            self.response_tab.start_btn.setText(f"УБРАТЬ ИЗ ОЧЕРЕДИ ({queued})")
+            self.response_tab.start_btn.setStyleSheet("background: #fab387; color: #111;")
         else:
             self.response_tab.start_btn.setText("ЗАПУСТИТЬ РАССЫЛКУ")
             self.response_tab.start_btn.setStyleSheet("")
+        self.response_tab.queue_btn.setText(f"В ОЧЕРЕДЬ ({len(self.scheduler.queued())})")
 
     # === АКТИВНОСТЬ ===
     def on_activity_start(self):
         data = self.activity_tab.collect_data()
         profile = data.get("profile")
         if not profile: return QMessageBox.warning(self, "Ошибка", "Выберите профиль!")
-        if profile in self.activity_workers:
-            self.activity_workers[profile].stop()
-            self.activity_tab.start_btn.setEnabled(False)
-            return
+        busy = self.scheduler.running_job(profile, "activity") or self.queued_jobs(profile, "activity")
+        if not busy and not data["use_chat"] and not data["use_resume"]:
+            return QMessageBox.warning(self, "Ошибка", "Выберите режим!")
+        self.toggle_job("activity", self.activity_tab, data, PRIORITY_HIGH, notify=True)
+
+    def on_activity_queue(self):
+        data = self.activity_tab.collect_data()
+        if not data.get("profile"): return QMessageBox.warning(self, "Ошибка", "Выберите профиль!")
         if not data["use_chat"] and not data["use_resume"]: return QMessageBox.warning(self, "Ошибка",
                                                                                        "Выберите режим!")
-        if profile in self.search_workers: return QMessageBox.warning(self, "Занято", "Профиль занят.")
-        if not self.can_start_new_process(profile): return
-
-        self.logger.info(f"Запуск активности: {profile}")
-        worker = ActivityWorker(data, profile)
-        worker.finished_signal.connect(self.handle_activity_finished)
-        self.activity_workers[profile] = worker
-        worker.start()
-        self.update_activity_btn()
-
-    def handle_activity_finished(self, status, profile):
-        if profile in self.activity_workers: del self.activity_workers[profile]
-        self.activity_tab.start_btn.setEnabled(True)
-        self.update_activity_btn()
-
-        # === ДОБАВЛЕНО: ОБРАБОТКА СТОП ===
-        if status == "finished":
-            QMessageBox.information(self, "Готово", f"[{profile}] Активность завершена!")
-        elif status == "closed_by_user":
-            QMessageBox.warning(self, "Прервано", f"[{profile}] Браузер закрыт.")
-        elif status == "stopped":
-            QMessageBox.information(self, "Стоп", f"[{profile}] Процесс остановлен пользователем.")
-        elif "error" in status:
-            QMessageBox.critical(self, "Ошибка", f"[{profile}] {status}")
+        self.toggle_job("activity", self.activity_tab, data, PRIORITY_NORMAL, notify=False)
 
     def update_activity_btn(self):
+        if self.activity_tab is None: return
         curr = self.activity_tab.profile_combo.currentText()
+        queued = len(self.queued_jobs(curr, "activity"))
         if curr in self.activity_workers:
             self.activity_tab.start_btn.setText(f"СТОП ({curr})")
             self.activity_tab.start_btn.setStyleSheet("background: #f38ba8; color: #111;")
+        elif queued:
+            self.activity_tab.start_btn.setText(f"УБРАТЬ ИЗ ОЧЕРЕДИ ({queued})")
+            self.activity_tab.start_btn.setStyleSheet("background: #fab387; color: #111;")
         else:
             self.activity_tab.start_btn.setText("ЗАПУСТИТЬ АКТИВНОСТЬ")
             self.activity_tab.start_btn.setStyleSheet("")
+        self.activity_tab.queue_btn.setText(f"В ОЧЕРЕДЬ ({len(self.scheduler.queued())})")
 
     @pyqtSlot(str)
     def append_log(self, text):
@@ -2,10 +2,10 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QPushButton, QListWidget, QLineEdit, QCheckBox,
                              QSpinBox, QGroupBox, QComboBox, QMessageBox, QScrollArea)
 from gui.custom_widgets import AnimatedComboBox
-from gui.threads import ActivityWorker
 import json
 import os
 from core.utils import get_user_data_path
+from core.presets import MESSAGES_FILE, load_messages
 
 
 class ActivityTab(QWidget):
@@ -106,9 +106,15 @@ class ActivityTab(QWidget):
         chat_group.setLayout(chat_layout)
         layout.addWidget(chat_group)
 
+        btn_layout = QHBoxLayout()
         self.start_btn = QPushButton("ЗАПУСТИТЬ АКТИВНОСТЬ")
         self.start_btn.setMinimumHeight(60)
-        layout.addWidget(self.start_btn)
+        self.queue_btn = QPushButton("В ОЧЕРЕДЬ")
+        self.queue_btn.setMinimumHeight(60)
+        self.queue_btn.setFixedWidth(200)
+        btn_layout.addWidget(self.start_btn)
+        btn_layout.addWidget(self.queue_btn)
+        layout.addLayout(btn_layout)
 
         layout.addStretch()
 
@@ -151,16 +157,10 @@ class ActivityTab(QWidget):
 
     def save_messages(self):
         try:
-            with open(os.path.join("data", "messages_preset.json"), "w", encoding="utf-8") as f:
+            with open(MESSAGES_FILE, "w", encoding="utf-8") as f:
                 json.dump([self.msg_list.item(i).text() for i in range(self.msg_list.count())], f, ensure_ascii=False)
         except:
             pass
 
     def load_messages(self):
-        path = os.path.join("data", "messages_preset.json")  # Переменная пути
-        if os.path.exists(path):
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    self.msg_list.addItems(json.load(f))
-            except:
-                pass
\ No newline at end of file
+        self.msg_list.addItems(load_messages())
\ No newline at end of file
@@ -1,7 +1,6 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel, QScrollArea
 from PyQt6.QtGui import QPixmap
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from playwright.sync_api import sync_playwright
 import os
 
 
@@ -9,6 +8,9 @@ class TestWorker(QThread):
     finished_signal = pyqtSignal(str)
 
     def run(self):
+        # Playwright нужен только на время теста - не тянем его при старте окна
+        from playwright.sync_api import sync_playwright
+
         with sync_playwright() as p:
             args = [
                 "--disable-blink-features=AutomationControlled",
@@ -1,4 +1,3 @@
-import json
 import os
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QLineEdit, QComboBox, QGroupBox, QScrollArea,
@@ -6,8 +5,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
 from PyQt6.QtCore import Qt
 from gui.custom_widgets import CheckableComboBox, AnimatedComboBox
 from core.utils import get_user_data_path
-
-PRESETS_FILE = get_user_data_path("presets.json")
+from core.presets import load_presets, save_presets
 
 
 class ResponseTab(QWidget):
@@ -141,9 +139,16 @@ class ResponseTab(QWidget):
         main_layout.addWidget(resp_group)
 
         # 4. Кнопка
+        btn_layout = QHBoxLayout()
         self.start_btn = QPushButton("ЗАПУСТИТЬ РАССЫЛКУ")
         self.start_btn.setMinimumHeight(60)
-        main_layout.addWidget(self.start_btn)
+        # Поставить пресет в очередь, даже если профиль сейчас занят
+        self.queue_btn = QPushButton("В ОЧЕРЕДЬ")
+        self.queue_btn.setMinimumHeight(60)
+        self.queue_btn.setFixedWidth(200)
+        btn_layout.addWidget(self.start_btn)
+        btn_layout.addWidget(self.queue_btn)
+        main_layout.addLayout(btn_layout)
 
     def refresh_profiles(self):
         current = self.profile_combo.currentText()
@@ -188,7 +193,7 @@ class ResponseTab(QWidget):
             data = self.collect_data()
             presets = self.get_all_presets()
             presets[name] = data
-            with open(PRESETS_FILE, "w", encoding="utf-8") as f: json.dump(presets, f, indent=4)
+            save_presets(presets)
             self.load_presets_list()
             self.preset_combo.setCurrentText(name)
 
@@ -198,10 +203,7 @@ class ResponseTab(QWidget):
         self.preset_combo.addItems(presets.keys()); self.preset_combo.blockSignals(False)
 
     def get_all_presets(self):
-        if not os.path.exists(PRESETS_FILE): return {}
-        try:
-            with open(PRESETS_FILE, "r", encoding="utf-8") as f: return json.load(f)
-        except: return {}
+        return load_presets()
 
     def load_selected_preset(self):
         name = self.preset_combo.currentText()
@@ -226,5 +228,5 @@ class ResponseTab(QWidget):
         presets = self.get_all_presets()
         if name in presets:
             del presets[name]
-            with open(PRESETS_FILE, "w", encoding="utf-8") as f: json.dump(presets, f)
+            save_presets(presets)
             self.load_presets_list()
\ No newline at end of file
@@ -9,9 +9,9 @@ from core.utils import get_user_data_path
 
 
 class SettingsTab(QWidget):
-    def __init__(self):
+    def __init__(self, settings_mgr=None):
         super().__init__()
-        self.settings_mgr = SettingsManager()
+        self.settings_mgr = settings_mgr or SettingsManager()
         self.init_ui()
         self.refresh_profiles()
 
@@ -74,11 +74,75 @@ class SettingsTab(QWidget):
         self.limit_app.setMinimumHeight(35)
         form_layout.addRow("Макс. откликов за запуск:", self.limit_app)
 
+        self.daily_limit = QDoubleSpinBox()
+        self.daily_limit.setDecimals(0)
+        self.daily_limit.setRange(1, 200)
+        self.daily_limit.setValue(self.settings_mgr.get("daily_application_limit"))
+        self.daily_limit.valueChanged.connect(lambda v: self.settings_mgr.set("daily_application_limit", int(v)))
+        self.daily_limit.setMinimumHeight(35)
+        form_layout.addRow("Откликов в сутки (квота):", self.daily_limit)
+
+        self.quota_burst = QDoubleSpinBox()
+        self.quota_burst.setDecimals(0)
+        self.quota_burst.setRange(1, 200)
+        self.quota_burst.setValue(self.settings_mgr.get("quota_burst"))
+        self.quota_burst.valueChanged.connect(lambda v: self.settings_mgr.set("quota_burst", int(v)))
+        self.quota_burst.setMinimumHeight(35)
+        form_layout.addRow("Откликов подряд без паузы:", self.quota_burst)
+
+        self.quota_hours = QDoubleSpinBox()
+        self.quota_hours.setDecimals(0)
+        self.quota_hours.setRange(1, 24)
+        self.quota_hours.setValue(self.settings_mgr.get("quota_active_hours"))
+        self.quota_hours.valueChanged.connect(lambda v: self.settings_mgr.set("quota_active_hours", int(v)))
+        self.quota_hours.setMinimumHeight(35)
+        form_layout.addRow("Растянуть квоту на (часов):", self.quota_hours)
+
         self.check_multi = QCheckBox("Разрешить мульти-аккаунт (одновременно)")
         self.check_multi.setChecked(self.settings_mgr.get("enable_multi_account"))
         self.check_multi.stateChanged.connect(lambda v: self.settings_mgr.set("enable_multi_account", bool(v)))
         form_layout.addRow(self.check_multi)
 
+        self.max_parallel = QDoubleSpinBox()
+        self.max_parallel.setDecimals(0)
+        self.max_parallel.setRange(1, 20)
+        self.max_parallel.setValue(self.settings_mgr.get("max_parallel_profiles"))
+        self.max_parallel.valueChanged.connect(lambda v: self.settings_mgr.set("max_parallel_profiles", int(v)))
+        self.max_parallel.setMinimumHeight(35)
+        form_layout.addRow("Профилей одновременно:", self.max_parallel)
+
+        self.check_auto_capacity = QCheckBox("Ограничивать очередь по CPU и памяти")
+        self.check_auto_capacity.setChecked(self.settings_mgr.get("scheduler_auto_capacity"))
+        self.check_auto_capacity.stateChanged.connect(
+            lambda v: self.settings_mgr.set("scheduler_auto_capacity", bool(v)))
+        form_layout.addRow(self.check_auto_capacity)
+
+        self.ram_per_profile = QDoubleSpinBox()
+        self.ram_per_profile.setDecimals(0)
+        self.ram_per_profile.setRange(100, 4000)
+        self.ram_per_profile.setSingleStep(100)
+        self.ram_per_profile.setValue(self.settings_mgr.get("scheduler_ram_per_profile_mb"))
+        self.ram_per_profile.valueChanged.connect(
+            lambda v: self.settings_mgr.set("scheduler_ram_per_profile_mb", int(v)))
+        self.ram_per_profile.setMinimumHeight(35)
+        form_layout.addRow("Памяти на профиль (МБ):", self.ram_per_profile)
+
+        self.pool_browsers = QDoubleSpinBox()
+        self.pool_browsers.setDecimals(0)
+        self.pool_browsers.setRange(1, 10)
+        self.pool_browsers.setValue(self.settings_mgr.get("pool_max_browsers"))
+        self.pool_browsers.valueChanged.connect(lambda v: self.settings_mgr.set("pool_max_browsers", int(v)))
+        self.pool_browsers.setMinimumHeight(35)
+        form_layout.addRow("Процессов Chrome (макс):", self.pool_browsers)
+
+        self.pool_recycle = QDoubleSpinBox()
+        self.pool_recycle.setDecimals(0)
+        self.pool_recycle.setRange(1, 500)
+        self.pool_recycle.setValue(self.settings_mgr.get("pool_recycle_after"))
+        self.pool_recycle.valueChanged.connect(lambda v: self.settings_mgr.set("pool_recycle_after", int(v)))
+        self.pool_recycle.setMinimumHeight(35)
+        form_layout.addRow("Перезапуск Chrome после N запусков:", self.pool_recycle)
+
         limits_group.setLayout(form_layout)
         layout.addWidget(limits_group)
 
@@ -121,6 +185,12 @@ class SettingsTab(QWidget):
         self.type_max.valueChanged.connect(lambda v: self.settings_mgr.set("typing_speed_max", v))
         col1_layout.addRow("Печать макс (сек/симв):", self.type_max)
 
+        self.type_chunk = self.create_spin(self.settings_mgr.get("typing_chunk"), 1, 20)
+        self.type_chunk.setDecimals(0)
+        self.type_chunk.setSingleStep(1)
+        self.type_chunk.valueChanged.connect(lambda v: self.settings_mgr.set("typing_chunk", int(v)))
+        col1_layout.addRow("Печать кусками (симв):", self.type_chunk)
+
         # --- КОЛОНКА 2: Скролл ---
         col2_layout = QFormLayout()
         col2_layout.setSpacing(12)
@@ -160,6 +230,11 @@ class SettingsTab(QWidget):
         self.check_headless.stateChanged.connect(lambda v: self.settings_mgr.set("headless_mode", bool(v)))
         stealth_layout.addWidget(self.check_headless)
 
+        self.check_prewarm = QCheckBox("Запускать браузер заранее (быстрый старт)")
+        self.check_prewarm.setChecked(self.settings_mgr.get("prewarm_browsers"))
+        self.check_prewarm.stateChanged.connect(lambda v: self.settings_mgr.set("prewarm_browsers", bool(v)))
+        stealth_layout.addWidget(self.check_prewarm)
+
         self.check_stealth = QCheckBox("Скрывать WebDriver (Stealth)")
         self.check_stealth.setChecked(self.settings_mgr.get("use_stealth"))
         self.check_stealth.stateChanged.connect(lambda v: self.settings_mgr.set("use_stealth", bool(v)))
@@ -170,9 +245,88 @@ class SettingsTab(QWidget):
         self.check_human.stateChanged.connect(lambda v: self.settings_mgr.set("use_human_moves", bool(v)))
         stealth_layout.addWidget(self.check_human)
 
+        self.check_mouse = QCheckBox("Движение курсора по кривой перед кликом")
+        self.check_mouse.setChecked(self.settings_mgr.get("human_mouse"))
+        self.check_mouse.stateChanged.connect(lambda v: self.settings_mgr.set("human_mouse", bool(v)))
+        stealth_layout.addWidget(self.check_mouse)
+
         stealth_group.setLayout(stealth_layout)
         layout.addWidget(stealth_group)
 
+        # ==========================================
+        # 5. ПРОИЗВОДИТЕЛЬНОСТЬ
+        # ==========================================
+        perf_group = QGroupBox("Производительность")
+        perf_layout = QFormLayout()
+        perf_layout.setSpacing(12)
+
+        self.block_mode = AnimatedComboBox()
+        self.block_mode.setMinimumHeight(35)
+        self.block_mode.addItems(["off", "light", "aggressive"])
+        self.block_mode.setCurrentText(self.settings_mgr.get("block_resources") or "off")
+        self.block_mode.currentTextChanged.connect(lambda t: self.settings_mgr.set("block_resources", t))
+        perf_layout.addRow("Блокировка картинок/аналитики:", self.block_mode)
+
+        self.serp_mode = AnimatedComboBox()
+        self.serp_mode.setMinimumHeight(35)
+        self.serp_mode.addItems(["render", "harvest"])
+        self.serp_mode.setCurrentText(self.settings_mgr.get("serp_mode") or "render")
+        self.serp_mode.currentTextChanged.connect(lambda t: self.settings_mgr.set("serp_mode", t))
+        perf_layout.addRow("Сбор выдачи (harvest = без браузера):", self.serp_mode)
+
+        self.prefetch_depth = QDoubleSpinBox()
+        self.prefetch_depth.setDecimals(0)
+        self.prefetch_depth.setRange(0, 5)
+        self.prefetch_depth.setValue(self.settings_mgr.get("prefetch_depth"))
+        self.prefetch_depth.valueChanged.connect(lambda v: self.settings_mgr.set("prefetch_depth", int(v)))
+        self.prefetch_depth.setMinimumHeight(35)
+        perf_layout.addRow("Предзагрузка страниц выдачи:", self.prefetch_depth)
+
+        self.serp_cache_ttl = QDoubleSpinBox()
+        self.serp_cache_ttl.setDecimals(0)
+        self.serp_cache_ttl.setRange(0, 168)
+        self.serp_cache_ttl.setValue(self.settings_mgr.get("serp_cache_ttl_hours"))
+        self.serp_cache_ttl.valueChanged.connect(lambda v: self.settings_mgr.set("serp_cache_ttl_hours", int(v)))
+        self.serp_cache_ttl.setMinimumHeight(35)
+        perf_layout.addRow("Кэш выдачи, часов (0 - выкл):", self.serp_cache_ttl)
+
+        self.apply_transport = AnimatedComboBox()
+        self.apply_transport.setMinimumHeight(35)
+        self.apply_transport.addItems(["modal", "http"])
+        self.apply_transport.setCurrentText(self.settings_mgr.get("apply_transport") or "modal")
+        self.apply_transport.currentTextChanged.connect(lambda t: self.settings_mgr.set("apply_transport", t))
+        perf_layout.addRow("Отправка отклика (http = без модалки):", self.apply_transport)
+
+        self.trace_sink = AnimatedComboBox()
+        self.trace_sink.setMinimumHeight(35)
+        self.trace_sink.addItems(["off", "sqlite", "jsonl"])
+        self.trace_sink.setCurrentText(self.settings_mgr.get("trace_sink") or "off")
+        self.trace_sink.currentTextChanged.connect(lambda t: self.settings_mgr.set("trace_sink", t))
+        perf_layout.addRow("Трассировка шагов:", self.trace_sink)
+
+        self.check_pacing = QCheckBox("Человеческие паузы между действиями")
+        self.check_pacing.setChecked(self.settings_mgr.get("human_pacing"))
+        self.check_pacing.stateChanged.connect(lambda v: self.settings_mgr.set("human_pacing", bool(v)))
+        perf_layout.addRow(self.check_pacing)
+
+        self.worker_mode = AnimatedComboBox()
+        self.worker_mode.setMinimumHeight(35)
+        self.worker_mode.addItems(["thread", "process"])
+        self.worker_mode.setCurrentText(self.settings_mgr.get("worker_mode") or "thread")
+        self.worker_mode.currentTextChanged.connect(lambda t: self.settings_mgr.set("worker_mode", t))
+        perf_layout.addRow("Запуск профилей (process = отдельный процесс):", self.worker_mode)
+
+        self.worker_restarts = QDoubleSpinBox()
+        self.worker_restarts.setDecimals(0)
+        self.worker_restarts.setRange(0, 10)
+        self.worker_restarts.setValue(self.settings_mgr.get("worker_restarts"))
+        self.worker_restarts.valueChanged.connect(lambda v: self.settings_mgr.set("worker_restarts", int(v)))
+        self.worker_restarts.setMinimumHeight(35)
+        perf_layout.addRow("Перезапусков упавшего процесса:", self.worker_restarts)
+
+        perf_group.setLayout(perf_layout)
+        layout.addWidget(perf_group)
+
         layout.addStretch()
 
         # Устанавливаем виджет в скролл
@@ -1,20 +1,94 @@
+from datetime import date
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                             QTableWidget, QTableWidgetItem, QHeaderView, QPushButton)
-from PyQt6.QtCore import QTimer, Qt
+                             QTableView, QHeaderView, QPushButton)
+from PyQt6.QtCore import QTimer, Qt, QAbstractTableModel, QModelIndex
 from database.db_manager import DBManager
 from gui.custom_widgets import AnimatedComboBox
 
+PAGE_SIZE = 200  # Строк за одну подгрузку при прокрутке и максимум новых строк за тик
+
+
+class ApplicationsModel(QAbstractTableModel):
+    """
+    Отклики для таблицы статистики. Держит только прокрученные строки:
+    первая страница при сбросе, следующие - по fetchMore, новые - запросом id > последнего.
+    """
+    HEADERS = ["Вакансия", "Компания", "Профиль", "Время"]
+
+    def __init__(self, db):
+        super().__init__()
+        self.db = db
+        self.profile_filter = None
+        self.rows = []  # (id, title, company, timestamp, profile, status, transport, latency_ms), новые первыми
+        self.exhausted = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid(): return None
+        _, title, company, timestamp, profile = self.rows[index.row()][:5]
+        col = index.column()
+        if col == 0: return str(title)
+        if col == 1: return str(company)
+        if col == 2: return str(profile)
+        return str(timestamp).split('.')[0]
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def reset(self, profile_filter):
+        self.beginResetModel()
+        self.profile_filter = profile_filter
+        self.rows = self.db.get_applications_page(profile_filter, limit=PAGE_SIZE)
+        self.exhausted = len(self.rows) < PAGE_SIZE
+        self.endResetModel()
+        return self.rows
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.exhausted: return
+        before = self.rows[-1][0] if self.rows else None
+        page = self.db.get_applications_page(self.profile_filter, before_id=before, limit=PAGE_SIZE)
+        self.exhausted = len(page) < PAGE_SIZE
+        if not page: return
+        self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(page) - 1)
+        self.rows.extend(page)
+        self.endInsertRows()
+
+    def poll(self):
+        """Новые записи сверху. None - их больше страницы, проще перечитать (вызывающий сделает reset)."""
+        last = self.rows[0][0] if self.rows else 0
+        fresh = self.db.get_applications_page(self.profile_filter, after_id=last, limit=PAGE_SIZE)
+        if len(fresh) >= PAGE_SIZE: return None
+        if fresh:
+            self.beginInsertRows(QModelIndex(), 0, len(fresh) - 1)
+            self.rows[0:0] = fresh
+            self.endInsertRows()
+        return fresh
+
 
 class StatsTab(QWidget):
     def __init__(self):
         super().__init__()
         self.db = DBManager()
+        self.model = ApplicationsModel(self.db)
+        self.total = self.today = 0
+        self.transports = {}  # transport -> [сумма задержек мс, откликов]
+        self.counted_day = None
         self.init_ui()
 
-        # Таймер автообновления
+        # Таймер автообновления: работает, только пока вкладка на экране (showEvent / hideEvent)
         self.timer = QTimer()
-        self.timer.timeout.connect(self.refresh_stats)
-        self.timer.start(3000)
+        self.timer.timeout.connect(self.poll_stats)
 
     def init_ui(self):
         layout = QVBoxLayout(self)
@@ -29,6 +103,10 @@ class StatsTab(QWidget):
         self.today_label = QLabel("Сегодня: 0")
         self.today_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #a6e3a1;")
 
+        # Транспорты отклика: сколько ушло и средняя задержка
+        self.transport_label = QLabel("")
+        self.transport_label.setStyleSheet("color: #a6adc8;")
+
         # Профиль (Анимированный список)
         self.profile_filter = AnimatedComboBox()
         self.profile_filter.setMinimumHeight(45)
@@ -44,6 +122,8 @@ class StatsTab(QWidget):
         top_layout.addWidget(self.total_label)
         top_layout.addSpacing(20)
         top_layout.addWidget(self.today_label)
+        top_layout.addSpacing(20)
+        top_layout.addWidget(self.transport_label)
         top_layout.addStretch()
 
         top_layout.addWidget(QLabel("Фильтр:"))
@@ -53,14 +133,15 @@ class StatsTab(QWidget):
         layout.addLayout(top_layout)
 
         # === Таблица ===
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Вакансия", "Компания", "Профиль", "Время"])
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setAlternatingRowColors(True)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setDefaultSectionSize(28)
 
         # Стилизация таблицы
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #1e1e2e;
                 color: #cdd6f4;
                 border: 1px solid #45475a;
@@ -92,43 +173,63 @@ class StatsTab(QWidget):
         # 4-я колонка (Время) займет всё оставшееся место
 
         layout.addWidget(self.table)
+        self.refresh_profiles(self.db.get_profiles())
         self.refresh_stats()
 
-    def refresh_stats(self):
-        filter_val = self.profile_filter.currentText()
-        db_filter = None if filter_val == "Все профили" else filter_val
-
-        total, today = self.db.get_stats(db_filter)
-        self.total_label.setText(f"Всего: {total}")
-        self.today_label.setText(f"Сегодня: {today}")
-
-        rows = self.db.get_all_applications(db_filter)
-        self.table.setRowCount(len(rows))
-
-        all_profiles = set()
-        for i, (title, company, timestamp, profile) in enumerate(rows):
-            if profile: all_profiles.add(profile)
-
-            # Создаем ячейки (только для чтения)
-            item_title = QTableWidgetItem(str(title))
-            item_title.setFlags(item_title.flags() ^ Qt.ItemFlag.ItemIsEditable)
-
-            item_company = QTableWidgetItem(str(company))
-            item_company.setFlags(item_company.flags() ^ Qt.ItemFlag.ItemIsEditable)
-
-            item_profile = QTableWidgetItem(str(profile))
-            item_profile.setFlags(item_profile.flags() ^ Qt.ItemFlag.ItemIsEditable)
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.poll_stats()
+        self.timer.start(3000)
 
-            item_time = QTableWidgetItem(str(timestamp).split('.')[0])
-            item_time.setFlags(item_time.flags() ^ Qt.ItemFlag.ItemIsEditable)
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
 
-            self.table.setItem(i, 0, item_title)
-            self.table.setItem(i, 1, item_company)
-            self.table.setItem(i, 2, item_profile)
-            self.table.setItem(i, 3, item_time)
+    def current_filter(self):
+        filter_val = self.profile_filter.currentText()
+        return None if filter_val == "Все профили" else filter_val
 
+    def refresh_stats(self):
+        """Полное перечитывание: смена фильтра, кнопка «Обновить», новый день."""
+        db_filter = self.current_filter()
+        self.total, self.today = self.db.get_stats(db_filter)
+        self.counted_day = date.today()
+        self.update_labels()
+        # Полный GROUP BY - только здесь, тики таймера досчитывают по новым строкам
+        stats = self.db.get_transport_stats(db_filter)
+        self.transports = {t: [(avg or 0) * cnt, cnt] for t, (avg, cnt) in stats.items()}
+        self.update_transports()
+        self.model.reset(db_filter)
+
+    def poll_stats(self):
+        """Тик таймера: только записи новее последней показанной, счетчики - приращением."""
+        if self.counted_day != date.today(): return self.refresh_stats()
+        fresh = self.model.poll()
+        if fresh is None: return self.refresh_stats()
+        if not fresh: return
+        success = sum(1 for row in fresh if row[5] == "success")
+        self.total += success
+        self.today += success
+        self.update_labels()
+        for row in fresh:
+            if not row[6]: continue
+            entry = self.transports.setdefault(row[6], [0.0, 0])
+            entry[0] += row[7] or 0
+            entry[1] += 1
+        self.update_transports()
+        self.refresh_profiles({row[4] for row in fresh if row[4]})
+
+    def update_labels(self):
+        self.total_label.setText(f"Всего: {self.total}")
+        self.today_label.setText(f"Сегодня: {self.today}")
+
+    def update_transports(self):
+        self.transport_label.setText("   ".join(f"{t}: {cnt} (≈{total / cnt / 1000:.1f} с)"
+                                                for t, (total, cnt) in sorted(self.transports.items()) if cnt))
+
+    def refresh_profiles(self, profiles):
         # Обновляем фильтр
         current_items = [self.profile_filter.itemText(i) for i in range(self.profile_filter.count())]
-        for p in all_profiles:
+        for p in profiles:
             if p not in current_items:
-                self.profile_filter.addItem(p)
\ No newline at end of file
+                self.profile_filter.addItem(p)
@@ -1,5 +1,5 @@
-from PyQt6.QtCore import QThread, pyqtSignal
-from core.browser_manager import BrowserEngine
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from core.settings_manager import SettingsManager
 import logging
 import os
 import time
@@ -7,88 +7,93 @@ import time
 logger = logging.getLogger("HH_Automation_bot")
 
 
-class SearchWorker(QThread):
+class EngineWorker(QObject):
+    """
+    Тонкий адаптер над общим asyncio-циклом движка (core/runtime.py).
+    Сохраняет прежний интерфейс воркеров: start(), stop(), finished_signal.
+    """
     finished_signal = pyqtSignal(str, str)
+    progress_signal = pyqtSignal(str, int, int)  # профиль, отправлено, лимит
+    job_kind = None
 
-    def __init__(self, search_data, profile_name):
+    def __init__(self, payload, profile_name):
         super().__init__()
-        self.search_data = search_data
+        self.payload = payload
         self.profile_name = profile_name
         self.engine = None
+        self.future = None
 
-    def run(self):
-        status = "finished"
-        try:
-            time.sleep(0.5)
-            self.engine = BrowserEngine(self.profile_name)
-            self.engine.start_browser()
-            self.engine.run_search(self.search_data)
+    def start(self):
+        # Движок импортируется при первом запуске, а не при старте окна
+        from core.browser_manager import BrowserEngine
+        from core.jobs import run_job
+        from core.runtime import get_runtime
 
+        self.engine = BrowserEngine(self.profile_name)
+        self.engine.progress = lambda done, total: self.progress_signal.emit(self.profile_name, done, total)
+        self.future = get_runtime().submit(run_job(self.engine, self.job_kind, self.payload))
+        self.future.add_done_callback(self._on_done)
+
+    def _on_done(self, future):
+        # Вызывается в потоке цикла: сигнал уйдет в GUI через очередь Qt
+        try:
+            status = future.result()
         except BaseException as e:
-            err = str(e)
-            # Ловим все вариации ошибки закрытия
-            if "Stopped by button" in err:
-                status = "stopped"
-            elif "ManualClose" in err or "Target closed" in err or "browser has been closed" in err:
-                status = "closed_by_user"
-                logger.warning(f"[{self.profile_name}] Обнаружено ручное закрытие.")
-            else:
-                status = f"error: {err}"
-                logger.error(f"[{self.profile_name}] CRITICAL: {err}")
-        finally:
-            if self.engine:
-                try:
-                    self.engine.stop_browser()
-                except:
-                    pass
-            self.finished_signal.emit(status, self.profile_name)
+            status = f"error: {e}"
+        self.finished_signal.emit(status, self.profile_name)
 
     def stop(self):
+        # Потокобезопасно: токен будит сон и отменяет висящие операции Playwright
         if self.engine: self.engine.stop_execution()
 
 
-class ActivityWorker(QThread):
-    finished_signal = pyqtSignal(str, str)
+class SearchWorker(EngineWorker):
+    job_kind = "search"
+
+    def __init__(self, search_data, profile_name):
+        super().__init__(search_data, profile_name)
+        self.search_data = search_data
+
+
+class ActivityWorker(EngineWorker):
+    job_kind = "activity"
 
     def __init__(self, settings, profile_name):
-        super().__init__()
+        super().__init__(settings, profile_name)
         self.settings = settings
-        self.profile_name = profile_name
-        self.engine = None
 
-    def run(self):
-        status = "finished"
-        try:
-            time.sleep(0.5)
-            self.engine = BrowserEngine(self.profile_name)
-            self.engine.start_browser()
 
-            if self.settings["use_chat"]:
-                self.engine.run_chat_activity(self.settings)
+class ProcessEngineWorker(QObject):
+    """
+    Тот же интерфейс (start, stop, finished_signal), но профиль крутится в своем процессе
+    (core/process_worker.py). Логи и прогресс приходят по каналу, stop уходит туда же.
+    """
+    finished_signal = pyqtSignal(str, str)
+    progress_signal = pyqtSignal(str, int, int)
 
-            if self.settings["use_resume"]:
-                self.engine.run_resume_update()
+    def __init__(self, kind, payload, profile_name):
+        super().__init__()
+        from core.process_worker import ProcessJob
+        self.profile_name = profile_name
+        self.job = ProcessJob(kind, profile_name, payload,
+                              on_log=lambda level, text: logger.log(level, text),
+                              on_progress=lambda done, total: self.progress_signal.emit(profile_name, done, total),
+                              on_finished=lambda status: self.finished_signal.emit(status, profile_name),
+                              restarts=SettingsManager().get("worker_restarts") or 0)
 
-        except BaseException as e:
-            err = str(e)
-            if "Stopped by button" in err:
-                status = "stopped"
-            elif "ManualClose" in err or "Target closed" in err or "browser has been closed" in err:
-                status = "closed_by_user"
-                logger.warning(f"[{self.profile_name}] Обнаружено ручное закрытие.")
-            else:
-                status = f"error: {err}"
-                logger.error(f"[{self.profile_name}] CRITICAL: {err}")
-        finally:
-            if self.engine:
-                try:
-                    self.engine.stop_browser()
-                except:
-                    pass
-            self.finished_signal.emit(status, self.profile_name)
+    def start(self):
+        self.job.start()
 
     def stop(self):
-        if self.engine: self.engine.stop_execution()
+        self.job.stop()
+
+
+def create_worker(kind, payload, profile_name):
+    """Воркер под настройку worker_mode: общий цикл (thread) или отдельный процесс (process)."""
+    if SettingsManager().get("worker_mode") == "process":
+        return ProcessEngineWorker(kind, payload, profile_name)
+    if kind == "search": return SearchWorker(payload, profile_name)
+    return ActivityWorker(payload, profile_name)
 
 
 class LoginWorker(QThread):
@@ -0,0 +1 @@
+"""Консольный запуск движка без GUI: python -m hh_bot --help"""
@@ -0,0 +1,168 @@
+"""
+Запуск профиля без окна (серверы, cron, systemd). PyQt не импортируется.
+
+    python -m hh_bot run --profile ivan --preset "Аналитик"
+    python -m hh_bot run --profile ivan --text "python разработчик" --limit 30
+    python -m hh_bot activity --profile ivan --chat --resume
+    python -m hh_bot presets
+
+stdout - только события JSON построчно (start / progress / finish), логи - в stderr и файл логов.
+Коды выхода - EXIT_*.
+"""
+import argparse
+import json
+import os
+import signal
+import sys
+import time
+from concurrent.futures import TimeoutError as FutureTimeout
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_USAGE = 2  # Неверные аргументы, нет профиля или пресета
+EXIT_STOPPED = 3  # Остановлен сигналом (SIGINT / SIGTERM)
+EXIT_BROWSER_CLOSED = 4
+EXIT_QUOTA = 5  # Суточная квота откликов исчерпана - запускать сегодня бессмысленно
+
+STATUS_CODES = {"finished": EXIT_OK, "stopped": EXIT_STOPPED, "closed_by_user": EXIT_BROWSER_CLOSED}
+
+
+def emit(event, **fields):
+    print(json.dumps({"event": event, "ts": round(time.time(), 3), **fields}, ensure_ascii=False), flush=True)
+
+
+def fail(message, code=EXIT_USAGE):
+    emit("finish", status=f"error: {message}", code=code)
+    return code
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="hh_bot", description="HH Automation Bot без интерфейса")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="рассылка откликов по пресету")
+    run.add_argument("--profile", required=True)
+    source = run.add_mutually_exclusive_group(required=True)
+    source.add_argument("--preset", help="имя пресета из presets.json")
+    source.add_argument("--text", help="поисковый запрос без пресета")
+    run.add_argument("--resume", help="название резюме (по умолчанию из пресета)")
+    run.add_argument("--limit", type=int, help="макс. откликов за запуск")
+    run.add_argument("--mode", choices=["render", "harvest"], help="сбор выдачи")
+    add_common(run)
+
+    activity = sub.add_parser("activity", help="чаты с работодателями и поднятие резюме")
+    activity.add_argument("--profile", required=True)
+    activity.add_argument("--chat", action="store_true", help="рассылка в чатах")
+    activity.add_argument("--resume", action="store_true", help="поднять резюме")
+    activity.add_argument("--employers", type=int, default=5, help="сколько работодателей обойти")
+    activity.add_argument("--msgs-per-hr", type=int, default=2)
+    add_common(activity)
+
+    sub.add_parser("presets", help="список пресетов")
+    return parser
+
+
+def add_common(parser):
+    parser.add_argument("--headed", action="store_true", help="с окном браузера (по умолчанию headless)")
+
+
+def build_search_payload(args):
+    from core.presets import load_presets
+    if args.preset:
+        presets = load_presets()
+        if args.preset not in presets: return None
+        payload = dict(presets[args.preset])
+    else:
+        payload = {"text": args.text, "area": "Все регионы", "cover_letter": ""}
+    if args.resume: payload["resume_name"] = args.resume
+    payload["profile"] = args.profile
+    return payload
+
+
+def build_activity_payload(args):
+    from core.presets import load_messages
+    return {"use_chat": args.chat, "use_resume": args.resume, "max_employers": args.employers,
+            "msgs_per_hr": args.msgs_per_hr, "messages": load_messages(), "profile": args.profile}
+
+
+def profile_exists(profile):
+    from core.utils import get_user_data_path
+    return os.path.exists(os.path.join(get_user_data_path("profiles"), f"{profile}.json"))
+
+
+def run_engine(kind, args, payload):
+    from core.browser_manager import BrowserEngine
+    from core.jobs import run_job
+    from core.runtime import get_runtime
+
+    engine = BrowserEngine(args.profile)
+    overrides = {"headless_mode": not args.headed}
+    if kind == "search":
+        if args.limit: overrides["limit_applications"] = args.limit
+        if args.mode: overrides["serp_mode"] = args.mode
+    engine.settings_mgr.override(**overrides)
+    engine.progress = lambda done, total: emit("progress", profile=args.profile, done=done, total=total)
+
+    if kind == "search":
+        from core.quota import QuotaLedger
+        quota = QuotaLedger.from_settings(engine.db, args.profile, engine.settings_mgr)
+        if quota.remaining_today() <= 0:
+            emit("finish", profile=args.profile, status="quota_exhausted", code=EXIT_QUOTA)
+            return EXIT_QUOTA
+
+    # SIGINT / SIGTERM - штатная остановка через токен, браузер закрывается
+    def on_signal(signum, frame):
+        emit("stopping", profile=args.profile, signal=signum)
+        engine.stop_execution()
+
+    signal.signal(signal.SIGINT, on_signal)
+    if hasattr(signal, "SIGTERM"): signal.signal(signal.SIGTERM, on_signal)
+
+    runtime = get_runtime()
+    emit("start", profile=args.profile, job=kind, preset=getattr(args, "preset", None))
+    started = time.monotonic()
+    future = runtime.submit(run_job(engine, kind, payload))
+    try:
+        while True:
+            try:
+                status = future.result(timeout=0.5)
+                break
+            except FutureTimeout:
+                continue
+    finally:
+        try:
+            runtime.submit(runtime.shutdown()).result(timeout=30)
+        except:
+            pass
+
+    code = STATUS_CODES.get(status, EXIT_ERROR)
+    fields = {"profile": args.profile, "status": status, "code": code,
+              "seconds": round(time.monotonic() - started, 1)}
+    if kind == "search" and engine.quota is not None:
+        fields.update(sent=engine.quota.spent, quota_left=engine.quota.remaining_today())
+    emit("finish", **fields)
+    return code
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    from core.logger import setup_logger
+    # stdout занят событиями - человекочитаемый лог в stderr
+    setup_logger(gui=False, stream=sys.stderr)
+
+    if args.command == "presets":
+        from core.presets import load_presets
+        for name, data in load_presets().items():
+            emit("preset", name=name, text=data.get("text", ""), resume=data.get("resume_name", ""))
+        return EXIT_OK
+
+    if not profile_exists(args.profile): return fail(f"профиль не найден: {args.profile}")
+
+    if args.command == "run":
+        payload = build_search_payload(args)
+        if payload is None: return fail(f"пресет не найден: {args.preset}")
+        if not payload.get("text"): return fail("пустой поисковый запрос")
+        return run_engine("search", args, payload)
+
+    if not args.chat and not args.resume: return fail("укажите --chat и/или --resume")
+    return run_engine("activity", args, build_activity_payload(args))
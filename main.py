@@ -1,11 +1,33 @@
+from core import startup  # Первым: от него считается время старта
 import sys
 import os
 import ctypes
+import multiprocessing
 from PyQt6.QtWidgets import QApplication, QStyleFactory
 from PyQt6.QtGui import QIcon
-from gui.main_window import MainWindow
+from PyQt6.QtCore import QObject, QEvent, QTimer
 from core.utils import get_resource_path
 
+
+class FirstPaintProbe(QObject):
+    """Ловит первую отрисовку окна и закрывает замер старта."""
+
+    def __init__(self, app):
+        super().__init__()
+        self.app = app
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            obj.removeEventFilter(self)
+            # Отчет - после того, как кадр дорисован
+            QTimer.singleShot(0, self.done)
+        return False
+
+    def done(self):
+        startup.finish()
+        if startup.exit_after_paint(): self.app.quit()
+
+
 def main():
     os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
     os.environ["QT_SCALE_FACTOR"] = "1"
@@ -14,6 +36,7 @@ def main():
         myappid = 'mycompany.hhbot.automation.v1'
         ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
 
+    startup.mark("import_qt")
     app = QApplication(sys.argv)
 
     # Иконка приложения
@@ -23,33 +46,25 @@ def main():
         app.setWindowIcon(app_icon)
 
     app.setStyle(QStyleFactory.create("Fusion"))
+    startup.mark("qapplication")
 
-    window = MainWindow()
-
-    # === ФИКС ИКОНОК В QSS ===
-    # Читаем стиль
-    style_path = get_resource_path("gui/styles.qss")
-    if os.path.exists(style_path):
-        with open(style_path, "r", encoding="utf-8") as f:
-            qss_data = f.read()
-
-        # Получаем АБСОЛЮТНЫЙ путь к папке resources
-        # В Windows пути с обратным слэшем, CSS их не любит, меняем на прямой
-        res_dir = get_resource_path("resources").replace("\\", "/")
+    from gui.main_window import MainWindow
+    startup.mark("import_gui")
 
-        # Подменяем относительный путь на абсолютный прямо в тексте стилей
-        # Было: url(resources/icons/...)
-        # Стало: url(C:/Path/To/_internal/resources/icons/...)
-        qss_data = qss_data.replace("url(resources", f"url({res_dir}")
-
-        window.setStyleSheet(qss_data)
+    # Стили (с абсолютными путями к иконкам) применяет само окно - один раз
+    window = MainWindow()
+    startup.mark("build_window")
 
     if os.path.exists(icon_path):
         window.setWindowIcon(QIcon(icon_path))
 
+    probe = FirstPaintProbe(app)
+    window.installEventFilter(probe)
     window.show()
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Процессы профилей (worker_mode = process) в собранном EXE
+    multiprocessing.freeze_support()
+    main()
@@ -0,0 +1,5 @@
+import os
+import tempfile
+
+# До импорта core: папка данных (настройки, база) - временная, пользовательские не трогаем
+os.environ.setdefault("HH_BOT_DATA_DIR", tempfile.mkdtemp(prefix="hh_tests_"))
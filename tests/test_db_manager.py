@@ -0,0 +1,15 @@
+from database.db_manager import DBManager
+
+
+def span(run_id, i):
+    return {"run_id": run_id, "profile": "p", "vacancy_id": str(i), "step": "apply", "started": float(i),
+            "duration_ms": 1.0, "outcome": "sent"}
+
+
+def test_trace_spans_keep_last(tmp_path):
+    db = DBManager(str(tmp_path / "test.db"))
+    for batch in range(5):
+        db.add_spans([span(f"run{batch}", batch * 10 + i) for i in range(10)], keep_last=25)
+    spans = db.get_spans(last_runs=10)
+    assert len(spans) == 25
+    assert {s["run_id"] for s in spans} == {"run2", "run3", "run4"}
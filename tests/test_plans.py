@@ -0,0 +1,61 @@
+import random
+
+from core.keystrokes import KeystrokePlan, key_commands, THINK_PAUSE
+from core.scroll_plan import plan_random, plan_smooth, MAX_STEPS
+
+TEXT = "Здравствуйте!\nМеня заинтересовала вакансия аналитика.\nСпасибо."
+
+
+def test_keystroke_plan_reproduces_text():
+    for chunk in (1, 4, 10):
+        plan = KeystrokePlan.compile(TEXT, 0.05, 0.1, chunk, rng=random.Random(1))
+        assert "".join(text for text, _ in plan.steps) == TEXT
+        assert all(len(text) <= chunk for text, _ in plan.steps)
+
+
+def test_keystroke_plan_flushes_on_newline():
+    plan = KeystrokePlan.compile(TEXT, 0.05, 0.1, 100, rng=random.Random(1))
+    for text, _ in plan.steps[:-1]:
+        assert text.endswith("\n") or len(text) < 100
+
+
+def test_keystroke_plan_delays():
+    plan = KeystrokePlan.compile("a" * 500, 0.05, 0.1, 1, rng=random.Random(2))
+    delays = [delay for _, delay in plan.steps]
+    assert min(delays) >= 50
+    assert max(delays) <= 100 + THINK_PAUSE[1] * 1000
+    assert any(delay > 100 for delay in delays)  # паузы «задумался» есть
+    assert abs(plan.total_seconds - sum(delays) / 1000) < 1e-9
+
+
+def test_keystroke_commands():
+    assert key_commands("abc") == [("Input.insertText", {"text": "abc"})]
+    assert [params["type"] for _, params in key_commands("a")] == ["keyDown", "keyUp"]
+    assert key_commands("\n")[0][1]["key"] == "Enter"
+    plan = KeystrokePlan.compile(TEXT, 0.05, 0.1, 10, rng=random.Random(1))
+    assert plan.send_count < len(TEXT) / 3
+
+
+def test_plan_random_covers_distance():
+    rng = random.Random(3)
+    for distance in (500, -800, 1200):
+        steps = plan_random(distance, 100, 200, rng)
+        assert sum(dy for dy, _ in steps) == distance
+        assert all(abs(dy) <= 200 for dy, _ in steps)
+        assert all(50 <= delay <= 150 for _, delay in steps)
+
+
+def test_plan_smooth_covers_distance():
+    rng = random.Random(4)
+    for distance in (700, -1500):
+        steps = plan_smooth(distance, 150, 300, rng)
+        assert sum(dy for dy, _ in steps) == distance
+        assert all((dy > 0) == (distance > 0) for dy, _ in steps)
+        assert len(steps) <= MAX_STEPS
+
+
+def test_plans_are_capped():
+    steps = plan_random(100000, 10, 20, random.Random(5))
+    assert len(steps) == MAX_STEPS
+    assert sum(dy for dy, _ in steps) < 100000
+    assert len(plan_smooth(100000, 10, 20, random.Random(5))) <= MAX_STEPS
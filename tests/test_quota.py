@@ -0,0 +1,45 @@
+import time
+
+from core.apply_transport import ModalApplyTransport
+from core.quota import QuotaLedger
+from database.db_manager import DBManager
+
+
+class FakeEngine:
+    def __init__(self, db):
+        self.db = db
+        self.profile_name = "p"
+        self.applied = None
+        self.quota = QuotaLedger(db, "p", daily_limit=200, burst=5)
+
+
+def card(vacancy_id):
+    return {"id": vacancy_id, "title": "t", "company": "c", "url": f"https://hh.ru/vacancy/{vacancy_id}"}
+
+
+def test_spends_only_on_inserted_rows(tmp_path):
+    db = DBManager(str(tmp_path / "quota.db"))
+    engine = FakeEngine(db)
+    transport = ModalApplyTransport(engine)
+    transport._record(card("1"), time.monotonic())
+    transport._record(card("1"), time.monotonic())
+    transport._record(card("2"), time.monotonic())
+    assert engine.quota.spent == 2
+    assert engine.quota.used_today() == 2
+    assert transport.stats["modal"][0] == 2
+
+
+def test_bucket_limits_burst(tmp_path):
+    quota = QuotaLedger(DBManager(str(tmp_path / "quota.db")), "p", daily_limit=200, burst=2, active_hours=10)
+    assert quota.delay() == 0.0
+    quota.spend()
+    quota.spend()
+    assert quota.delay() > 0
+    assert quota.plan_run(500) == 198
+
+
+def test_daily_limit_exhausted(tmp_path):
+    quota = QuotaLedger(DBManager(str(tmp_path / "quota.db")), "p", daily_limit=1, burst=5)
+    quota.spend()
+    assert quota.delay() is None
+    assert quota.plan_run(10) == 0
@@ -0,0 +1,75 @@
+from core.scheduler import JobScheduler, PRIORITY_HIGH, PRIORITY_NORMAL
+
+
+class Settings:
+    def __init__(self, **values):
+        self.values = {"enable_multi_account": True, "max_parallel_profiles": 2, "scheduler_auto_capacity": False}
+        self.values.update(values)
+
+    def get(self, key):
+        return self.values.get(key)
+
+
+class Worker:
+    def __init__(self):
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+
+def make(**settings):
+    started = []
+
+    def launch(job):
+        started.append(job)
+        return Worker()
+
+    return JobScheduler(launch, Settings(**settings)), started
+
+
+def test_capacity_limits_running():
+    scheduler, started = make()
+    for profile in ("a", "b", "c"):
+        scheduler.submit("search", profile, {})
+    assert [job.profile for job in started] == ["a", "b"]
+    assert [job.profile for job in scheduler.queued()] == ["c"]
+
+
+def test_single_account_runs_one():
+    scheduler, started = make(enable_multi_account=False)
+    scheduler.submit("search", "a", {})
+    scheduler.submit("search", "b", {})
+    assert len(started) == 1
+
+
+def test_one_job_per_profile():
+    scheduler, started = make()
+    first = scheduler.submit("search", "a", {})
+    scheduler.submit("activity", "a", {})
+    other = scheduler.submit("search", "b", {})
+    assert started == [first, other]
+    scheduler.finished(first)
+    assert [job.kind for job in started if job.profile == "a"] == ["search", "activity"]
+
+
+def test_priority_order():
+    scheduler, started = make(max_parallel_profiles=1)
+    blocker = scheduler.submit("search", "x", {})
+    scheduler.submit("search", "a", {}, priority=PRIORITY_NORMAL)
+    scheduler.submit("search", "b", {}, priority=PRIORITY_NORMAL)
+    scheduler.submit("search", "c", {}, priority=PRIORITY_HIGH)
+    assert [job.profile for job in scheduler.queued()] == ["c", "a", "b"]
+    scheduler.finished(blocker)
+    assert started[-1].profile == "c"
+
+
+def test_busy_profile_does_not_block_queue():
+    scheduler, started = make()
+    running = scheduler.submit("search", "a", {})
+    waiting = scheduler.submit("activity", "a", {}, priority=PRIORITY_HIGH)
+    free = scheduler.submit("search", "b", {})
+    assert free in started and waiting not in started
+    assert scheduler.queued() == [waiting]
+    scheduler.finished(running)
+    assert waiting in started
@@ -0,0 +1,110 @@
+import asyncio
+import json
+import os
+import urllib.request
+
+import pytest
+
+from core.serp_cache import SerpCache, canonical_query
+from core.serp_harvester import parse_serp
+from database.db_manager import DBManager
+from tools.fake_hh import FakeHHServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PER_PAGE = 20
+
+
+@pytest.fixture(scope="module")
+def locators():
+    with open(os.path.join(ROOT, "resources", "locators.json"), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeHHServer(vacancies=45) as srv:
+        yield srv
+
+
+def fetch(server, page):
+    url = f"{server.base_url}/search/vacancy?text=python&page={page}&items_on_page={PER_PAGE}"
+    with urllib.request.urlopen(url) as response:
+        return response.read().decode("utf-8")
+
+
+def test_parse_cards(server, locators):
+    cards, next_url = parse_serp(fetch(server, 0), locators)
+    expected = server.state.vacancies[:PER_PAGE]
+    assert [c["id"] for c in cards] == [v.id for v in expected]
+    assert [c["title"] for c in cards] == [v.title for v in expected]
+    assert [c["company"] for c in cards] == [v.company for v in expected]
+    assert [c["responded"] for c in cards] == [v.responded for v in expected]
+    assert [c["has_apply"] for c in cards] == [v.has_apply and not v.responded for v in expected]
+    assert [c["index"] for c in cards] == list(range(PER_PAGE))
+    assert "page=1" in next_url
+
+
+def test_last_page_has_no_next(server, locators):
+    cards, next_url = parse_serp(fetch(server, 2), locators)
+    assert len(cards) == 5
+    assert next_url is None
+
+
+class FakeHarvester:
+    """Страницы выдачи из списка, новые вакансии сверху."""
+
+    def __init__(self, ids, per_page=10):
+        self.ids = ids
+        self.per_page = per_page
+        self.fetched = []
+
+    def log(self, message):
+        pass
+
+    async def fetch_page(self, params, page=0):
+        self.fetched.append(page)
+        chunk = self.ids[page * self.per_page:(page + 1) * self.per_page]
+        cards = [{"id": str(i), "title": f"v{i}", "company": "c", "url": f"/vacancy/{i}"} for i in chunk]
+        return cards, (page + 1) * self.per_page < len(self.ids)
+
+
+def collect(cache, harvester, params):
+    async def run():
+        return [card["id"] async for card in cache.harvest(harvester, params)]
+    return asyncio.run(run())
+
+
+def test_canonical_query_ignores_paging():
+    a = canonical_query([("text", "python"), ("page", "3"), ("area", "1")])
+    b = canonical_query([("area", "1"), ("items_on_page", "50"), ("text", " python ")])
+    assert a == b
+
+
+def test_serp_cache_fetches_only_new_pages(tmp_path):
+    db = DBManager(str(tmp_path / "cache.db"))
+    params = [("text", "python")]
+    first = FakeHarvester(list(range(130, 100, -1)))
+    cache = SerpCache(db, ttl_hours=12)
+    assert collect(cache, first, params) == [str(i) for i in range(130, 100, -1)]
+    assert first.fetched == [0, 1, 2]
+    cache.store()
+
+    # Две новые вакансии сверху: запрашивается только первая страница
+    second = FakeHarvester(list(range(132, 100, -1)))
+    cache = SerpCache(db, ttl_hours=12)
+    ids = collect(cache, second, params)
+    assert second.fetched == [0]
+    assert ids[:2] == ["132", "131"]
+    assert ids == [str(i) for i in range(132, 100, -1)]
+    assert cache.hits == 30 and cache.misses == 2
+
+
+def test_serp_cache_expired_ttl(tmp_path):
+    db = DBManager(str(tmp_path / "cache.db"))
+    params = [("text", "python")]
+    cache = SerpCache(db, ttl_hours=0)
+    collect(cache, FakeHarvester(list(range(20, 0, -1))), params)
+    cache.store()
+    again = FakeHarvester(list(range(20, 0, -1)))
+    collect(SerpCache(db, ttl_hours=0), again, params)
+    assert again.fetched == [0, 1]
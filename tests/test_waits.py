@@ -0,0 +1,80 @@
+import asyncio
+
+from core.tracing import Tracer
+from core.waits import LatencyBook, Waiter, STEP_BUDGETS
+
+
+class FakeDB:
+    def __init__(self):
+        self.rows = []
+
+    def get_step_latencies(self, limit):
+        return []
+
+    def add_step_latencies(self, rows):
+        self.rows.extend(rows)
+
+
+class FakeEngine:
+    def __init__(self):
+        self.tracer = Tracer("test")
+
+    def check_running(self):
+        pass
+
+
+class TimeoutError(Exception):
+    """Как playwright TimeoutError: ловится по имени класса."""
+
+
+def make_waiter():
+    book = LatencyBook(FakeDB())
+    return Waiter(FakeEngine(), book), book
+
+
+async def timed_out(timeout_ms):
+    raise TimeoutError(f"Timeout {timeout_ms}ms exceeded.")
+
+
+async def ready(timeout_ms):
+    return None
+
+
+def test_fast_history_shrinks_budget_to_minimum():
+    _, book = make_waiter()
+    for _ in range(20): book.record("modal_close", 0.2)
+    assert book.budget_ms("modal_close") == STEP_BUDGETS["modal_close"][1]
+
+
+def test_repeated_timeouts_raise_budget():
+    waiter, book = make_waiter()
+    for _ in range(20): book.record("modal_close", 0.2)
+    budgets = [book.budget_ms("modal_close")]
+    for _ in range(6):
+        assert asyncio.run(waiter.until("modal_close", timed_out)) is False
+        budgets.append(book.budget_ms("modal_close"))
+    assert budgets[-1] > budgets[0]
+    assert budgets == sorted(budgets)
+    assert budgets[-1] <= STEP_BUDGETS["modal_close"][2]
+
+
+def test_timeouts_cap_at_maximum():
+    waiter, book = make_waiter()
+    for _ in range(30): asyncio.run(waiter.until("modal_close", timed_out))
+    assert book.budget_ms("modal_close") == STEP_BUDGETS["modal_close"][2]
+
+
+def test_other_errors_are_not_samples():
+    waiter, book = make_waiter()
+
+    async def broken(timeout_ms):
+        raise ValueError("element is detached")
+
+    assert asyncio.run(waiter.until("modal_close", broken)) is False
+    assert "modal_close" not in book.samples
+
+
+def test_success_is_recorded():
+    waiter, book = make_waiter()
+    assert asyncio.run(waiter.until("modal_close", ready)) is True
+    assert len(book.samples["modal_close"]) == 1
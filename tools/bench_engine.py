@@ -0,0 +1,159 @@
+"""
+Сквозной бенчмарк движка на локальном стенде hh.ru (tools/fake_hh): BrowserEngine целиком,
+headless, с отдельной папкой данных - настройки и база пользователя не трогаются.
+
+Считает отклики в минуту, вызовы драйвера Playwright (≈ команды CDP) и память.
+
+Запуск:  python -m tools.bench_engine --limit 30
+         python -m tools.bench_engine --limit 30 --no-human     (без человеческих пауз и движений)
+         python -m tools.bench_engine --mode harvest --transport http
+         python -m tools.bench_engine --job activity
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from tools.fake_hh import FakeHHServer
+
+SEARCH_DATA = {
+    "text": "аналитик",
+    "area": "Все регионы",
+    "resume_name": "python",
+    "cover_letter": "Здравствуйте! Меня заинтересовала вакансия {vacancy} в компании {company}. {name}",
+}
+ACTIVITY_DATA = {
+    "use_chat": True,
+    "use_resume": True,
+    "max_employers": 3,
+    "msgs_per_hr": 1,
+    "messages": ["Добрый день! Есть ли новости по моему отклику?"],
+}
+
+
+class DriverCallCounter:
+    """Считает сообщения Python -> драйвер Playwright. Почти каждое - одна команда CDP."""
+
+    def __init__(self):
+        self.calls = 0
+        self.by_method = {}
+
+    def install(self):
+        from playwright._impl._connection import Connection
+        original = Connection.send_message_to_server
+        counter = self
+
+        def counted(conn, obj, method, params, *args, **kwargs):
+            counter.calls += 1
+            counter.by_method[method] = counter.by_method.get(method, 0) + 1
+            return original(conn, obj, method, params, *args, **kwargs)
+
+        Connection.send_message_to_server = counted
+
+
+def memory_report():
+    """Пиковая память процесса бота и текущая память Chromium (если доступен psutil)."""
+    lines = []
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux - КБ, macOS - байты
+        lines.append(f"Python, пик: {peak / (1024 * 1024 if sys.platform == 'darwin' else 1024):.0f} МБ")
+    except ImportError:
+        pass
+    try:
+        import psutil
+        children = psutil.Process().children(recursive=True)
+        rss = sum(p.memory_info().rss for p in children if p.is_running())
+        lines.append(f"Chromium ({len(children)} проц.): {rss / 1024 / 1024:.0f} МБ")
+    except ImportError:
+        lines.append("Chromium: нужен psutil для замера")
+    except Exception:
+        pass
+    return ", ".join(lines)
+
+
+def write_settings(data_dir, args):
+    settings = {
+        "current_profile": "bench",
+        "headless_mode": True,
+        "browser_channel": args.channel,
+        "limit_applications": args.limit,
+        "serp_mode": args.mode,
+        "apply_transport": args.transport,
+        "prefetch_depth": args.prefetch,
+        "prewarm_browsers": False,
+        "trace_sink": "sqlite",
+        "serp_cache_ttl_hours": 0,
+        "quota_burst": 200,  # Стенд меряет скорость движка, а не темп квоты
+    }
+    if args.no_human:
+        settings.update({"human_pacing": False, "use_human_moves": False, "human_mouse": False})
+    with open(os.path.join(data_dir, "settings.json"), "w", encoding="utf-8") as f:
+        json.dump(settings, f, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сквозной бенчмарк движка на стенде")
+    parser.add_argument("--job", choices=["search", "activity"], default="search")
+    parser.add_argument("--vacancies", type=int, default=300)
+    parser.add_argument("--limit", type=int, default=20, help="сколько откликов отправить")
+    parser.add_argument("--mode", choices=["render", "harvest"], default="render")
+    parser.add_argument("--transport", choices=["modal", "http"], default="modal")
+    parser.add_argument("--prefetch", type=int, default=1)
+    parser.add_argument("--channel", default="", help="канал браузера (пусто - Chromium Playwright)")
+    parser.add_argument("--no-human", action="store_true", help="без человеческих пауз, мыши и печати")
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp(prefix="hh_bench_")
+    server = FakeHHServer(vacancies=args.vacancies).start()
+    # До импорта движка: адрес стенда и папка данных читаются при импорте
+    os.environ["HH_BOT_BASE_URL"] = server.base_url
+    os.environ["HH_BOT_DATA_DIR"] = data_dir
+    write_settings(data_dir, args)
+
+    from core.browser_manager import BrowserEngine
+    from core.jobs import run_job
+    from core.runtime import get_runtime
+    from core.tracing import build_report
+
+    counter = DriverCallCounter()
+    counter.install()
+    runtime = get_runtime()
+    engine = BrowserEngine("bench")
+    payload = SEARCH_DATA if args.job == "search" else ACTIVITY_DATA
+
+    started = time.perf_counter()
+    try:
+        status = runtime.submit(run_job(engine, args.job, payload)).result()
+        elapsed = time.perf_counter() - started
+        memory = memory_report()
+    finally:
+        runtime.submit(runtime.shutdown()).result(timeout=30)
+        server.stop()
+
+    state = server.state
+    print(f"Статус: {status}, время: {elapsed:.1f} сек, данные: {data_dir}")
+    if args.job == "search":
+        sent = len(state.applications)
+        per_min = sent / elapsed * 60 if elapsed else 0
+        print(f"Откликов: {sent} ({per_min:.1f} в минуту), по транспортам: "
+              f"{ {t: sum(1 for a in state.applications if a['transport'] == t) for t in ('modal', 'http')} }")
+        if sent:
+            print(f"Вызовов драйвера: {counter.calls} (на отклик: {counter.calls / sent:.0f})")
+        else:
+            print(f"Вызовов драйвера: {counter.calls}")
+    else:
+        print(f"Сообщений: {len(state.messages)}, поднято резюме: {len(state.resume_updates)}, "
+              f"вызовов драйвера: {counter.calls}")
+    top = sorted(counter.by_method.items(), key=lambda kv: -kv[1])[:8]
+    print("Чаще всего: " + ", ".join(f"{m} {n}" for m, n in top))
+    print(f"Память: {memory}")
+    print()
+    print(build_report(engine.db.get_spans("bench", 1)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Бенчмарк сбора выдачи: рендер в Chromium против HTTP-харвестера.
+Работает на локальном стенде (tools/fake_hh), сеть не нужна.
+
+Запуск:  python -m tools.bench_harvester --vacancies 500 --per-page 100
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from tools.fake_hh import FakeHHServer
+
+
+async def bench(base_url, per_page, rounds):
+    # Адрес стенда должен попасть в core.config до импорта модулей движка
+    os.environ["HH_BOT_BASE_URL"] = base_url
+    from playwright.async_api import async_playwright
+    from core.serp_extractor import extract_cards
+    from core.serp_harvester import SerpHarvester
+    from core.search_query import build_search_url
+    from core.utils import get_resource_path
+    import json
+
+    with open(get_resource_path("resources/locators.json"), "r") as f:
+        locators = json.load(f)
+    params = [("text", "аналитик"), ("items_on_page", str(per_page))]
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        context = await browser.new_context()
+        page = await context.new_page()
+
+        results = {}
+
+        # 1. Рендер: goto + извлечение карточек + переход по pager_next
+        started = time.perf_counter()
+        cards_total = pages_total = 0
+        for _ in range(rounds):
+            await page.goto(build_search_url(params))
+            while True:
+                cards = await extract_cards(page, locators)
+                cards_total += len(cards)
+                pages_total += 1
+                next_btn = page.locator(locators["search_page"]["pager_next"]).first
+                if not await next_btn.count(): break
+                # Ждем именно новую страницу: текущая уже в domcontentloaded, и старые карточки посчитались бы снова
+                async with page.expect_navigation(wait_until="domcontentloaded"):
+                    await next_btn.click()
+        results["render"] = (time.perf_counter() - started, pages_total, cards_total)
+
+        # 2. Харвестер: HTTP через context.request + парсер
+        started = time.perf_counter()
+        cards_total = 0
+        harvester = SerpHarvester(context.request, locators, log=lambda m: None)
+        for _ in range(rounds):
+            async for _card in harvester.harvest(params, max_pages=1000):
+                cards_total += 1
+        results["harvest"] = (time.perf_counter() - started, harvester.pages_fetched, cards_total)
+
+        await browser.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк сбора выдачи")
+    parser.add_argument("--vacancies", type=int, default=500)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    with FakeHHServer(vacancies=args.vacancies) as server:
+        results = asyncio.run(bench(server.base_url, args.per_page, args.rounds))
+
+    print(f"{'режим':<10}{'сек':>10}{'страниц':>10}{'карточек':>10}{'стр/сек':>10}{'карт/сек':>10}")
+    for mode, (seconds, pages_count, cards) in results.items():
+        print(f"{mode:<10}{seconds:>10.2f}{pages_count:>10}{cards:>10}"
+              f"{pages_count / seconds:>10.1f}{cards / seconds:>10.0f}")
+    if "render" in results and "harvest" in results:
+        print(f"Ускорение: x{results['render'][0] / results['harvest'][0]:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Микробенчмарк движения мыши: прямая page.mouse.move(steps=5) против кривых через CDP.
+Считает вызовы в Playwright, события мыши и время на клик. Сеть не нужна.
+
+Запуск:  python -m tools.bench_mouse --clicks 50
+         python -m tools.bench_mouse --clicks 50 --no-delay   (без пауз траектории - чистые накладные расходы)
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from core.cancellation import CancelToken
+from core.mouse_motion import MouseMotion, build_path, _templates
+
+PAGE_HTML = """<html><body style="margin:0">
+<div id="grid" style="display:grid;grid-template-columns:repeat(6,1fr);gap:60px;padding:40px">
+""" + "\n".join(f'<button id="b{i}" style="height:40px" onclick="window.clicks=(window.clicks||0)+1">{i}</button>'
+                for i in range(36)) + "</div></body></html>"
+
+
+class BenchEngine:
+    """Минимум движка, который нужен MouseMotion: проверка остановки и сон."""
+
+    def __init__(self, delay=True):
+        self.token = CancelToken()
+        self.delay = delay
+        self.slept = 0.0
+
+    def check_running(self):
+        self.token.check()
+
+    async def smart_sleep(self, seconds):
+        self.slept += seconds
+        if self.delay: await self.token.sleep(seconds)
+
+
+def bench_paths(count):
+    """Сколько стоит построить траекторию: первая (заполнение кэша) и последующие."""
+    _templates.clear()
+    started = time.perf_counter()
+    build_path((0, 0), (600, 300))
+    cold = time.perf_counter() - started
+    started = time.perf_counter()
+    for _ in range(count):
+        build_path((random.uniform(0, 1200), random.uniform(0, 800)),
+                   (random.uniform(0, 1200), random.uniform(0, 800)))
+    return cold, (time.perf_counter() - started) / count
+
+
+async def bench_browser(clicks, delay):
+    from playwright.async_api import async_playwright
+
+    results = {}
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        page = await browser.new_page(viewport={"width": 1280, "height": 800})
+        await page.set_content(PAGE_HTML)
+        targets = [page.locator(f"#b{random.randrange(36)}") for _ in range(clicks)]
+
+        # 1. Как было: прямая линия в 5 шагов + клик
+        started = time.perf_counter()
+        for loc in targets:
+            box = await loc.bounding_box()
+            await page.mouse.move(box["x"] + box["width"] / 2, box["y"] + box["height"] / 2, steps=5)
+            await loc.click()
+        results["line"] = (time.perf_counter() - started, clicks * 3, clicks * 5, 0.0)
+
+        # 2. Кривая через CDP пачками + клик в ту же точку
+        engine = BenchEngine(delay)
+        motion = MouseMotion(engine)
+        started = time.perf_counter()
+        for loc in targets:
+            box = await loc.bounding_box()
+            x, y = box["x"] + box["width"] / 2, box["y"] + box["height"] / 2
+            await motion.move_to(page, x, y)
+            await loc.click(position={"x": x - box["x"], "y": y - box["y"]})
+        calls = clicks * 2 + motion.batches + 1  # bounding_box + click + пачки + создание CDP-сессии
+        results["cdp"] = (time.perf_counter() - started, calls, motion.events, engine.slept)
+
+        assert await page.evaluate("window.clicks") == clicks * 2
+        await browser.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк движения мыши")
+    parser.add_argument("--clicks", type=int, default=50)
+    parser.add_argument("--no-delay", action="store_true", help="не ждать длительность траектории")
+    parser.add_argument("--paths-only", action="store_true", help="только построение траекторий, без браузера")
+    args = parser.parse_args()
+
+    cold, warm = bench_paths(1000)
+    print(f"Траектория: первая {cold * 1000:.3f} мс, из кэша {warm * 1000:.3f} мс")
+    if args.paths_only: return
+
+    results = asyncio.run(bench_browser(args.clicks, not args.no_delay))
+    print(f"{'режим':<8}{'мс/клик':>10}{'вызовов/клик':>14}{'событий/клик':>14}{'пауз мс/клик':>14}")
+    for mode, (seconds, calls, events, slept) in results.items():
+        n = args.clicks
+        print(f"{mode:<8}{seconds / n * 1000:>10.1f}{calls / n:>14.1f}{events / n:>14.1f}{slept / n * 1000:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Бенчмарк холодного старта окна: от запуска python main.py до первой отрисовки.
+Окно поднимается offscreen и закрывается само (core/startup.py), данные - во временной папке.
+Медиана выше бюджета -> код выхода 1 (для CI и проверки перед релизом).
+
+Запуск:  python -m tools.bench_startup
+         python -m tools.bench_startup --runs 10 --budget 2.5
+         python -m tools.bench_startup --importtime      (самые дорогие импорты)
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_once(data_dir, report_path, importtime=False):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", HH_BOT_DATA_DIR=data_dir,
+               HH_BOT_STARTUP_REPORT=report_path, HH_BOT_EXIT_AFTER_PAINT="1")
+    cmd = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["main.py"]
+    proc = subprocess.run(cmd, cwd=ROOT, env=env, capture_output=True, text=True, timeout=120)
+    if proc.returncode != 0 or not os.path.exists(report_path):
+        raise RuntimeError(f"Старт не удался (код {proc.returncode}):\n{proc.stderr[-2000:]}")
+    with open(report_path, "r", encoding="utf-8") as f:
+        report = json.load(f)
+    os.remove(report_path)
+    return report, proc.stderr
+
+
+def top_imports(stderr, count=15):
+    """Разбор вывода -X importtime: (накопленные мкс, модуль), только модули верхнего уровня."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line: continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Вложенные импорты идут с отступом - считаем только то, что импортировано напрямую
+        if name.startswith("  "): continue
+        rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Время старта интерфейса")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=3.0, help="бюджет на медиану до первой отрисовки, сек")
+    parser.add_argument("--importtime", action="store_true", help="показать самые дорогие импорты")
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp(prefix="hh_startup_")
+    report_path = os.path.join(data_dir, "startup.json")
+    reports = []
+    for i in range(args.runs):
+        report, _ = run_once(data_dir, report_path)
+        reports.append(report)
+        print(f"#{i + 1}: {report['total']:.2f} сек")
+
+    stages = reports[0]["stages"].keys()
+    print()
+    print(f"{'этап':<16}{'медиана, с':>12}{'max, с':>10}")
+    for stage in stages:
+        values = [r["stages"].get(stage, 0) for r in reports]
+        print(f"{stage:<16}{statistics.median(values):>12.3f}{max(values):>10.3f}")
+    median = statistics.median(r["total"] for r in reports)
+    print(f"{'итого':<16}{median:>12.3f}{max(r['total'] for r in reports):>10.3f}")
+
+    if args.importtime:
+        _, stderr = run_once(data_dir, report_path, importtime=True)
+        print()
+        print("Самые дорогие импорты (накопленно):")
+        for cumulative, name in top_imports(stderr):
+            print(f"  {cumulative / 1000:>8.1f} мс  {name}")
+
+    if median > args.budget:
+        print(f"\nБюджет превышен: {median:.2f} > {args.budget:.2f} сек")
+        sys.exit(1)
+    print(f"\nВ бюджете: {median:.2f} <= {args.budget:.2f} сек")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Микробенчмарк печати сопроводительного письма: сколько сообщений CDP уходит на текст
+посимвольно (typing_chunk = 1) и кусками (по умолчанию 10). Без браузера считается только план.
+
+Запуск:  python -m tools.bench_typing --chars 600
+         python -m tools.bench_typing --chars 600 --browser      (печать в textarea headless Chromium)
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from core.cancellation import CancelToken
+from core.keystrokes import KeystrokePlan
+
+WORDS = ("здравствуйте меня заинтересовала вакансия опыт работы python sql аналитика готов "
+         "обсудить детали спасибо за внимание").split()
+
+
+def make_text(chars, rng):
+    text = ""
+    while len(text) < chars:
+        text += rng.choice(WORDS) + ("\n" if rng.random() < 0.05 else " ")
+    return text[:chars]
+
+
+class BenchEngine:
+    """Минимум движка для KeystrokePlan.replay: проверка остановки и сон."""
+
+    def __init__(self):
+        self.token = CancelToken()
+
+    def check_running(self):
+        self.token.check()
+
+    async def smart_sleep(self, seconds):
+        pass
+
+
+class CountingSession:
+    """Обертка над CDP-сессией: считает реально отправленные сообщения."""
+
+    def __init__(self, session):
+        self.session = session
+        self.sends = 0
+
+    async def send(self, method, params=None):
+        self.sends += 1
+        return await self.session.send(method, params)
+
+
+async def bench_browser(text, chunks):
+    from playwright.async_api import async_playwright
+
+    results = {}
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        page = await browser.new_page()
+        await page.set_content("<textarea id='t' style='width:600px;height:400px'></textarea>")
+        session = CountingSession(await page.context.new_cdp_session(page))
+        for chunk in chunks:
+            await page.fill("#t", "")
+            await page.click("#t")
+            plan = KeystrokePlan.compile(text, 0.05, 0.1, chunk)
+            session.sends = 0
+            started = time.perf_counter()
+            await plan.replay(session, BenchEngine())
+            value = await page.input_value("#t")
+            results[chunk] = (session.sends, time.perf_counter() - started, value == text)
+        await browser.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк печати через CDP")
+    parser.add_argument("--chars", type=int, default=600)
+    parser.add_argument("--chunk", type=int, default=10)
+    parser.add_argument("--browser", action="store_true", help="печатать в настоящий textarea")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    text = make_text(args.chars, rng)
+    chunks = (1, args.chunk)
+    print(f"{'кусок':<8}{'шагов':>8}{'сообщений CDP':>16}{'пауз, с':>10}")
+    plans = {chunk: KeystrokePlan.compile(text, 0.05, 0.1, chunk, rng=random.Random(2)) for chunk in chunks}
+    for chunk, plan in plans.items():
+        print(f"{chunk:<8}{len(plan.steps):>8}{plan.send_count:>16}{plan.total_seconds:>10.1f}")
+    print(f"Сообщений меньше в {plans[1].send_count / plans[args.chunk].send_count:.1f} раза")
+
+    if args.browser:
+        print()
+        for chunk, (sends, seconds, ok) in asyncio.run(bench_browser(text, chunks)).items():
+            print(f"кусок {chunk}: отправлено {sends}, {seconds * 1000:.0f} мс без пауз, текст {'совпал' if ok else 'НЕ совпал'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+from tools.fake_hh.server import FakeHHServer
@@ -0,0 +1,254 @@
+import json
+from html import escape
+from urllib.parse import urlencode
+
+COMPANIES = ["Альфа", "Бета Системс", "Гамма Банк", "Дельта Ритейл", "Эпсилон IT", "Зета Логистик"]
+TITLES = ["Аналитик данных", "Python разработчик", "Data Engineer", "BI аналитик", "Продуктовый аналитик"]
+
+
+class Vacancy:
+    """Вакансия стенда. Вид определяет, что будет после клика «Откликнуться»."""
+
+    def __init__(self, n):
+        self.id = str(100000 + n)
+        self.title = f"{TITLES[n % len(TITLES)]} #{n}"
+        self.company = COMPANIES[n % len(COMPANIES)]
+        self.salary = f"от {100 + (n % 20) * 10} 000 ₽" if n % 3 else ""
+        self.responded = n % 10 == 7
+        self.has_apply = n % 13 != 5
+        # modal - обычная модалка, test - нужен тест/анкета (прямой отклик невозможен),
+        # chat - после первого клика всплывает чат, error - hh показывает ошибку
+        if n % 11 == 3:
+            self.kind = "test"
+        elif n % 17 == 9:
+            self.kind = "chat"
+        elif n % 19 == 4:
+            self.kind = "error"
+        else:
+            self.kind = "modal"
+
+
+def make_vacancies(total):
+    return [Vacancy(n) for n in range(total)]
+
+
+RESUMES = [("a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9", "Аналитик данных"),
+           ("f0e1d2c3b4a5f6e7d8c9b0a1f2e3d4c5b6a7f8", "Python разработчик")]
+
+# Поведение кнопки «Откликнуться»: модалка с выбором резюме и письмом, тест, чат, ошибка
+APPLY_JS = """
+<script>
+const RESUMES = __RESUMES__;
+let resumeIndex = 0;
+const cookie = (name) => (document.cookie.split('; ').find(r => r.startsWith(name + '=')) || '').split('=')[1] || '';
+
+function toast(text) {
+  const t = document.createElement('div');
+  t.setAttribute('data-qa', 'bloko-notification');
+  t.textContent = text;
+  document.body.appendChild(t);
+  setTimeout(() => t.remove(), 3000);
+}
+
+function showChat() {
+  if (document.getElementById('chatik')) return;
+  const c = document.createElement('div');
+  c.id = 'chatik';
+  c.style.cssText = 'position:fixed;right:10px;bottom:10px;width:300px;height:200px;background:#eee';
+  c.innerHTML = '<button data-qa="chatik-close-chatik">×</button> Новое сообщение';
+  c.querySelector('button').onclick = () => c.remove();
+  document.body.appendChild(c);
+}
+
+function markResponded(btn) {
+  const done = document.createElement('div');
+  done.className = 'vacancy-serp-item__response_already-responded';
+  done.textContent = 'Вы откликнулись';
+  btn.replaceWith(done);
+}
+
+function openModal(btn) {
+  const d = document.createElement('div');
+  d.setAttribute('role', 'dialog');
+  d.style.cssText = 'position:fixed;top:20%;left:30%;width:40%;background:#fff;border:1px solid #000;padding:10px';
+  d.innerHTML = `
+    <div data-qa="resume-title">${RESUMES[resumeIndex][1]}</div>
+    <div class="options" hidden>${RESUMES.map((r, i) =>
+      `<div data-magritte-select-option data-i="${i}">${r[1]}</div>`).join('')}</div>
+    <button data-qa="add-cover-letter">Добавить сопроводительное</button>
+    <textarea hidden></textarea>
+    <button data-qa="vacancy-response-submit-popup">Откликнуться</button>`;
+  const header = d.querySelector('[data-qa="resume-title"]');
+  const options = d.querySelector('.options');
+  const area = d.querySelector('textarea');
+  header.onclick = () => { options.hidden = !options.hidden; };
+  options.onclick = (e) => {
+    const opt = e.target.closest('[data-magritte-select-option]');
+    if (!opt) return;
+    resumeIndex = +opt.dataset.i;
+    header.textContent = RESUMES[resumeIndex][1];
+    options.hidden = true;
+  };
+  d.querySelector('[data-qa="add-cover-letter"]').onclick = (e) => { area.hidden = false; e.target.remove(); };
+  d.querySelector('[data-qa="vacancy-response-submit-popup"]').onclick = async () => {
+    const form = new URLSearchParams({vacancy_id: btn.dataset.vacancyId, resume_hash: RESUMES[resumeIndex][0],
+                                      letter: area.value, _xsrf: cookie('_xsrf'), transport: 'modal'});
+    const r = await fetch('/applicant/vacancy_response/popup', {method: 'POST', body: form,
+                                                               headers: {'X-Xsrftoken': cookie('_xsrf')}});
+    if (r.ok) { d.remove(); markResponded(btn); } else { toast('Ошибка отклика'); }
+  };
+  document.body.appendChild(d);
+}
+
+document.addEventListener('click', (e) => {
+  const btn = e.target.closest('[data-qa="vacancy-serp__vacancy_response"], [data-qa="vacancy-response-link-top"]');
+  if (!btn) return;
+  e.preventDefault();
+  const kind = btn.dataset.kind;
+  if (kind === 'test') { location.href = '/applicant/vacancy_response?vacancyId=' + btn.dataset.vacancyId; return; }
+  if (kind === 'error') { toast('Не удалось откликнуться'); return; }
+  if (kind === 'chat' && !btn.dataset.chatShown) { btn.dataset.chatShown = '1'; setTimeout(showChat, 100); return; }
+  setTimeout(() => openModal(btn), 150);
+});
+</script>
+""".replace("__RESUMES__", json.dumps(RESUMES, ensure_ascii=False))
+
+
+def page_layout(title, body, script=""):
+    return f"""<!DOCTYPE html>
+<html lang="ru"><head><meta charset="utf-8"><title>{escape(title)}</title>
+<link rel="stylesheet" href="/static/app.css">
+<script src="/static/analytics.js" async></script>
+</head><body>
+<header><img src="/static/logo.png" alt="hh"></header>
+<main>{body}</main>
+{script}
+</body></html>"""
+
+
+def serp_card(v):
+    salary = f'<span data-qa="vacancy-serp__vacancy-compensation">{escape(v.salary)}</span>' if v.salary else ""
+    if v.responded:
+        action = '<div class="vacancy-serp-item__response_already-responded">Вы откликнулись</div>'
+    elif v.has_apply:
+        action = (f'<a data-qa="vacancy-serp__vacancy_response" data-vacancy-id="{v.id}" data-kind="{v.kind}" '
+                  f'href="#">Откликнуться</a>')
+    else:
+        action = ""
+    return f"""<div data-qa="vacancy-serp__vacancy" class="serp-item">
+  <h2><a data-qa="serp-item__title" href="/vacancy/{v.id}?query=fake"><span data-qa="serp-item__title-text">{escape(v.title)}</span></a></h2>
+  {salary}
+  <div><a data-qa="vacancy-serp__vacancy-employer" href="/employer/{v.id}">{escape(v.company)}</a></div>
+  <img src="/static/company_{v.id}.png" alt="">
+  <div class="serp-item__controls">{action}</div>
+</div>"""
+
+
+def serp_page(vacancies, page, per_page, query):
+    chunk = vacancies[page * per_page:(page + 1) * per_page]
+    cards = "\n".join(serp_card(v) for v in chunk)
+    pager = ""
+    if (page + 1) * per_page < len(vacancies):
+        next_query = dict(query)
+        next_query["page"] = str(page + 1)
+        pager = f'<a data-qa="pager-next" href="/search/vacancy?{escape(urlencode(next_query))}">дальше</a>'
+    return page_layout("Поиск вакансий", f'<div id="serp">{cards}</div><nav>{pager}</nav>', APPLY_JS)
+
+
+RESUME_UPDATE_JS = """
+<script>
+document.addEventListener('click', (e) => {
+  const btn = e.target.closest('[data-qa="resume-update-button"]');
+  if (!btn) return;
+  fetch('/applicant/resumes/touch', {method: 'POST', body: new URLSearchParams({resume: btn.dataset.resume})});
+  const note = document.createElement('span');
+  note.textContent = 'Поднимется автоматически через 4 часа';
+  btn.replaceWith(note);
+  const m = document.createElement('div');
+  m.innerHTML = '<button data-qa="bot-update-resume-modal__close-button">×</button> Резюме поднято';
+  m.querySelector('button').onclick = () => m.remove();
+  setTimeout(() => document.body.appendChild(m), 200);
+});
+</script>
+"""
+
+
+def resumes_page():
+    items = "\n".join(
+        f'<div data-qa="resume"><a data-qa="resume-title-link" href="/resume/{h}"><span data-qa="resume-title">{escape(t)}</span></a>'
+        f'<button data-qa="resume-update-button" data-resume="{h}">Поднять в поиске</button></div>'
+        for h, t in RESUMES)
+    return page_layout("Мои резюме", items, RESUME_UPDATE_JS)
+
+
+def test_page(vacancy_id):
+    return page_layout("Отклик на вакансию", f"""<h1>Ответьте на вопросы работодателя</h1>
+<form data-qa="employer-test" action="#"><textarea name="answer"></textarea></form>
+<a href="/vacancy/{escape(vacancy_id)}">Назад к вакансии</a>""")
+
+
+CHAT_ACTIVATOR_JS = """
+<script>
+document.querySelector('[data-qa="chatikActivator-button"]').onclick = () => {
+  if (document.querySelector('iframe.chatik-integration-iframe')) return;
+  const f = document.createElement('iframe');
+  f.className = 'chatik-integration-iframe';
+  f.src = '/chatik';
+  f.style.cssText = 'width:400px;height:500px';
+  document.body.appendChild(f);
+};
+</script>
+"""
+
+
+def home_page():
+    return page_layout("hh", '<h1>Главная</h1><button data-qa="chatikActivator-button">Чаты</button>',
+                       CHAT_ACTIVATOR_JS)
+
+
+def chat_page(chats):
+    items = "\n".join(
+        f'<a data-qa="chatik-open-chat-{i}" href="#" data-employer="{escape(name)}">{escape(name)}</a>'
+        for i, name in enumerate(chats))
+    return f"""<!DOCTYPE html><html lang="ru"><head><meta charset="utf-8"></head><body>
+<div id="list">{items}</div>
+<div id="chat" hidden>
+  <div class="title--jaEO2q2if2IOwiyO"></div>
+  <div id="messages"></div>
+  <textarea data-qa="chatik-new-message-text"></textarea>
+  <button data-qa="chatik-do-send-message">Отправить</button>
+  <button data-qa="chatik-back-to-chats-button">Назад</button>
+</div>
+<script>
+const list = document.getElementById('list'), chat = document.getElementById('chat');
+const area = chat.querySelector('textarea');
+let employer = '';
+list.onclick = (e) => {{
+  const a = e.target.closest('a'); if (!a) return;
+  e.preventDefault();
+  employer = a.dataset.employer;
+  chat.querySelector('.title--jaEO2q2if2IOwiyO').textContent = employer;
+  list.hidden = true; chat.hidden = false;
+}};
+chat.querySelector('[data-qa="chatik-do-send-message"]').onclick = () => {{
+  fetch('/chatik/message', {{method: 'POST', body: new URLSearchParams({{employer, text: area.value}})}});
+  const m = document.createElement('div'); m.textContent = area.value;
+  document.getElementById('messages').appendChild(m);
+  area.value = '';
+}};
+chat.querySelector('[data-qa="chatik-back-to-chats-button"]').onclick = () => {{
+  chat.hidden = true; list.hidden = false;
+}};
+</script></body></html>"""
+
+
+def vacancy_page(v):
+    button = ""
+    if v.has_apply and not v.responded:
+        button = (f'<a data-qa="vacancy-response-link-top" data-vacancy-id="{v.id}" data-kind="{v.kind}" '
+                  f'href="#">Откликнуться</a>')
+    elif v.responded:
+        button = '<a data-qa="vacancy-response-link-view-topic" href="#">Вы откликнулись</a>'
+    return page_layout(v.title, f"""<h1 data-qa="vacancy-title">{escape(v.title)}</h1>
+<a data-qa="vacancy-company-name" href="/employer/{v.id}">{escape(v.company)}</a>
+{button}""", APPLY_JS)
@@ -0,0 +1,197 @@
+"""
+Локальный стенд hh.ru для тестов и бенчмарков.
+
+Запуск:  python -m tools.fake_hh.server --port 8765 --vacancies 300
+Затем:   HH_BOT_BASE_URL=http://127.0.0.1:8765 python main.py
+"""
+import argparse
+import json
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qsl
+
+from tools.fake_hh import pages
+
+XSRF_TOKEN = "fake-xsrf-token"
+
+
+class FakeHHHandler(BaseHTTPRequestHandler):
+    server_version = "FakeHH/1.0"
+
+    def log_message(self, format, *args):
+        # Без спама в консоль на каждый запрос
+        pass
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def send_html(self, html, status=200):
+        body = html.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", f"_xsrf={XSRF_TOKEN}; Path=/")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, payload, status=200):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_static(self, path):
+        body = b"/* static */" if path.endswith((".css", ".js")) else b"\x89PNG" + b"\x00" * 2048
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = dict(parse_qsl(url.query))
+        self.state.hit(url.path)
+
+        if url.path == "/search/vacancy":
+            page = int(query.get("page", 0))
+            per_page = int(query.get("items_on_page", 20))
+            return self.send_html(pages.serp_page(self.state.vacancies, page, per_page, query))
+
+        if url.path.startswith("/vacancy/"):
+            v = self.state.find(url.path.rsplit("/", 1)[-1])
+            if not v: return self.send_html(pages.page_layout("404", "Нет такой вакансии"), 404)
+            return self.send_html(pages.vacancy_page(v))
+
+        if url.path.startswith("/static/"):
+            return self.send_static(url.path)
+
+        if url.path == "/applicant/resumes":
+            return self.send_html(pages.resumes_page())
+
+        if url.path == "/applicant/vacancy_response":
+            # Страница теста/анкеты работодателя
+            return self.send_html(pages.test_page(query.get("vacancyId", "")))
+
+        if url.path == "/chatik":
+            return self.send_html(pages.chat_page(self.state.chats))
+
+        if url.path in ("/", ""):
+            return self.send_html(pages.home_page())
+
+        self.send_html(pages.page_layout("404", "Не найдено"), 404)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        form = dict(parse_qsl(self.rfile.read(length).decode("utf-8")))
+        self.state.hit(url.path)
+
+        if url.path == "/applicant/vacancy_response/popup":
+            # Заглушка эндпоинта прямого отклика
+            if form.get("_xsrf") != XSRF_TOKEN or self.headers.get("X-Xsrftoken") != XSRF_TOKEN:
+                return self.send_json({"error": "unauthorized"}, 403)
+            if form.get("resume_hash") not in {h for h, _ in pages.RESUMES}:
+                return self.send_json({"error": "no-resume"}, 400)
+            v = self.state.find(form.get("vacancy_id", ""))
+            if not v: return self.send_json({"error": "vacancy-not-found"}, 404)
+            if v.kind == "test": return self.send_json({"error": "test-required"}, 400)
+            if v.kind == "error": return self.send_json({"error": "captcha-required"}, 400)
+            if v.responded: return self.send_json({"error": "already-applied"}, 400)
+            self.state.apply(v, form.get("transport", "http"), form.get("letter", ""))
+            return self.send_json({"success": "true", "responseStatus": "sent"})
+
+        if url.path == "/applicant/resumes/touch":
+            self.state.record("resume_updates", form.get("resume"))
+            return self.send_json({"success": "true"})
+
+        if url.path == "/chatik/message":
+            self.state.record("messages", {"employer": form.get("employer"), "text": form.get("text")})
+            return self.send_json({"success": "true"})
+
+        self.send_json({"error": "not-found"}, 404)
+
+
+class FakeHHState:
+    def __init__(self, total):
+        self.vacancies = pages.make_vacancies(total)
+        self._by_id = {v.id: v for v in self.vacancies}
+        self.hits = {}
+        self.applications = []
+        self.resume_updates = []
+        self.messages = []
+        self.chats = [f"{c} (HR)" for c in pages.COMPANIES]
+        self._lock = threading.Lock()
+
+    def find(self, vacancy_id):
+        return self._by_id.get(vacancy_id)
+
+    def hit(self, path):
+        with self._lock:
+            self.hits[path] = self.hits.get(path, 0) + 1
+
+    def record(self, kind, item):
+        with self._lock:
+            getattr(self, kind).append(item)
+
+    def apply(self, vacancy, transport, letter):
+        with self._lock:
+            vacancy.responded = True
+            self.applications.append({"id": vacancy.id, "transport": transport, "letter": letter})
+
+
+class FakeHHServer:
+    """Стенд в фоновом потоке: with FakeHHServer() as srv: srv.base_url"""
+
+    def __init__(self, host="127.0.0.1", port=0, vacancies=250):
+        self.httpd = ThreadingHTTPServer((host, port), FakeHHHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = FakeHHState(vacancies)
+        self.thread = None
+
+    @property
+    def state(self):
+        return self.httpd.state
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="FakeHH", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Локальный стенд hh.ru")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--vacancies", type=int, default=250)
+    args = parser.parse_args()
+
+    server = FakeHHServer(args.host, args.port, args.vacancies)
+    print(f"Стенд запущен: {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
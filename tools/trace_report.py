@@ -0,0 +1,30 @@
+"""
+Отчет по трассировке запусков: время по шагам (p50/p95/max) и откликов в час.
+
+Запуск:  python -m tools.trace_report                    (последние 10 запусков из базы)
+         python -m tools.trace_report --profile Иван --runs 3
+         python -m tools.trace_report --jsonl user_data/traces.jsonl
+"""
+import argparse
+
+from core.tracing import build_report, load_jsonl
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Отчет по трассировке шагов движка")
+    parser.add_argument("--profile", default=None)
+    parser.add_argument("--runs", type=int, default=10, help="сколько последних запусков брать из базы")
+    parser.add_argument("--jsonl", default=None, help="читать спаны из JSONL вместо базы")
+    args = parser.parse_args()
+
+    if args.jsonl:
+        spans = load_jsonl(args.jsonl)
+        if args.profile: spans = [s for s in spans if s["profile"] == args.profile]
+    else:
+        from database.db_manager import DBManager
+        spans = DBManager().get_spans(args.profile, args.runs)
+    print(build_report(spans))
+
+
+if __name__ == "__main__":
+    main()